@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+__all__ = [
+    "bench_backends",
+    "bench_binding",
+    "bench_import",
+    "bench_raw",
+    "bench_gil",
+    "bench_load",
+    "bench_memory",
+    "bench_values",
+    "bench_call",
+    "bench_host",
+    "bench_cache",
+    "bench_pool",
+    "bench_snapshot",
+    "bench_executor",
+    "bench_process",
+    "bench_aio",
+]
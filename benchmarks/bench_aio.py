@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Overhead of `await func.call_async()` for a short call, against calling it
+inline in the event loop, one call at a time and many at once.
+
+    $ python -m benchmarks.bench_aio
+"""
+
+import asyncio
+import time
+
+from wamr import Engine, Instance, Module, Store
+from wamr.aio import AsyncRunner
+
+from .bench_executor import SPIN_BINARY
+
+CALLS = 10_000
+CONCURRENCY = 64
+
+
+async def cost(make_call, concurrency=1):
+    begin = time.perf_counter()
+    for _ in range(CALLS // concurrency):
+        await asyncio.gather(*(make_call() for _ in range(concurrency)))
+    return (time.perf_counter() - begin) / CALLS * 1e9
+
+
+async def main():
+    engine = Engine()
+    runner = AsyncRunner()
+    module = await Module.compile_async(engine, SPIN_BINARY, runner=runner)
+    store = Store(engine)
+    spin = (await Instance.new_async(store, module, runner=runner)).export(
+        store, "spin"
+    )
+
+    async def inline():
+        return spin(store, 10)
+
+    rows = [
+        ("inline", await cost(inline)),
+        ("call_async", await cost(lambda: spin.call_async(store, 10, runner=runner))),
+        (
+            f"call_async x{CONCURRENCY}",
+            await cost(lambda: spin.call_async(store, 10, runner=runner), CONCURRENCY),
+        ),
+    ]
+    runner.shutdown()
+
+    print("\nspin(10), awaited")
+    for name, value in rows:
+        print(f"  {name:<14} {value:10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
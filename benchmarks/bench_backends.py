@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+ctypes (wamr/binding.py) vs. cffi (wamr/binding_cffi.py) over the scenarios
+of tests/test_advanced.py. Both sides run the same steps, only the way of
+marshalling differs.
+
+    $ python -m benchmarks.bench_backends
+"""
+
+import ctypes as c
+
+import wamr.ffi as ffi
+from wamr import binding
+
+from .common import MODULE_BINARY, measure, report
+
+
+@binding.wasm_func_callback_t
+def ctypes_callback(args, results):
+    args = args.contents
+    results = results.contents
+    results.data[0].kind = ffi.WASM_F64
+    results.data[0].of.f64 = args.data[0].of.f32 * 2.0
+    results.num_elems = 1
+
+
+class CtypesScenarios:
+    def __init__(self):
+        self.engine = binding.wasm_engine_new()
+        self.store = binding.wasm_store_new(self.engine)
+
+    def setup(self):
+        binary = ffi.load_module_file(MODULE_BINARY)
+        self.module = binding.wasm_module_new(self.store, binary)
+        binding.wasm_byte_vec_delete(binary)
+
+        func_type = ffi.wasm_functype_new_1_1(
+            binding.wasm_valtype_new(ffi.WASM_F32),
+            binding.wasm_valtype_new(ffi.WASM_F64),
+        )
+        func = binding.wasm_func_new(self.store, func_type, ctypes_callback)
+        binding.wasm_functype_delete(func_type)
+
+        glbl_type = binding.wasm_globaltype_new(
+            binding.wasm_valtype_new(ffi.WASM_I32), True
+        )
+        glbl = binding.wasm_global_new(self.store, glbl_type, ffi.wasm_i32_val(1024))
+        binding.wasm_globaltype_delete(glbl_type)
+
+        self.imports = binding.wasm_extern_vec_t()
+        data = ffi.list_to_carray(
+            c.POINTER(binding.wasm_extern_t),
+            binding.wasm_func_as_extern(func),
+            binding.wasm_global_as_extern(glbl),
+        )
+        binding.wasm_extern_vec_new(self.imports, 2, data)
+
+        self.instance = binding.wasm_instance_new(
+            self.store, self.module, self.imports, None
+        )
+        self.exports = binding.wasm_extern_vec_t()
+        binding.wasm_instance_exports(self.instance, self.exports)
+
+    def teardown(self):
+        binding.wasm_extern_vec_delete(self.imports)
+        binding.wasm_extern_vec_delete(self.exports)
+        binding.wasm_instance_delete(self.instance)
+        binding.wasm_module_delete(self.module)
+
+    def func_call_wasm(self):
+        func = binding.wasm_extern_as_func(self.exports.data[0])
+        params = binding.wasm_val_vec_t()
+        data = ffi.list_to_carray(
+            ffi.wasm_val_t, ffi.wasm_i32_val(1024), ffi.wasm_i64_val(1024 * 1024)
+        )
+        binding.wasm_val_vec_new(params, 2, data)
+        results = binding.wasm_val_vec_t()
+        binding.wasm_val_vec_new_empty(results)
+        binding.wasm_func_call(func, params, results)
+        binding.wasm_val_vec_delete(params)
+        binding.wasm_val_vec_delete(results)
+
+    def func_call_native(self):
+        func = binding.wasm_extern_as_func(self.imports.data[0])
+        params = binding.wasm_val_vec_t()
+        data = ffi.list_to_carray(ffi.wasm_val_t, ffi.wasm_f32_val(3.14))
+        binding.wasm_val_vec_new(params, 1, data)
+        results = binding.wasm_val_vec_t()
+        binding.wasm_val_vec_new_uninitialized(results, 1)
+        binding.wasm_func_call(func, params, results)
+        binding.wasm_val_vec_delete(params)
+        binding.wasm_val_vec_delete(results)
+
+    def global_get(self):
+        glb = binding.wasm_extern_as_global(self.exports.data[1])
+        val = ffi.wasm_val_t()
+        binding.wasm_global_get(glb, val)
+        return val.of.f32
+
+    def global_set(self):
+        glb = binding.wasm_extern_as_global(self.exports.data[1])
+        binding.wasm_global_set(glb, ffi.wasm_f32_val(2.71))
+
+    def table_get(self):
+        tbl = binding.wasm_extern_as_table(self.exports.data[3])
+        return binding.wasm_table_get(tbl, 0)
+
+
+class CffiScenarios:
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        from wamr import binding_cffi
+
+        self.lib = binding_cffi
+        self.ffi = binding_cffi.ffi
+        self.engine = self.lib.wasm_engine_new()
+        self.store = self.lib.wasm_store_new(self.engine)
+
+        @self.ffi.callback("wasm_func_callback_t")
+        def cffi_callback(args, results):
+            results.data[0].kind = ffi.WASM_F64
+            results.data[0].of.f64 = args.data[0].of.f32 * 2.0
+            results.num_elems = 1
+            return self.ffi.NULL
+
+        # keep it alive
+        self.callback = cffi_callback
+
+    def valtype_vec(self, *kinds):
+        vec = self.ffi.new("wasm_valtype_vec_t *")
+        data = self.ffi.new(
+            "wasm_valtype_t *[]", [self.lib.wasm_valtype_new(k) for k in kinds]
+        )
+        self.lib.wasm_valtype_vec_new(vec, len(kinds), data)
+        return vec
+
+    def setup(self):
+        lib, cffi = self.lib, self.ffi
+
+        binary = cffi.new("wasm_byte_vec_t *")
+        lib.wasm_byte_vec_new(
+            binary,
+            len(MODULE_BINARY),
+            cffi.from_buffer("wasm_byte_t[]", MODULE_BINARY),
+        )
+        self.module = lib.wasm_module_new(self.store, binary)
+        lib.wasm_byte_vec_delete(binary)
+
+        func_type = lib.wasm_functype_new(
+            self.valtype_vec(ffi.WASM_F32), self.valtype_vec(ffi.WASM_F64)
+        )
+        func = lib.wasm_func_new(self.store, func_type, self.callback)
+        lib.wasm_functype_delete(func_type)
+
+        glbl_type = lib.wasm_globaltype_new(lib.wasm_valtype_new(ffi.WASM_I32), True)
+        init = cffi.new("wasm_val_t *", {"kind": ffi.WASM_I32, "of": {"i32": 1024}})
+        glbl = lib.wasm_global_new(self.store, glbl_type, init)
+        lib.wasm_globaltype_delete(glbl_type)
+
+        self.imports = cffi.new("wasm_extern_vec_t *")
+        data = cffi.new(
+            "wasm_extern_t *[]",
+            [lib.wasm_func_as_extern(func), lib.wasm_global_as_extern(glbl)],
+        )
+        lib.wasm_extern_vec_new(self.imports, 2, data)
+
+        self.instance = lib.wasm_instance_new(
+            self.store, self.module, self.imports, cffi.NULL
+        )
+        self.exports = cffi.new("wasm_extern_vec_t *")
+        lib.wasm_instance_exports(self.instance, self.exports)
+
+    def teardown(self):
+        self.lib.wasm_extern_vec_delete(self.imports)
+        self.lib.wasm_extern_vec_delete(self.exports)
+        self.lib.wasm_instance_delete(self.instance)
+        self.lib.wasm_module_delete(self.module)
+
+    def func_call_wasm(self):
+        lib, cffi = self.lib, self.ffi
+        func = lib.wasm_extern_as_func(self.exports.data[0])
+        params = cffi.new("wasm_val_vec_t *")
+        data = cffi.new(
+            "wasm_val_t[]",
+            [
+                {"kind": ffi.WASM_I32, "of": {"i32": 1024}},
+                {"kind": ffi.WASM_I64, "of": {"i64": 1024 * 1024}},
+            ],
+        )
+        lib.wasm_val_vec_new(params, 2, data)
+        results = cffi.new("wasm_val_vec_t *")
+        lib.wasm_val_vec_new_empty(results)
+        lib.wasm_func_call(func, params, results)
+        lib.wasm_val_vec_delete(params)
+        lib.wasm_val_vec_delete(results)
+
+    def func_call_native(self):
+        lib, cffi = self.lib, self.ffi
+        func = lib.wasm_extern_as_func(self.imports.data[0])
+        params = cffi.new("wasm_val_vec_t *")
+        data = cffi.new("wasm_val_t[]", [{"kind": ffi.WASM_F32, "of": {"f32": 3.14}}])
+        lib.wasm_val_vec_new(params, 1, data)
+        results = cffi.new("wasm_val_vec_t *")
+        lib.wasm_val_vec_new_uninitialized(results, 1)
+        lib.wasm_func_call(func, params, results)
+        lib.wasm_val_vec_delete(params)
+        lib.wasm_val_vec_delete(results)
+
+    def global_get(self):
+        glb = self.lib.wasm_extern_as_global(self.exports.data[1])
+        val = self.ffi.new("wasm_val_t *")
+        self.lib.wasm_global_get(glb, val)
+        return val.of.f32
+
+    def global_set(self):
+        glb = self.lib.wasm_extern_as_global(self.exports.data[1])
+        val = self.ffi.new("wasm_val_t *", {"kind": ffi.WASM_F32, "of": {"f32": 2.71}})
+        self.lib.wasm_global_set(glb, val)
+
+    def table_get(self):
+        tbl = self.lib.wasm_extern_as_table(self.exports.data[3])
+        return self.lib.wasm_table_get(tbl, 0)
+
+
+def instantiate(scenarios):
+    scenarios.setup()
+    scenarios.teardown()
+
+
+SCENARIOS = [
+    ("wasm_func_call (wasm)", lambda s: s.func_call_wasm()),
+    ("wasm_func_call (native)", lambda s: s.func_call_native()),
+    ("wasm_global_get", lambda s: s.global_get()),
+    ("wasm_global_set", lambda s: s.global_set()),
+    ("wasm_table_get", lambda s: s.table_get()),
+]
+
+
+def main():
+    # pylint: disable=cell-var-from-loop
+    backends = [("ctypes", CtypesScenarios()), ("cffi", CffiScenarios())]
+
+    rows = []
+    for name, scenarios in backends:
+        rows.append((name, measure(lambda: instantiate(scenarios), number=2_000)))
+    report("setUp + tearDown", rows)
+
+    for _, scenarios in backends:
+        scenarios.setup()
+
+    for title, scenario in SCENARIOS:
+        rows = []
+        for name, scenarios in backends:
+            rows.append((name, measure(lambda: scenario(scenarios))))
+        report(title, rows)
+
+    for _, scenarios in backends:
+        scenarios.teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Per-call overhead of the generated wrappers.
+
+"rebind" re-creates the wrappers bindgen.py used to emit, which look up
+`libiwasm.<name>` and re-assign `restype` and `argtypes` on every call.
+"bind-once" is what wamr/binding.py exports now.
+
+    $ python -m benchmarks.bench_binding
+"""
+
+import ctypes as c
+
+import wamr.ffi as ffi
+
+from .common import Sandbox, measure, report
+
+
+def wasm_func_call_rebind(arg0, arg1, arg2):
+    _wasm_func_call = ffi.libiwasm.wasm_func_call
+    _wasm_func_call.restype = c.POINTER(ffi.wasm_trap_t)
+    _wasm_func_call.argtypes = [
+        c.POINTER(ffi.wasm_func_t),
+        c.POINTER(ffi.wasm_val_vec_t),
+        c.POINTER(ffi.wasm_val_vec_t),
+    ]
+    return _wasm_func_call(arg0, arg1, arg2)
+
+
+def wasm_val_vec_new_rebind(arg0, arg1, arg2):
+    _wasm_val_vec_new = ffi.libiwasm.wasm_val_vec_new
+    _wasm_val_vec_new.restype = None
+    _wasm_val_vec_new.argtypes = [
+        c.POINTER(ffi.wasm_val_vec_t),
+        c.c_size_t,
+        c.POINTER(ffi.wasm_val_t),
+    ]
+    return _wasm_val_vec_new(arg0, arg1, arg2)
+
+
+def main():
+    sandbox = Sandbox()
+    # (func (export "f1") (param i32 i64))
+    func = ffi.wasm_extern_as_func(sandbox.export(0))
+
+    data = ffi.list_to_carray(
+        ffi.wasm_val_t, ffi.wasm_i32_val(1024), ffi.wasm_i64_val(1024 * 1024)
+    )
+    params = ffi.wasm_val_vec_t()
+    ffi.wasm_val_vec_new(params, 2, data)
+    results = ffi.wasm_val_vec_t()
+    ffi.wasm_val_vec_new_empty(results)
+
+    scratch = ffi.wasm_val_vec_t()
+
+    def vec_new_rebind():
+        wasm_val_vec_new_rebind(scratch, 2, data)
+        ffi.wasm_val_vec_delete(scratch)
+
+    def vec_new_bind_once():
+        ffi.wasm_val_vec_new(scratch, 2, data)
+        ffi.wasm_val_vec_delete(scratch)
+
+    report(
+        "wasm_func_call",
+        [
+            ("rebind", measure(lambda: wasm_func_call_rebind(func, params, results))),
+            ("bind-once", measure(lambda: ffi.wasm_func_call(func, params, results))),
+        ],
+    )
+    report(
+        "wasm_val_vec_new (+ wasm_val_vec_delete)",
+        [
+            ("rebind", measure(vec_new_rebind)),
+            ("bind-once", measure(vec_new_bind_once)),
+        ],
+    )
+
+    ffi.wasm_val_vec_delete(params)
+    ffi.wasm_val_vec_delete(results)
+    sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
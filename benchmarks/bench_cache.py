@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Loading a module with many functions, compiled by load_module() against
+deserialized from a ModuleCache entry, like the second run of a process, and
+against a hit of a SharedModuleCache, like a binary loaded again in a process.
+
+    $ python -m benchmarks.bench_cache [functions]
+"""
+
+import sys
+import tempfile
+import time
+
+import wamr.ffi as ffi
+from wamr.cache import ModuleCache, SharedModuleCache
+
+from .bench_load import leb128, section
+
+REPEAT = 5
+
+
+def code_module(functions):
+    """
+    (module (func (param i32) (result i32) (i32.add (local.get 0) ...)) ...)
+    """
+    body = b"\x00\x20\x00" + b"\x41\x01\x6a" * 64 + b"\x0b"
+    body = leb128(len(body)) + body
+
+    types = b"\x01\x60\x01\x7f\x01\x7f"
+    funcs = leb128(functions) + b"\x00" * functions
+    code = leb128(functions) + body * functions
+    return (
+        b"\x00asm\x01\x00\x00\x00"
+        + section(1, types)
+        + section(3, funcs)
+        + section(10, code)
+    )
+
+
+def best(load, release=None):
+    costs = []
+    for _ in range(REPEAT):
+        begin = time.perf_counter()
+        module = load()
+        costs.append(time.perf_counter() - begin)
+        assert not ffi.is_null_pointer(module)
+        (release or ffi.wasm_module_delete)(module)
+    return min(costs) * 1e3
+
+
+def main():
+    functions = int(sys.argv[1] if len(sys.argv) > 1 else 2000)
+    binary = code_module(functions)
+
+    engine = ffi.wasm_engine_new()
+    store = ffi.wasm_store_new(engine)
+
+    with tempfile.TemporaryDirectory() as workspace:
+        cache = ModuleCache(workspace)
+        # writes the entry
+        ffi.wasm_module_delete(cache.load(store, binary))
+        shared = SharedModuleCache()
+
+        rows = [
+            ("compile", best(lambda: ffi.load_module(store, binary))),
+            ("cache hit", best(lambda: cache.load(store, binary))),
+            ("shared hit", best(lambda: shared.load(store, binary), shared.release)),
+        ]
+        shared.clear()
+        if not cache.hits:
+            print("wasm_module_serialize() is not supported, nothing is cached")
+
+        print(f"\nloading a module of {functions} functions")
+        for name, cost in rows:
+            print(f"  {name:<10} {cost:10.2f} ms")
+
+    ffi.wasm_store_delete(store)
+    ffi.wasm_engine_delete(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Calling a wasm function from Python.
+
+"vectors" builds params and results for every call, like
+tests/test_advanced.py. "frame" is a CallFrame and "specialized" is the
+function generated by specialize().
+
+A batch is the same function over columns of arguments, Python loops against
+call_many().
+
+    $ python -m benchmarks.bench_call
+"""
+
+import numpy
+
+import wamr.ffi as ffi
+from wamr.call import CallFrame, specialize
+from wamr.values import call_many
+
+from .common import Sandbox, measure, report
+
+BATCH = 10_000
+
+
+def call_with_vectors(func, a, b):
+    params = ffi.wasm_val_vec_t()
+    data = ffi.list_to_carray(ffi.wasm_val_t, ffi.wasm_i32_val(a), ffi.wasm_i64_val(b))
+    ffi.wasm_val_vec_new(params, 2, data)
+
+    results = ffi.wasm_val_vec_t()
+    ffi.wasm_val_vec_new_empty(results)
+
+    ffi.wasm_func_call(func, params, results)
+    ffi.wasm_val_vec_delete(params)
+
+
+def call_with_frame(frame, a, b):
+    frame.set_i32(0, a)
+    frame.set_i64(1, b)
+    frame.call()
+
+
+def loop_with_vectors(func, column_a, column_b):
+    for a, b in zip(column_a.tolist(), column_b.tolist()):
+        call_with_vectors(func, a, b)
+
+
+def loop_specialized(specialized, column_a, column_b):
+    for a, b in zip(column_a.tolist(), column_b.tolist()):
+        specialized(a, b)
+
+
+def main():
+    sandbox = Sandbox()
+    # (func (export "f1") (param i32 i64))
+    func = ffi.wasm_extern_as_func(sandbox.export(0))
+    frame = CallFrame(func)
+    specialized = specialize(func)
+
+    report(
+        "call (param i32 i64)",
+        [
+            ("vectors", measure(lambda: call_with_vectors(func, 1024, 1 << 20))),
+            ("frame", measure(lambda: call_with_frame(frame, 1024, 1 << 20))),
+            ("specialized", measure(lambda: specialized(1024, 1 << 20))),
+        ],
+    )
+
+    column_a = numpy.arange(BATCH, dtype="int32")
+    column_b = numpy.arange(BATCH, dtype="int64") << 20
+    report(
+        f"a batch of {BATCH} calls, per call",
+        [
+            (
+                "loop of vectors",
+                measure(lambda: loop_with_vectors(func, column_a, column_b), 10)
+                / BATCH,
+            ),
+            (
+                "loop of specialized",
+                measure(lambda: loop_specialized(specialized, column_a, column_b), 10)
+                / BATCH,
+            ),
+            (
+                "call_many",
+                measure(lambda: call_many(func, [column_a, column_b]), 10) / BATCH,
+            ),
+        ],
+    )
+
+    sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
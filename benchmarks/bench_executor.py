@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Throughput of a CPU-bound export on a WasmExecutor of 1 to N workers, N is
+the number of cores. wasm_func_call() releases the GIL, so it should scale
+with the workers until the cores run out.
+
+    $ python -m benchmarks.bench_executor [iterations per call]
+"""
+
+import os
+import sys
+import time
+
+from wamr import Engine, Module
+from wamr.executor import WasmExecutor
+
+CALLS = 256
+
+# (module
+#   (func (export "spin") (param $n i32) (result i32) (local $acc i32)
+#     (loop $l
+#       (local.set $acc (i32.add (local.get $acc) (local.get $n)))
+#       (br_if $l (local.tee $n (i32.sub (local.get $n) (i32.const 1)))))
+#     (local.get $acc))
+# )
+SPIN_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01\x7f\x01\x7f\x03\x02\x01\x00\x07"
+    b"\x08\x01\x04spin\x00\x00\n\x1b\x01\x19\x01\x01\x7f\x03@ \x01 \x00j!\x01 "
+    b'\x00A\x01k"\x00\r\x00\x0b \x01\x0b'
+)
+
+
+def workers():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    iterations = int(sys.argv[1] if len(sys.argv) > 1 else 1_000_000)
+    engine = Engine()
+    module = Module(engine, SPIN_BINARY)
+
+    print(f"\n{CALLS} calls of spin({iterations})")
+    base = None
+    for count in workers():
+        with WasmExecutor(engine, module, max_workers=count) as executor:
+            # instances are created, the first call of every worker is done
+            list(executor.map("spin", [1] * count))
+
+            begin = time.perf_counter()
+            list(executor.map("spin", [iterations] * CALLS))
+            elapsed = time.perf_counter() - begin
+
+        throughput = CALLS / elapsed
+        base = base or throughput
+        print(
+            f"  {count:3} workers {throughput:10.1f} calls/s "
+            f"{throughput / base:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
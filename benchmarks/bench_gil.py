@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Short accessors called from many threads, bound through CDLL (the GIL is
+released and reacquired around every call) versus PyDLL (the GIL is kept),
+which is what _HOLD_GIL of wamr/binding.py picks.
+
+    $ python -m benchmarks.bench_gil
+"""
+
+import threading
+import time
+
+import wamr.ffi as ffi
+from wamr import binding
+
+from .common import Sandbox
+
+CALLS = 200_000
+THREADS = (1, 2, 4, 8)
+
+
+def bind(name, hold_gil):
+    # pylint: disable=protected-access
+    func = ffi.load_library(hold_gil)[name]
+    func.restype, func.argtypes = binding._PROTOTYPES[name]
+    return func
+
+
+def run_threads(count, work):
+    """
+    returns wall time in seconds of *count* threads each calling *work()*
+    """
+    barrier = threading.Barrier(count + 1)
+
+    def target():
+        barrier.wait()
+        work()
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    begin = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - begin
+
+
+def main():
+    sandbox = Sandbox()
+    # (memory (export "m1") 1 2)
+    memory = ffi.wasm_extern_as_memory(sandbox.export(2))
+    extern = sandbox.export(0)
+
+    for name, arg in (("wasm_extern_kind", extern), ("wasm_memory_size", memory)):
+        print(f"\n{name}, {CALLS} calls per thread")
+        for hold_gil in (False, True):
+            func = bind(name, hold_gil)
+
+            def work(func=func):
+                for _ in range(CALLS):
+                    func(arg)
+
+            label = "PyDLL" if hold_gil else "CDLL"
+            for count in THREADS:
+                cost = run_threads(count, work) / (count * CALLS) * 1e9
+                print(f"  {label:<5} {count} threads {cost:10.1f} ns/call")
+
+    sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+A round trip Python -> wasm -> a host function in Python -> wasm -> Python.
+
+"raw callback" is a wasm_func_cb_decl callback which dereferences vectors
+and copies a wasm_f64_val() into results, like tests/test_advanced.py.
+"host_function" is the same function with @host_function.
+
+Then creating functions with a state of their own, a HostFunction and a
+callback per function, against a Registry sharing one callback.
+
+    $ python -m benchmarks.bench_host
+"""
+
+import ctypes as c
+from functools import partial
+import time
+import tracemalloc
+
+import wamr.ffi as ffi
+from wamr.call import specialize
+from wamr.host import HostFunction, Registry, host_function
+
+from .common import measure, report
+
+FUNCS = 1000
+
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x07\x07\x01\x03run\x00\x01\n\x08\x01\x06"
+    b"\x00 \x00\x10\x00\x0b"
+)
+
+
+@ffi.wasm_func_cb_decl
+def raw_double(args, results):
+    args = ffi.dereference(args)
+    results = ffi.dereference(results)
+
+    result_v = ffi.wasm_f64_val(args.data[0].of.f32 * 2.0)
+    ffi.wasm_val_copy(results.data[0], result_v)
+    results.num_elems = 1
+
+
+@host_function([ffi.WASM_F32], [ffi.WASM_F64])
+def double(value):
+    return value * 2.0
+
+
+def raw_func(store):
+    func_type = ffi.wasm_functype_new_1_1(
+        ffi.wasm_valtype_new(ffi.WASM_F32), ffi.wasm_valtype_new(ffi.WASM_F64)
+    )
+    func = ffi.wasm_func_new(store, func_type, raw_double)
+    ffi.wasm_functype_delete(func_type)
+    return func
+
+
+def instantiate(store, module, func):
+    imports = ffi.wasm_extern_vec_t()
+    data = ffi.list_to_carray(
+        c.POINTER(ffi.wasm_extern_t), ffi.wasm_func_as_extern(func)
+    )
+    ffi.wasm_extern_vec_new(imports, 1, data)
+    instance = ffi.wasm_instance_new(
+        store, module, imports, ffi.create_null_pointer(ffi.wasm_trap_t)
+    )
+    exports = ffi.wasm_extern_vec_t()
+    ffi.wasm_instance_exports(instance, exports)
+    return instance, imports, exports
+
+
+def scale(factor, value):
+    return value * factor
+
+
+def create_with_callbacks(store, keep):
+    funcs = []
+    for i in range(FUNCS):
+        host = HostFunction(partial(scale, i), double.params, double.results)
+        funcs.append(host.new(store))
+        # a callback has to live as long as its function
+        keep.append(host)
+    return funcs
+
+
+def create_with_registry(store, registry):
+    return [registry.new(store, double, partial(scale, i)) for i in range(FUNCS)]
+
+
+def main():
+    engine = ffi.wasm_engine_new()
+    store = ffi.wasm_store_new(engine)
+    module = ffi.load_module(store, MODULE_BINARY)
+
+    rows = []
+    for name, func in (
+        ("raw callback", raw_func(store)),
+        ("host_function", double.new(store)),
+    ):
+        instance, imports, exports = instantiate(store, module, func)
+        run = specialize(ffi.wasm_extern_as_func(exports.data[0]))
+        rows.append((name, measure(lambda run=run: run(1.5))))
+
+        ffi.wasm_extern_vec_delete(exports)
+        ffi.wasm_instance_delete(instance)
+        ffi.wasm_extern_vec_delete(imports)
+
+    report("a host call (param f32) (result f64), round trip", rows)
+
+    registry = Registry()
+    hosts = []
+    print(f"\ncreate {FUNCS} functions with a state each")
+    for name, factory in (
+        ("a callback each", lambda: create_with_callbacks(store, hosts)),
+        ("registry", lambda: create_with_registry(store, registry)),
+    ):
+        tracemalloc.start()
+        begin = time.perf_counter()
+        funcs = factory()
+        cost = (time.perf_counter() - begin) / FUNCS * 1e9
+        peak = tracemalloc.get_traced_memory()[1] / FUNCS
+        tracemalloc.stop()
+        print(f"  {name:<15} {cost:10.1f} ns/func {peak:8.1f} bytes/func")
+
+        for func in funcs:
+            ffi.wasm_func_delete(func)
+
+    ffi.wasm_module_delete(module)
+    ffi.wasm_store_delete(store)
+    ffi.wasm_engine_delete(engine)
+
+
+if __name__ == "__main__":
+    main()
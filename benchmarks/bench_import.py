@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Start-up cost of `import wamr.ffi` in a fresh interpreter.
+
+"eager" materializes every foreign function and loads libiwasm like the
+import used to do. "lazy" is a plain import, "first call" touches only
+what a short-lived worker needs to create an engine.
+
+    $ python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+import time
+
+SCENARIOS = [
+    ("interpreter only", "pass"),
+    ("lazy", "import wamr.ffi"),
+    (
+        "first call",
+        "import wamr.ffi as ffi; ffi.wasm_engine_delete(ffi.wasm_engine_new())",
+    ),
+    ("eager", "from wamr.ffi import *"),
+]
+
+
+def measure(statement, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - begin)
+    return best * 1e3
+
+
+def main():
+    print("\nimport wamr.ffi")
+    width = max(len(name) for name, _ in SCENARIOS)
+    for name, statement in SCENARIOS:
+        print(f"  {name:<{width}} {measure(statement):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
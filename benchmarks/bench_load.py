@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Peak RSS of compiling a big module in a fresh interpreter.
+
+"copy" reads the file into bytes and copies it again with
+load_module_file(). "mmap" is load_module() with the path, which maps the
+file and points the vector at the mapping.
+
+    $ python -m benchmarks.bench_load [size in MB]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+SCENARIOS = [
+    (
+        "copy",
+        "binary = ffi.load_module_file(open(path, 'rb').read())\n"
+        "module = ffi.wasm_module_new(store, binary)\n"
+        "ffi.wasm_byte_vec_delete(binary)\n",
+    ),
+    ("mmap", "module = ffi.load_module(store, path)\n"),
+]
+
+TEMPLATE = (
+    "import resource, sys\n"
+    "import wamr.ffi as ffi\n"
+    "path = sys.argv[1]\n"
+    "engine = ffi.wasm_engine_new()\n"
+    "store = ffi.wasm_store_new(engine)\n"
+    "{}"
+    "assert not ffi.is_null_pointer(module)\n"
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+
+def leb128(value):
+    content = b""
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            content += bytes([byte | 0x80])
+        else:
+            return content + bytes([byte])
+
+
+def section(section_id, content):
+    return bytes([section_id]) + leb128(len(content)) + content
+
+
+def big_module(size):
+    """
+    (module (memory N) (data (i32.const 0) "...size bytes..."))
+    """
+    pages = (size + 0xFFFF) // 0x10000
+    memory = b"\x01\x00" + leb128(pages)
+    data = b"\x01\x00\x41\x00\x0b" + leb128(size) + os.urandom(size)
+    return b"\x00asm\x01\x00\x00\x00" + section(5, memory) + section(11, data)
+
+
+def main():
+    size = int(sys.argv[1] if len(sys.argv) > 1 else 32) * 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as workspace:
+        path = os.path.join(workspace, "big.wasm")
+        with open(path, "wb") as module_file:
+            module_file.write(big_module(size))
+
+        print(f"\npeak RSS, a module of {size // 1024 // 1024} MB")
+        for name, statement in SCENARIOS:
+            output = subprocess.run(
+                [sys.executable, "-c", TEMPLATE.format(statement), path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            print(f"  {name:<4} {int(output) / 1024:10.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
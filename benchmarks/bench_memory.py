@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Moving data in and out of linear memory.
+
+"indexing" goes byte by byte through the POINTER(c_ubyte) of
+wasm_memory_data(), what users do without wamr.memory. "bulk" is
+LinearMemory.read/write/pack_into/unpack_from.
+
+    $ python -m benchmarks.bench_memory
+"""
+
+import struct
+
+import wamr.ffi as ffi
+from wamr.memory import LinearMemory
+
+from .common import Sandbox, measure, report
+
+SIZES = (16, 1024, 16 * 1024)
+RECORD = struct.Struct("<iIf")
+RECORDS = 256
+
+
+def read_by_indexing(memory, offset, size):
+    data = ffi.wasm_memory_data(memory)
+    return bytes([data[i] for i in range(offset, offset + size)])
+
+
+def write_by_indexing(memory, offset, buffer):
+    data = ffi.wasm_memory_data(memory)
+    for i, byte in enumerate(buffer):
+        data[offset + i] = byte
+
+
+def pack_by_indexing(memory, offset, records):
+    for i, record in enumerate(records):
+        write_by_indexing(memory, offset + i * RECORD.size, RECORD.pack(*record))
+
+
+def unpack_by_indexing(memory, offset, count):
+    return [
+        RECORD.unpack(read_by_indexing(memory, offset + i * RECORD.size, RECORD.size))
+        for i in range(count)
+    ]
+
+
+def main():
+    sandbox = Sandbox()
+    # (memory (export "m1") 1 2)
+    memory = ffi.wasm_extern_as_memory(sandbox.export(2))
+    linear_memory = LinearMemory(memory)
+
+    for size in SIZES:
+        buffer = bytes(range(256)) * (size // 256) or bytes(range(size))
+        number = max(100, 1_000_000 // size)
+
+        report(
+            f"read {size} bytes",
+            [
+                (
+                    "indexing",
+                    measure(lambda: read_by_indexing(memory, 0, size), number),
+                ),
+                ("bulk", measure(lambda: linear_memory.read(0, size), number)),
+            ],
+        )
+        report(
+            f"write {size} bytes",
+            [
+                (
+                    "indexing",
+                    measure(lambda: write_by_indexing(memory, 0, buffer), number),
+                ),
+                ("bulk", measure(lambda: linear_memory.write(0, buffer), number)),
+            ],
+        )
+
+    records = [(i, i * 2, i / 2) for i in range(RECORDS)]
+    report(
+        f"pack {RECORDS} records of {RECORD.format}",
+        [
+            ("indexing", measure(lambda: pack_by_indexing(memory, 0, records), 100)),
+            ("bulk", measure(lambda: linear_memory.pack_into(RECORD, 0, records), 100)),
+        ],
+    )
+    report(
+        f"unpack {RECORDS} records of {RECORD.format}",
+        [
+            (
+                "indexing",
+                measure(lambda: unpack_by_indexing(memory, 0, RECORDS), 100),
+            ),
+            (
+                "bulk",
+                measure(lambda: linear_memory.unpack_from(RECORD, 0, RECORDS), 100),
+            ),
+        ],
+    )
+
+    sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+A request which calls an export once, on a new Instance against on one
+checked out of an InstancePool, reset with a memory of one page and a
+mutable global.
+
+    $ python -m benchmarks.bench_pool
+"""
+
+import wamr.ffi as ffi
+from wamr import Engine, Func, FuncType, Instance, Module, Store
+from wamr.pool import InstancePool
+
+from .common import measure, report
+
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+#   (memory (export "mem") 1)
+#   (global (export "counter") (mut i32) (i32.const 7))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x05\x03\x01\x00\x01\x06\x06\x01\x7f\x01A"
+    b"\x07\x0b\x07\x17\x03\x03run\x00\x01\x03mem\x02\x00\x07counter\x03\x00\n"
+    b"\x08\x01\x06\x00 \x00\x10\x00\x0b"
+)
+
+
+def main():
+    engine = Engine()
+    store = Store(engine)
+    module = Module(engine, MODULE_BINARY)
+    double = Func(store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2)
+    pool = InstancePool(store, module, [double], min_size=1, max_size=1)
+
+    def instantiate():
+        instance = Instance(store, module, [double])
+        return instance.export(store, "run")(store, 1.5)
+
+    def checkout():
+        with pool.checkout() as instance:
+            return instance.export(store, "run")(store, 1.5)
+
+    report(
+        "a request, one call of (param f32) (result f64)",
+        [
+            ("new instance", measure(instantiate, number=10_000)),
+            ("pool checkout", measure(checkout, number=10_000)),
+        ],
+    )
+    print(f"  reset {pool.reset_time / pool.resets * 1e9:10.1f} ns on average")
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Throughput of a CPU-bound export over rows of arguments, values.call_many()
+in this process against ProcessPool.call_many() with a worker per core.
+
+    $ python -m benchmarks.bench_process [iterations per call]
+"""
+
+import sys
+import time
+
+import numpy
+
+from wamr import Engine, Instance, Module, Store
+from wamr.process import ProcessPool
+from wamr.values import call_many
+
+from .bench_executor import SPIN_BINARY
+
+ROWS = 512
+
+
+def timed(run):
+    begin = time.perf_counter()
+    results = run()
+    return time.perf_counter() - begin, results
+
+
+def main():
+    iterations = int(sys.argv[1] if len(sys.argv) > 1 else 1_000_000)
+    args = [numpy.full(ROWS, iterations, dtype=numpy.int32)]
+
+    engine = Engine()
+    store = Store(engine)
+    instance = Instance(store, Module(engine, SPIN_BINARY))
+    spin = instance.export(store, "spin").pointer
+    single, expected = timed(lambda: call_many(spin, args))
+
+    with ProcessPool(SPIN_BINARY) as pool:
+        # workers are started and have compiled the module
+        pool.call_many("spin", [numpy.ones(pool.processes, dtype=numpy.int32)], 1)
+        multiple, results = timed(lambda: pool.call_many("spin", args))
+        processes = pool.processes
+
+    assert numpy.array_equal(results, expected)
+
+    print(f"\n{ROWS} calls of spin({iterations})")
+    for name, elapsed in (
+        ("1 process", single),
+        (f"{processes} processes", multiple),
+    ):
+        print(
+            f"  {name:<14} {ROWS / elapsed:10.1f} calls/s " f"{single / elapsed:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
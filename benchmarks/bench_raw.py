@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Handles as `LP_wasm_xxx_t` objects versus handles as plain `int`s.
+
+It keeps HANDLES handles of every export alive and compares bytes retained
+by Python, then the per-call cost of a few handle-only functions.
+
+    $ python -m benchmarks.bench_raw
+"""
+
+import ctypes as c
+import gc
+import tracemalloc
+
+import wamr.ffi as ffi
+from wamr.ffi import raw
+
+from .common import Sandbox, measure, report
+
+HANDLES = 10_000
+
+
+def retained(collect):
+    """
+    returns bytes which are still allocated after *collect()* returns
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    del kept
+    return sum(stat.size_diff for stat in stats)
+
+
+def report_memory(title, rows):
+    print(f"\n{title}")
+    width = max(len(name) for name, _ in rows)
+    for name, size in rows:
+        print(f"  {name:<{width}} {size / HANDLES:10.1f} bytes/handle")
+
+
+def main():
+    sandbox = Sandbox()
+    # (func (export "f1") (param i32 i64))
+    extern = sandbox.export(0)
+    extern_addr = c.cast(extern, c.c_void_p).value
+
+    def collect_ctypes():
+        return [ffi.wasm_extern_as_func(extern) for _ in range(HANDLES)]
+
+    def collect_raw():
+        return [raw.wasm_extern_as_func(extern_addr) for _ in range(HANDLES)]
+
+    report_memory(
+        "wasm_extern_as_func, retained",
+        [
+            ("ctypes", retained(collect_ctypes)),
+            ("raw", retained(collect_raw)),
+        ],
+    )
+
+    func = ffi.wasm_extern_as_func(extern)
+    func_addr = raw.wasm_extern_as_func(extern_addr)
+
+    report(
+        "wasm_extern_as_func",
+        [
+            ("ctypes", measure(lambda: ffi.wasm_extern_as_func(extern))),
+            ("raw", measure(lambda: raw.wasm_extern_as_func(extern_addr))),
+        ],
+    )
+    report(
+        "wasm_func_param_arity",
+        [
+            ("ctypes", measure(lambda: ffi.wasm_func_param_arity(func))),
+            ("raw", measure(lambda: raw.wasm_func_param_arity(func_addr))),
+        ],
+    )
+
+    sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
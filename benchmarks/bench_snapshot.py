@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Rolling an instance back with Snapshot.restore() against creating a new one
+with wasm_instance_new(), for a memory of 16 pages initialized by a data
+segment of a few sizes.
+
+    $ python -m benchmarks.bench_snapshot
+"""
+
+import os
+
+import wamr.ffi as ffi
+from wamr import Engine, Instance, Module, Store
+
+from .bench_load import leb128, section
+from .common import measure, report
+
+PAGES = 16
+DIRTY = b"\xff" * 64
+
+
+def state_module(size):
+    """
+    (module
+      (memory (export "mem") PAGES)
+      (global (export "counter") (mut i32) (i32.const 7))
+      (data (i32.const 0) "...size bytes..."))
+    """
+    memory = b"\x01\x00" + leb128(PAGES)
+    global_ = b"\x01\x7f\x01\x41\x07\x0b"
+    exports = b"\x02\x03mem\x02\x00\x07counter\x03\x00"
+    data = b"\x01\x00\x41\x00\x0b" + leb128(size) + os.urandom(size)
+    return (
+        b"\x00asm\x01\x00\x00\x00"
+        + section(5, memory)
+        + section(6, global_)
+        + section(7, exports)
+        + section(11, data)
+    )
+
+
+def main():
+    engine = Engine()
+    store = Store(engine)
+    imports = ffi.wasm_extern_vec_t()
+    ffi.wasm_extern_vec_new_empty(imports)
+    no_trap = ffi.create_null_pointer(ffi.wasm_trap_t)
+
+    for size in (1024, 64 * 1024, 512 * 1024):
+        module = Module(engine, state_module(size))
+        instance = Instance(store, module)
+        snapshot = instance.snapshot(store)
+        memory = instance.export(store, "mem")
+
+        def instantiate(module=module):
+            ffi.wasm_instance_delete(
+                ffi.wasm_instance_new(store.pointer, module.pointer, imports, no_trap)
+            )
+
+        def restore(instance=instance, snapshot=snapshot, memory=memory):
+            memory.write(0, DIRTY)
+            instance.restore(store, snapshot)
+
+        report(
+            f"a memory of {PAGES} pages, {size // 1024} KB of data, "
+            f"a snapshot of {snapshot.nbytes} bytes",
+            [
+                ("wasm_instance_new", measure(instantiate, number=1_000)),
+                ("restore", measure(restore, number=1_000)),
+            ],
+        )
+
+    ffi.wasm_extern_vec_delete(imports)
+
+
+if __name__ == "__main__":
+    main()
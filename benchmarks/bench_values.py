@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Building and decoding arrays of wasm_val_t.
+
+"per value" is wasm_xxx_val() for every value and list_to_carray(). "numpy"
+is wamr.values.pack()/unpack(). It doesn't need libiwasm.
+
+    $ python -m benchmarks.bench_values
+"""
+
+import numpy
+
+import wamr.ffi as ffi
+from wamr.values import pack, unpack
+
+from .common import measure, report
+
+COUNTS = (4, 256, 4096)
+
+
+def pack_per_value(values):
+    return ffi.list_to_carray(ffi.wasm_val_t, *[ffi.wasm_f64_val(v) for v in values])
+
+
+def unpack_per_value(vals):
+    return [val.of.f64 for val in vals]
+
+
+def main():
+    for count in COUNTS:
+        values = numpy.linspace(0, 1, count)
+        python_values = values.tolist()
+        vals = pack(values)
+        out = (ffi.wasm_val_t * count)()
+        number = max(100, 100_000 // count)
+
+        report(
+            f"pack {count} f64",
+            [
+                ("per value", measure(lambda: pack_per_value(python_values), number)),
+                ("numpy", measure(lambda: pack(values), number)),
+                ("numpy, reused", measure(lambda: pack(values, out=out), number)),
+            ],
+        )
+        report(
+            f"unpack {count} f64",
+            [
+                ("per value", measure(lambda: unpack_per_value(vals), number)),
+                ("numpy", measure(lambda: unpack(vals), number)),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import timeit
+
+import wamr.ffi as ffi
+
+# It is a module likes:
+# (module
+#   (import "mod" "g0" (global i32))
+#   (import "mod" "f0" (func (param f32) (result f64)))
+#
+#   (func (export "f1") (param i32 i64))
+#   (global (export "g1") (mut f32) (f32.const 3.14))
+#   (memory (export "m1") 1 2)
+#   (table (export "t1") 1 funcref)
+#
+#   (func (export "f2") (unreachable))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x0e\x03`\x01}\x01|`\x02\x7f~\x00`\x00"
+    b"\x00\x02\x14\x02\x03mod\x02g0\x03\x7f\x00\x03mod\x02f0\x00\x00\x03\x03"
+    b"\x02\x01\x02\x04\x04\x01p\x00\x01\x05\x04\x01\x01\x01\x02\x06\t\x01}\x01C"
+    b"\xc3\xf5H@\x0b\x07\x1a\x05\x02f1\x00\x01\x02g1\x03\x01\x02m1\x02\x00\x02t1"
+    b"\x01\x00\x02f2\x00\x02\n\x08\x02\x02\x00\x0b\x03\x00\x00\x0b"
+)
+
+
+@ffi.wasm_func_cb_decl
+def callback(args, results):
+    args = ffi.dereference(args)
+    results = ffi.dereference(results)
+
+    result_v = ffi.wasm_f64_val(args.data[0].of.f32 * 2.0)
+    ffi.wasm_val_copy(results.data[0], result_v)
+    results.num_elems = 1
+
+
+class Sandbox:
+    """
+    engine + store + an instance of MODULE_BINARY, the same setup as
+    tests/test_advanced.py
+    """
+
+    def __init__(self, binary=MODULE_BINARY):
+        self.engine = ffi.wasm_engine_new()
+        self.store = ffi.wasm_store_new(self.engine)
+
+        binary = c.pointer(ffi.load_module_file(binary))
+        self.module = ffi.wasm_module_new(self.store, binary)
+        ffi.wasm_byte_vec_delete(binary)
+
+        func_type = ffi.wasm_functype_new_1_1(
+            ffi.wasm_valtype_new(ffi.WASM_F32),
+            ffi.wasm_valtype_new(ffi.WASM_F64),
+        )
+        func = ffi.wasm_func_new(self.store, func_type, callback)
+        ffi.wasm_functype_delete(func_type)
+
+        glbl_type = ffi.wasm_globaltype_new(ffi.wasm_valtype_new(ffi.WASM_I32), True)
+        glbl = ffi.wasm_global_new(self.store, glbl_type, ffi.wasm_i32_val(1024))
+        ffi.wasm_globaltype_delete(glbl_type)
+
+        self.imports = ffi.wasm_extern_vec_t()
+        data = ffi.list_to_carray(
+            c.POINTER(ffi.wasm_extern_t),
+            ffi.wasm_func_as_extern(func),
+            ffi.wasm_global_as_extern(glbl),
+        )
+        ffi.wasm_extern_vec_new(self.imports, 2, data)
+
+        self.instance = ffi.wasm_instance_new(
+            self.store,
+            self.module,
+            self.imports,
+            ffi.create_null_pointer(ffi.wasm_trap_t),
+        )
+
+        self.exports = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(self.instance, self.exports)
+
+    def export(self, index):
+        return self.exports.data[index]
+
+    def close(self):
+        ffi.wasm_extern_vec_delete(self.exports)
+        ffi.wasm_extern_vec_delete(self.imports)
+        ffi.wasm_instance_delete(self.instance)
+        ffi.wasm_module_delete(self.module)
+        ffi.wasm_store_delete(self.store)
+        ffi.wasm_engine_delete(self.engine)
+
+
+def measure(stmt, number=100_000, repeat=5):
+    """
+    returns the best per-call cost in nanoseconds
+    """
+    best = min(timeit.repeat(stmt, number=number, repeat=repeat))
+    return best / number * 1e9
+
+
+def report(title, rows):
+    print(f"\n{title}")
+    width = max(len(name) for name, _ in rows)
+    for name, cost in rows:
+        print(f"  {name:<{width}} {cost:10.1f} ns/call")
@@ -19,4 +19,5 @@ setup(
     url="https://github.com/bytecodealliance/wamr-python",
     license=license,
     packages=["wamr"],
+    extras_require={"cffi": ["cffi"], "numpy": ["numpy"]},
 )
@@ -4,4 +4,23 @@
 # Copyright (C) 2019 Intel Corporation.  All rights reserved.
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 #
-__all__ = ["test_basic", "test_advanced"]
+__all__ = [
+    "test_basic",
+    "test_advanced",
+    "test_backends",
+    "test_raw",
+    "test_gil",
+    "test_runtime",
+    "test_memory",
+    "test_values",
+    "test_call",
+    "test_call_many",
+    "test_host",
+    "test_oop",
+    "test_cache",
+    "test_pool",
+    "test_snapshot",
+    "test_executor",
+    "test_process",
+    "test_aio",
+]
@@ -14,7 +14,6 @@ import unittest
 
 import wamr.ffi as ffi
 
-
 # It is a module likes:
 # (module
 #   (import "mod" "g0" (global i32))
@@ -514,6 +513,39 @@ class AdvancedTestSuite(unittest.TestCase):
         func_offset = ffi.wasm_frame_func_offset(frame)
         self.assertGreater(func_offset, 0)
 
+    def test_vec_view(self):
+        view = ffi.VecView(self.exports)
+        self.assertEqual(len(view), 5)
+        self.assertEqual(
+            [c.addressof(ffi.dereference(e)) for e in view],
+            [
+                c.addressof(ffi.dereference(e))
+                for e in ffi.wasm_vec_to_list(self.exports)
+            ],
+        )
+
+        # (func (export "f1")), (func (export "f2"))
+        self.assertEqual(ffi.wasm_extern_kind(view[0]), ffi.WASM_EXTERN_FUNC)
+        self.assertEqual(ffi.wasm_extern_kind(view[-1]), ffi.WASM_EXTERN_FUNC)
+
+        # (global (export "g1")), (memory (export "m1"))
+        middle = view[1:3]
+        self.assertEqual(len(middle), 2)
+        self.assertEqual(ffi.wasm_extern_kind(middle[0]), ffi.WASM_EXTERN_GLOBAL)
+        self.assertEqual(ffi.wasm_extern_kind(middle[1]), ffi.WASM_EXTERN_MEMORY)
+
+        with self.assertRaises(IndexError):
+            view[5]
+
+    def test_vec_view_of_vector(self):
+        view = ffi.dereference(self.exports).view()
+        self.assertEqual(len(view), 5)
+        self.assertEqual(len(view[::2]), 3)
+
+    def test_vec_view_neg(self):
+        with self.assertRaises(RuntimeError):
+            ffi.VecView(ffi.wasm_limits_t())
+
     @classmethod
     def tearDownClass(cls):
         print("Shutting down...")
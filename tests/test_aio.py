@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import asyncio
+import unittest
+
+from wamr import *
+from wamr.aio import AsyncRunner, default_runner, module_inst
+
+# It is a module likes:
+# (module
+#   (func (export "spin") (param $n i32) (result i32) (local $acc i32)
+#     (loop $l
+#       (local.set $acc (i32.add (local.get $acc) (local.get $n)))
+#       (br_if $l (local.tee $n (i32.sub (local.get $n) (i32.const 1)))))
+#     (local.get $acc))
+# )
+SPIN_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01\x7f\x01\x7f\x03\x02\x01\x00\x07"
+    b"\x08\x01\x04spin\x00\x00\n\x1b\x01\x19\x01\x01\x7f\x03@ \x01 \x00j!\x01 "
+    b'\x00A\x01k"\x00\r\x00\x0b \x01\x0b'
+)
+
+
+class AsyncTestSuite(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._engine = Engine()
+
+    def setUp(self):
+        self.runner = AsyncRunner(max_workers=2, limit=2)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    async def asyncSetUp(self):
+        self.module = await Module.compile_async(
+            self._engine, SPIN_BINARY, runner=self.runner
+        )
+        self.store = Store(self._engine)
+        self.instance = await Instance.new_async(
+            self.store, self.module, runner=self.runner
+        )
+        self.spin = self.instance.export(self.store, "spin")
+
+    async def test_call(self):
+        self.assertEqual(
+            await self.spin.call_async(self.store, 3, runner=self.runner), 6
+        )
+
+    async def test_many(self):
+        results = await asyncio.gather(
+            *(
+                self.spin.call_async(self.store, n, runner=self.runner)
+                for n in range(1, 9)
+            )
+        )
+        self.assertEqual(results, [n * (n + 1) // 2 for n in range(1, 9)])
+
+    async def test_default_runner(self):
+        self.assertEqual(await self.spin.call_async(self.store, 1), 1)
+
+    async def test_cancel(self):
+        if module_inst(self.instance) is None:
+            self.skipTest("the layout of wasm_instance_t is unknown")
+
+        runner = AsyncRunner(max_workers=2, limit=2, terminate=True)
+        try:
+            # 0 wraps around, about 4 billion rounds
+            task = asyncio.ensure_future(
+                self.spin.call_async(self.store, 0, runner=runner)
+            )
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(runner.terminations, 1)
+
+            # the instance is still usable after termination
+            self.assertEqual(
+                await self.spin.call_async(self.store, 2, runner=runner), 3
+            )
+        finally:
+            runner.shutdown()
+
+    async def test_cancel_running(self):
+        # without terminate=True, it finishes in the background
+        task = asyncio.ensure_future(
+            self.spin.call_async(self.store, 2_000_000, runner=self.runner)
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(self.runner.terminations, 0)
+
+        # after it, calls of the store run one after another
+        self.assertEqual(
+            await self.spin.call_async(self.store, 2, runner=self.runner), 3
+        )
+
+    async def test_cancel_pending(self):
+        # the limit is 2, the third one waits in the event loop
+        tasks = [
+            asyncio.ensure_future(
+                self.spin.call_async(self.store, 1, runner=self.runner)
+            )
+            for _ in range(3)
+        ]
+        tasks[2].cancel()
+        self.assertEqual(await asyncio.gather(*tasks[:2]), [1, 1])
+        with self.assertRaises(asyncio.CancelledError):
+            await tasks[2]
+        self.assertEqual(self.runner.terminations, 0)
+
+    async def test_compile_concurrently(self):
+        modules = await asyncio.gather(
+            *(
+                Module.compile_async(self._engine, SPIN_BINARY, runner=self.runner)
+                for _ in range(4)
+            )
+        )
+        for module in modules:
+            instance = Instance(self.store, module)
+            self.assertEqual(instance.export(self.store, "spin")(self.store, 3), 6)
+
+    async def test_bad_module(self):
+        with self.assertRaises(RuntimeError):
+            await Module.compile_async(
+                self._engine, b"\x00asm\x01\x00\x00\x00\xff", runner=self.runner
+            )
+
+
+class DefaultRunnerTestSuite(unittest.TestCase):
+    def test_event_loops(self):
+        engine = Engine()
+        store = Store(engine)
+        spin = Instance(store, Module(engine, SPIN_BINARY)).export(store, "spin")
+        # more than the limit, some of them wait on the semaphore
+        count = default_runner().limit + 4
+
+        async def burst():
+            return await asyncio.gather(
+                *(spin.call_async(store, 2) for _ in range(count))
+            )
+
+        # a loop of its own each
+        for _ in range(2):
+            self.assertEqual(asyncio.run(burst()), [3] * count)
+
+
+if __name__ == "__main__":
+    unittest.main()
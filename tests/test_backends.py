@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import unittest
+
+import wamr.ffi as ffi
+from wamr import binding
+
+
+class BackendsTestSuite(unittest.TestCase):
+    def test_ffi_is_ctypes(self):
+        self.assertIs(ffi.wasm_engine_new, binding.wasm_engine_new)
+        self.assertFalse(hasattr(ffi, "use_backend"))
+
+    def test_cffi(self):
+        # pylint: disable=import-outside-toplevel
+        from wamr import binding_cffi
+
+        engine = binding_cffi.wasm_engine_new()
+        self.assertNotEqual(engine, binding_cffi.ffi.NULL)
+        store = binding_cffi.wasm_store_new(engine)
+        self.assertNotEqual(store, binding_cffi.ffi.NULL)
+
+        vec = binding_cffi.ffi.new("wasm_val_vec_t *")
+        binding_cffi.wasm_val_vec_new_uninitialized(vec, 3)
+        self.assertEqual(vec.size, 3)
+        binding_cffi.wasm_val_vec_delete(vec)
+
+        binding_cffi.wasm_store_delete(store)
+
+        # ffi isn't switched by using it
+        self.assertIs(ffi.wasm_func_call, binding.wasm_func_call)
+
+    def test_cffi_same_symbols(self):
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=protected-access
+        from wamr import binding_cffi
+
+        self.assertEqual(set(binding._PROTOTYPES), binding_cffi._SYMBOLS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,9 @@
 # pylint: disable=missing-module-docstring
 
 import ctypes as c
+import mmap
+import os
+import tempfile
 import unittest
 from venv import create
 
@@ -1075,6 +1078,54 @@ class BasicTestSuite(unittest.TestCase):
 
         wasm_module_delete(module)
 
+    def test_load_module_pos(self):
+        for source in (
+            MODULE_BINARY,
+            bytearray(MODULE_BINARY),
+            memoryview(MODULE_BINARY),
+            memoryview(bytearray(MODULE_BINARY)),
+        ):
+            module = load_module(self._wasm_store, source)
+
+            self.assertIsNotNullPointer(module)
+
+            wasm_module_delete(module)
+
+    def test_load_module_file_path(self):
+        with tempfile.TemporaryDirectory() as workspace:
+            path = os.path.join(workspace, "module.wasm")
+            with open(path, "wb") as module_file:
+                module_file.write(MODULE_BINARY)
+
+            module = load_module(self._wasm_store, path)
+            self.assertIsNotNullPointer(module)
+            wasm_module_delete(module)
+
+            with open(path, "rb") as module_file:
+                for access in (mmap.ACCESS_READ, mmap.ACCESS_COPY):
+                    with mmap.mmap(module_file.fileno(), 0, access=access) as view:
+                        module = load_module(self._wasm_store, view)
+                        self.assertIsNotNullPointer(module)
+                        wasm_module_delete(module)
+
+    def test_load_module_neg(self):
+        module = load_module(self._wasm_store, b"")
+
+        self.assertIsNullPointer(module)
+
+        wasm_module_delete(module)
+
+    def test_borrow_byte_vec(self):
+        content = bytearray(MODULE_BINARY)
+        with borrow_byte_vec(content) as binary:
+            self.assertEqual(binary.size, len(MODULE_BINARY))
+            self.assertEqual(binary.num_elems, len(MODULE_BINARY))
+            self.assertEqual(
+                c.addressof(binary.data.contents),
+                c.addressof(c.c_ubyte.from_buffer(content)),
+            )
+            self.assertTrue(wasm_module_validate(self._wasm_store, binary))
+
     def test_wasm_module_delete_pos(self):
         binary = load_module_file(MODULE_BINARY)
         module = wasm_module_new(self._wasm_store, binary)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import os
+import tempfile
+import unittest
+
+import wamr.ffi as ffi
+from wamr import Engine, Module
+from wamr.cache import SUFFIX, ModuleCache, SharedModuleCache
+
+# It is a module likes:
+# (module
+#   (func (export "add") (param i32 i32) (result i32)
+#     (i32.add (local.get 0) (local.get 1)))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x07\x01`\x02\x7f\x7f\x01\x7f\x03\x02\x01"
+    b"\x00\x07\x07\x01\x03add\x00\x00\n\t\x01\x07\x00 \x00 \x01j\x0b"
+)
+
+# (module (memory 1))
+OTHER_BINARY = b"\x00asm\x01\x00\x00\x00\x05\x03\x01\x00\x01"
+
+
+class CacheTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def setUp(self):
+        self.workspace = tempfile.TemporaryDirectory()
+        self.cache = ModuleCache(self.workspace.name)
+
+    def tearDown(self):
+        self.workspace.cleanup()
+
+    def load(self, cache, source):
+        module = cache.load(self._wasm_store, source)
+        self.assertFalse(ffi.is_null_pointer(module))
+        ffi.wasm_module_delete(module)
+
+    def test_key(self):
+        key = self.cache.key(MODULE_BINARY)
+        self.assertEqual(key, self.cache.key(bytearray(MODULE_BINARY)))
+        self.assertNotEqual(key, self.cache.key(OTHER_BINARY))
+        self.assertEqual(len(key), 64)
+
+    def test_miss_then_hit(self):
+        self.load(self.cache, MODULE_BINARY)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        entries = self.cache.entries()
+        if not entries:
+            self.skipTest("wasm_module_serialize() is not supported by the library")
+
+        self.assertEqual(
+            os.path.basename(entries[0][0]), self.cache.key(MODULE_BINARY) + SUFFIX
+        )
+
+        # another process sharing the directory
+        cache = ModuleCache(self.workspace.name)
+        self.load(cache, MODULE_BINARY)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_path(self):
+        path = os.path.join(self.workspace.name, "add.wasm")
+        with open(path, "wb") as module_file:
+            module_file.write(MODULE_BINARY)
+
+        self.load(self.cache, path)
+        self.load(self.cache, MODULE_BINARY)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_broken_entry(self):
+        with open(self.cache.path(self.cache.key(MODULE_BINARY)), "wb") as entry:
+            entry.write(b"not a module")
+
+        self.load(self.cache, MODULE_BINARY)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_eviction(self):
+        self.load(self.cache, MODULE_BINARY)
+        self.load(self.cache, OTHER_BINARY)
+        entries = self.cache.entries()
+        if len(entries) < 2:
+            self.skipTest("wasm_module_serialize() is not supported by the library")
+
+        # room for the newest one only
+        self.cache.max_bytes = entries[-1][1]
+        self.cache.evict()
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.entries()[0][0], entries[-1][0])
+
+    def test_invalid_binary(self):
+        module = self.cache.load(self._wasm_store, b"\x00asm\x01\x00\x00\x00\xff")
+        self.assertTrue(ffi.is_null_pointer(module))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_module(self):
+        engine = Engine()
+        module = Module(engine, MODULE_BINARY, self.cache)
+        self.assertEqual(list(module.exports), ["add"])
+        self.assertEqual(self.cache.misses, 1)
+
+        module = Module.from_file(engine, MODULE_BINARY, self.cache)
+        self.assertEqual(self.cache.hits + self.cache.misses, 2)
+
+    def test_clear(self):
+        self.load(self.cache, MODULE_BINARY)
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+
+
+class SharedCacheTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def setUp(self):
+        self.cache = SharedModuleCache()
+
+    def tearDown(self):
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_shared(self):
+        first = self.cache.load(self._wasm_store, MODULE_BINARY)
+        self.assertFalse(ffi.is_null_pointer(first))
+        second = self.cache.load(self._wasm_store, bytearray(MODULE_BINARY))
+        self.assertEqual(c.addressof(first.contents), c.addressof(second.contents))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.references(first), 2)
+        self.assertEqual(self.cache.size(), len(MODULE_BINARY))
+
+        self.cache.release(first)
+        self.cache.release(second)
+        with self.assertRaises(RuntimeError):
+            self.cache.release(first)
+
+    def test_in_use_is_kept(self):
+        self.cache.max_entries = 1
+        module = self.cache.load(self._wasm_store, MODULE_BINARY)
+        other = self.cache.load(self._wasm_store, OTHER_BINARY)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.evictions, 0)
+
+        self.cache.release(module)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.references(other), 1)
+        self.cache.release(other)
+
+    def test_byte_bound(self):
+        self.cache.max_bytes = len(MODULE_BINARY)
+        self.cache.release(self.cache.load(self._wasm_store, MODULE_BINARY))
+        self.cache.release(self.cache.load(self._wasm_store, OTHER_BINARY))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.size(), len(OTHER_BINARY))
+
+        self.cache.release(self.cache.load(self._wasm_store, MODULE_BINARY))
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_invalid_binary(self):
+        module = self.cache.load(self._wasm_store, b"\x00asm\x01\x00\x00\x00\xff")
+        self.assertTrue(ffi.is_null_pointer(module))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_module(self):
+        engine = Engine()
+        first = Module(engine, MODULE_BINARY, self.cache)
+        second = Module(engine, MODULE_BINARY, self.cache)
+        self.assertEqual(
+            c.addressof(first.pointer.contents),
+            c.addressof(second.pointer.contents),
+        )
+
+        pointer = first.pointer
+        del first
+        self.assertEqual(self.cache.references(pointer), 1)
+        second.delete()
+        self.assertEqual(self.cache.references(pointer), 0)
+        # before the engine
+        self.cache.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import itertools
+import tracemalloc
+import unittest
+
+import wamr.ffi as ffi
+from wamr.call import CallFrame, FrameCache, Trap, signature, specialize
+
+# It is a module likes:
+# (module
+#   (func (export "add") (param i32 i32) (result i32)
+#     (i32.add (local.get 0) (local.get 1)))
+#   (func (export "div") (param i32 i32) (result i32)
+#     (i32.div_s (local.get 0) (local.get 1)))
+#   (func (export "swap") (param i64 f64) (result f64 i64)
+#     (local.get 1) (local.get 0))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x0e\x02`\x02\x7f\x7f\x01\x7f`\x02~|\x02"
+    b"|~\x03\x04\x03\x00\x00\x01\x07\x14\x03\x03add\x00\x00\x03div\x00\x01"
+    b"\x04swap\x00\x02\n\x18\x03\x07\x00 \x00 \x01j\x0b\x07\x00 \x00 \x01m"
+    b"\x0b\x06\x00 \x01 \x00\x0b"
+)
+
+
+class CallTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def setUp(self):
+        self.module = ffi.load_module(self._wasm_store, MODULE_BINARY)
+        self.imports = ffi.wasm_extern_vec_t()
+        ffi.wasm_extern_vec_new_empty(self.imports)
+        self.instance = ffi.wasm_instance_new(
+            self._wasm_store,
+            self.module,
+            self.imports,
+            ffi.create_null_pointer(ffi.wasm_trap_t),
+        )
+        self.exports = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(self.instance, self.exports)
+
+        self.add = ffi.wasm_extern_as_func(self.exports.data[0])
+        self.div = ffi.wasm_extern_as_func(self.exports.data[1])
+        self.swap = ffi.wasm_extern_as_func(self.exports.data[2])
+
+    def tearDown(self):
+        ffi.wasm_extern_vec_delete(self.exports)
+        ffi.wasm_extern_vec_delete(self.imports)
+        ffi.wasm_instance_delete(self.instance)
+        ffi.wasm_module_delete(self.module)
+
+    def test_signature(self):
+        self.assertEqual(
+            signature(self.add), ((ffi.WASM_I32, ffi.WASM_I32), (ffi.WASM_I32,))
+        )
+
+    def test_call(self):
+        frame = CallFrame(self.add)
+        frame.set_i32(0, 40)
+        frame.set(1, 2)
+        self.assertIsNone(frame.call())
+        self.assertEqual(frame.get_i32(0), 42)
+
+        # arguments stay in the frame
+        frame.set_i32(0, -3)
+        self.assertIsNone(frame.call())
+        self.assertEqual(frame.get(0), -1)
+
+    def test_call_trap(self):
+        frame = CallFrame(self.div)
+        frame.set_i32(0, 1)
+        frame.set_i32(1, 0)
+
+        trap = frame.call()
+        self.assertIsNotNone(trap)
+        self.assertFalse(ffi.is_null_pointer(trap))
+        ffi.wasm_trap_delete(trap)
+
+    def test_null_func(self):
+        with self.assertRaises(RuntimeError):
+            CallFrame(ffi.create_null_pointer(ffi.wasm_func_t))
+
+    def test_frame_cache(self):
+        cache = FrameCache()
+        frame = cache.frame(self.add)
+        self.assertIs(cache.frame(ffi.wasm_extern_as_func(self.exports.data[0])), frame)
+        self.assertIsNot(cache.frame(self.div), frame)
+        self.assertEqual(len(cache), 2)
+
+        cache.discard(self.div)
+        self.assertNotIn(self.div, cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_no_allocation_in_steady_state(self):
+        # pylint: disable=protected-access
+        frame = FrameCache().frame(self.add)
+        bare_call = frame._call
+        bare_args = (frame.func, frame._params_ptr, frame._results_ptr)
+
+        def bare(count):
+            for _ in itertools.repeat(None, count):
+                bare_call(*bare_args)
+
+        def steady(count):
+            for _ in itertools.repeat(None, count):
+                frame.set_i32(0, 40)
+                frame.set_i32(1, 2)
+                frame.call()
+                frame.get_i32(0)
+
+        def transient(run):
+            # the warm up creates the foreign function and caches
+            run(10)
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            run(10_000)
+            _, peak = tracemalloc.get_traced_memory()
+            return peak - current
+
+        tracemalloc.start()
+        try:
+            # ctypes allocates and frees an argument object per pointer it
+            # passes, no set, call or get may allocate anything on top of it
+            self.assertLessEqual(transient(steady), transient(bare))
+        finally:
+            tracemalloc.stop()
+
+    def test_specialize(self):
+        add = specialize(self.add)
+        self.assertEqual(add(40, 2), 42)
+        self.assertEqual(add(-1, -1), -2)
+        self.assertIsInstance(add.frame, CallFrame)
+
+    def test_specialize_multi_value(self):
+        swap = specialize(self.swap)
+        self.assertEqual(swap(2**40, 0.5), (0.5, 2**40))
+
+    def test_specialize_trap(self):
+        div = specialize(self.div)
+        self.assertEqual(div(7, 2), 3)
+
+        with self.assertRaises(Trap):
+            div(1, 0)
+
+        # still usable after a trap
+        self.assertEqual(div(-8, 2), -4)
+
+    def test_specialize_shares_code(self):
+        add = specialize(self.add)
+        div = specialize(self.div)
+        self.assertIs(add.__code__, div.__code__)
+        self.assertIsNot(add.frame, div.frame)
+        self.assertIsNot(add.__code__, specialize(self.swap).__code__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import unittest
+
+import numpy
+
+import wamr.ffi as ffi
+from wamr.call import Trap
+from wamr.values import call_many
+
+# The module of tests/test_call.py
+# (module
+#   (func (export "add") (param i32 i32) (result i32)
+#     (i32.add (local.get 0) (local.get 1)))
+#   (func (export "div") (param i32 i32) (result i32)
+#     (i32.div_s (local.get 0) (local.get 1)))
+#   (func (export "swap") (param i64 f64) (result f64 i64)
+#     (local.get 1) (local.get 0))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x0e\x02`\x02\x7f\x7f\x01\x7f`\x02~|\x02"
+    b"|~\x03\x04\x03\x00\x00\x01\x07\x14\x03\x03add\x00\x00\x03div\x00\x01"
+    b"\x04swap\x00\x02\n\x18\x03\x07\x00 \x00 \x01j\x0b\x07\x00 \x00 \x01m"
+    b"\x0b\x06\x00 \x01 \x00\x0b"
+)
+
+
+class CallManyTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def setUp(self):
+        self.module = ffi.load_module(self._wasm_store, MODULE_BINARY)
+        self.imports = ffi.wasm_extern_vec_t()
+        ffi.wasm_extern_vec_new_empty(self.imports)
+        self.instance = ffi.wasm_instance_new(
+            self._wasm_store,
+            self.module,
+            self.imports,
+            ffi.create_null_pointer(ffi.wasm_trap_t),
+        )
+        self.exports = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(self.instance, self.exports)
+
+        self.add = ffi.wasm_extern_as_func(self.exports.data[0])
+        self.div = ffi.wasm_extern_as_func(self.exports.data[1])
+        self.swap = ffi.wasm_extern_as_func(self.exports.data[2])
+
+    def tearDown(self):
+        ffi.wasm_extern_vec_delete(self.exports)
+        ffi.wasm_extern_vec_delete(self.imports)
+        ffi.wasm_instance_delete(self.instance)
+        ffi.wasm_module_delete(self.module)
+
+    def test_call_many(self):
+        a = numpy.arange(1000, dtype="int32")
+        b = numpy.full(1000, 7, dtype="int32")
+
+        results = call_many(self.add, [a, b])
+        self.assertEqual(results.dtype, numpy.int32)
+        self.assertTrue(numpy.array_equal(results, a + 7))
+
+        # a 2-D array, a column per param
+        results = call_many(self.add, numpy.stack([a, b], axis=1))
+        self.assertTrue(numpy.array_equal(results, a + 7))
+
+    def test_call_many_multi_value(self):
+        a = numpy.arange(4, dtype="int64") << 40
+        b = numpy.linspace(0, 1, 4)
+
+        floats, ints = call_many(self.swap, [a, b])
+        self.assertTrue(numpy.array_equal(floats, b))
+        self.assertTrue(numpy.array_equal(ints, a))
+
+    def test_call_many_trap(self):
+        with self.assertRaisesRegex(Trap, "at row 2"):
+            call_many(self.div, [[4, 4, 4], [2, 1, 0]])
+
+    def test_call_many_mismatched_columns(self):
+        with self.assertRaises(RuntimeError):
+            call_many(self.add, [[1, 2]])
+
+        with self.assertRaises(RuntimeError):
+            call_many(self.add, [[1, 2], [3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import threading
+import unittest
+
+import wamr.ffi as ffi
+from wamr import *
+from wamr import runtime
+from wamr.executor import WasmExecutor
+
+# It is a module likes:
+# (module
+#   (func (export "spin") (param $n i32) (result i32) (local $acc i32)
+#     (loop $l
+#       (local.set $acc (i32.add (local.get $acc) (local.get $n)))
+#       (br_if $l (local.tee $n (i32.sub (local.get $n) (i32.const 1)))))
+#     (local.get $acc))
+# )
+SPIN_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01\x7f\x01\x7f\x03\x02\x01\x00\x07"
+    b"\x08\x01\x04spin\x00\x00\n\x1b\x01\x19\x01\x01\x7f\x03@ \x01 \x00j!\x01 "
+    b'\x00A\x01k"\x00\r\x00\x0b \x01\x0b'
+)
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+# )
+DOUBLE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x07\x07\x01\x03run\x00\x01\n\x08\x01\x06"
+    b"\x00 \x00\x10\x00\x0b"
+)
+
+WORKERS = 3
+
+
+class ExecutorTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._engine = Engine()
+        cls._module = Module(cls._engine, SPIN_BINARY)
+
+    def setUp(self):
+        self.executor = WasmExecutor(self._engine, self._module, max_workers=WORKERS)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_submit(self):
+        self.assertEqual(self.executor.submit("spin", 3).result(), 6)
+
+    def test_map(self):
+        self.assertEqual(list(self.executor.map("spin", [1, 2, 3, 4])), [1, 3, 6, 10])
+
+    def test_callable(self):
+        def spin_twice(instance, value):
+            spin = instance.export(instance.store, "spin")
+            return spin(instance.store, value) + spin(instance.store, value)
+
+        self.assertEqual(self.executor.submit(spin_twice, 3).result(), 12)
+
+    def test_thread_env(self):
+        inited = self.executor.submit(
+            lambda instance: runtime.wasm_runtime_thread_env_inited()
+        )
+        self.assertTrue(inited.result())
+
+    def test_instance_per_worker(self):
+        barrier = threading.Barrier(WORKERS)
+
+        def meet(instance):
+            # every worker holds one call
+            barrier.wait(timeout=5)
+            return id(instance), id(instance.store)
+
+        futures = [self.executor.submit(meet) for _ in range(WORKERS)]
+        results = [future.result() for future in futures]
+        self.assertEqual(len({instance for instance, _ in results}), WORKERS)
+        self.assertEqual(len({store for _, store in results}), WORKERS)
+
+    def test_exception(self):
+        with self.assertRaises(KeyError):
+            self.executor.submit("missing").result()
+
+        # the worker is still alive
+        self.assertEqual(self.executor.submit("spin", 1).result(), 1)
+
+    def test_shutdown(self):
+        self.executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.executor.submit("spin", 1)
+
+    def test_imports(self):
+        stores = []
+
+        def imports(store):
+            stores.append(store)
+            return [
+                Func(store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2)
+            ]
+
+        module = Module(self._engine, DOUBLE_BINARY)
+        with WasmExecutor(self._engine, module, imports, max_workers=2) as executor:
+            self.assertEqual(executor.submit("run", 1.5).result(), 3.0)
+
+        self.assertEqual(len(stores), 2)
+
+    def test_failed_setup(self):
+        module = Module(self._engine, DOUBLE_BINARY)
+        with WasmExecutor(self._engine, module, max_workers=1) as executor:
+            with self.assertRaises((RuntimeError, Trap)):
+                executor.submit("run", 1.5).result()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=protected-access
+
+import ctypes as c
+import unittest
+
+import wamr.ffi as ffi
+from wamr import binding
+
+
+def holds_gil(func):
+    return bool(func._flags_ & c._FUNCFLAG_PYTHONAPI)
+
+
+class GILTestSuite(unittest.TestCase):
+    def test_hold_gil_accessors(self):
+        for name in ("wasm_valtype_kind", "wasm_extern_kind", "wasm_memory_size"):
+            self.assertIn(name, binding._HOLD_GIL)
+            self.assertTrue(holds_gil(getattr(ffi, name)), name)
+
+    def test_release_gil_long_running(self):
+        for name in ("wasm_func_call", "wasm_module_new", "wasm_instance_new"):
+            self.assertNotIn(name, binding._HOLD_GIL)
+            self.assertFalse(holds_gil(getattr(ffi, name)), name)
+
+    def test_hold_gil_same_library(self):
+        self.assertEqual(
+            ffi.load_library(hold_gil=True)._handle, ffi.load_library()._handle
+        )
+
+    def test_hold_gil_call(self):
+        valtype = ffi.wasm_valtype_new(ffi.WASM_F32)
+        self.assertEqual(ffi.wasm_valtype_kind(valtype), ffi.WASM_F32)
+        ffi.wasm_valtype_delete(valtype)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+from functools import partial
+import unittest
+
+import wamr.ffi as ffi
+from wamr.call import Trap, specialize
+from wamr.host import HostFunction, Registry, host_function
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x07\x07\x01\x03run\x00\x01\n\x08\x01\x06"
+    b"\x00 \x00\x10\x00\x0b"
+)
+
+
+@host_function([ffi.WASM_F32], [ffi.WASM_F64])
+def double(value):
+    return value * 2.0
+
+
+@host_function([ffi.WASM_F32], [ffi.WASM_F64])
+def fail(value):
+    raise ValueError(f"can't take {value}")
+
+
+class HostTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+        cls._module = ffi.load_module(cls._wasm_store, MODULE_BINARY)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_module_delete(cls._module)
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def instantiate(self, host, registry=None, func=None):
+        if registry is None:
+            func = host.new(self._wasm_store)
+        else:
+            func = registry.new(self._wasm_store, host, func)
+        self.assertFalse(ffi.is_null_pointer(func))
+
+        imports = ffi.wasm_extern_vec_t()
+        data = ffi.list_to_carray(
+            c.POINTER(ffi.wasm_extern_t), ffi.wasm_func_as_extern(func)
+        )
+        ffi.wasm_extern_vec_new(imports, 1, data)
+        instance = ffi.wasm_instance_new(
+            self._wasm_store,
+            self._module,
+            imports,
+            ffi.create_null_pointer(ffi.wasm_trap_t),
+        )
+        exports = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(instance, exports)
+
+        def cleanup():
+            ffi.wasm_extern_vec_delete(exports)
+            ffi.wasm_instance_delete(instance)
+            ffi.wasm_extern_vec_delete(imports)
+
+        self.addCleanup(cleanup)
+        return specialize(ffi.wasm_extern_as_func(exports.data[0]))
+
+    def test_decorator(self):
+        self.assertIsInstance(double, HostFunction)
+        self.assertEqual(double.__name__, "double")
+        self.assertEqual(double(1.5), 3.0)
+
+    def test_functype(self):
+        func_type = double.functype()
+        expected = ffi.wasm_functype_new_1_1(
+            ffi.wasm_valtype_new(ffi.WASM_F32), ffi.wasm_valtype_new(ffi.WASM_F64)
+        )
+        self.assertEqual(func_type.contents, expected.contents)
+        ffi.wasm_functype_delete(expected)
+        ffi.wasm_functype_delete(func_type)
+
+    def test_callback_per_store(self):
+        callback = double.callback(self._wasm_store)
+        self.assertIs(double.callback(self._wasm_store), callback)
+
+    def test_round_trip(self):
+        run = self.instantiate(double)
+        self.assertEqual(run(1.25), 2.5)
+        self.assertEqual(run(-4.0), -8.0)
+
+    def test_multi_value(self):
+        @host_function([ffi.WASM_I32, ffi.WASM_I64], [ffi.WASM_I64, ffi.WASM_I32])
+        def swap(a, b):
+            return b, a
+
+        func = swap.new(self._wasm_store)
+        call = specialize(func)
+        self.assertEqual(call(7, 2**40), (2**40, 7))
+        ffi.wasm_func_delete(func)
+
+    def test_exception_as_trap(self):
+        run = self.instantiate(fail)
+        with self.assertRaisesRegex(Trap, "ValueError"):
+            run(1.0)
+
+    def test_unsupported_kind(self):
+        with self.assertRaises(RuntimeError):
+            host_function([ffi.WASM_ANYREF], [])(lambda ref: None)
+
+    def test_registry_round_trip(self):
+        registry = Registry()
+
+        def scale(factor, value):
+            return value * factor
+
+        run_2 = self.instantiate(double, registry, partial(scale, 2.0))
+        run_3 = self.instantiate(double, registry, partial(scale, 3.0))
+        self.assertEqual(run_2(1.5), 3.0)
+        self.assertEqual(run_3(1.5), 4.5)
+        self.assertEqual(len(registry), 2)
+
+    def test_registry_release_by_finalizer(self):
+        registry = Registry()
+        funcs = [registry.new(self._wasm_store, double) for _ in range(100)]
+        self.assertEqual(len(registry), 100)
+
+        for func in funcs:
+            ffi.wasm_func_delete(func)
+        self.assertEqual(len(registry), 0)
+
+        # slots are reused
+        func = registry.new(self._wasm_store, double)
+        self.assertEqual(len(registry), 1)
+        ffi.wasm_func_delete(func)
+
+    def test_registry_failure(self):
+        registry = Registry()
+        func = registry.new_with_env(
+            self._wasm_store,
+            ffi.create_null_pointer(ffi.wasm_functype_t),
+            lambda args, results: None,
+        )
+        self.assertTrue(ffi.is_null_pointer(func))
+        self.assertEqual(len(registry), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
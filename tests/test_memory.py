@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import struct
+import unittest
+
+import wamr.ffi as ffi
+from wamr.memory import LinearMemory
+
+# It is a module likes:
+# (module
+#   (memory (export "mem") 1 3)
+#   (func (export "grow") (result i32) (memory.grow (i32.const 1)))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x05\x01`\x00\x01\x7f\x03\x02\x01\x00"
+    b"\x05\x04\x01\x01\x01\x03\x07\x0e\x02\x03mem\x02\x00\x04grow\x00\x00"
+    b"\x0a\x08\x01\x06\x00\x41\x01\x40\x00\x0b"
+)
+
+PAGE_SIZE = 65536
+
+
+class MemoryTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._wasm_engine = ffi.wasm_engine_new()
+        cls._wasm_store = ffi.wasm_store_new(cls._wasm_engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        ffi.wasm_store_delete(cls._wasm_store)
+        ffi.wasm_engine_delete(cls._wasm_engine)
+
+    def setUp(self):
+        self.module = ffi.load_module(self._wasm_store, MODULE_BINARY)
+        self.imports = ffi.wasm_extern_vec_t()
+        ffi.wasm_extern_vec_new_empty(self.imports)
+        self.instance = ffi.wasm_instance_new(
+            self._wasm_store,
+            self.module,
+            self.imports,
+            ffi.create_null_pointer(ffi.wasm_trap_t),
+        )
+        self.exports = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(self.instance, self.exports)
+
+        self.memory = LinearMemory(self.exports.data[0])
+
+    def tearDown(self):
+        ffi.wasm_extern_vec_delete(self.exports)
+        ffi.wasm_extern_vec_delete(self.imports)
+        ffi.wasm_instance_delete(self.instance)
+        ffi.wasm_module_delete(self.module)
+
+    def guest_grow(self):
+        func = ffi.wasm_extern_as_func(self.exports.data[1])
+        params = ffi.wasm_val_vec_t()
+        ffi.wasm_val_vec_new_empty(params)
+        results = ffi.wasm_val_vec_t()
+        ffi.wasm_val_vec_new_uninitialized(results, 1)
+
+        trap = ffi.wasm_func_call(func, params, results)
+        self.assertTrue(ffi.is_null_pointer(trap))
+        previous_pages = results.data[0].of.i32
+        ffi.wasm_val_vec_delete(results)
+        return previous_pages
+
+    def test_view(self):
+        view = self.memory.view()
+        self.assertEqual(len(view), PAGE_SIZE)
+        self.assertFalse(view.readonly)
+
+        view[16:20] = b"wamr"
+        data = ffi.wasm_memory_data(self.memory.memory)
+        self.assertEqual(bytes(data[16:20]), b"wamr")
+
+        self.assertIs(self.memory.view(), view)
+
+    def test_ndarray(self):
+        array = self.memory.ndarray("<i4", offset=8, shape=(2, 4))
+        self.assertEqual(array.shape, (2, 4))
+
+        array[1, 1] = -2
+        data = c.cast(ffi.wasm_memory_data(self.memory.memory), c.POINTER(c.c_int32))
+        self.assertEqual(data[2 + 4 + 1], -2)
+
+    def test_ndarray_out_of_memory(self):
+        with self.assertRaises(IndexError):
+            self.memory.ndarray("uint8", offset=PAGE_SIZE + 1)
+
+        with self.assertRaises(IndexError):
+            self.memory.ndarray("float64", offset=PAGE_SIZE - 8, shape=2)
+
+    def test_grow(self):
+        view = self.memory.view()
+        generation = self.memory.generation
+
+        self.assertTrue(self.memory.grow(1))
+        self.assertEqual(self.memory.pages, 2)
+        self.assertGreater(self.memory.generation, generation)
+        self.assertEqual(len(self.memory.view()), 2 * PAGE_SIZE)
+
+        with self.assertRaises(ValueError):
+            view[0]
+
+    def test_grow_by_guest(self):
+        view = self.memory.view()
+        self.assertFalse(self.memory.stale)
+
+        self.assertEqual(self.guest_grow(), 1)
+        self.assertTrue(self.memory.stale)
+
+        self.assertEqual(len(self.memory.view()), 2 * PAGE_SIZE)
+        self.assertFalse(self.memory.stale)
+        with self.assertRaises(ValueError):
+            view[0]
+
+    def test_grow_over_max(self):
+        self.assertFalse(self.memory.grow(3))
+        self.assertEqual(len(self.memory.view()), PAGE_SIZE)
+
+    def test_read_write(self):
+        self.assertEqual(self.memory.write(32, b"hello"), 5)
+        self.assertEqual(self.memory.read(32, 5), b"hello")
+
+        self.memory.write(40, bytearray(b"abc"))
+        self.memory.write(43, memoryview(b"def"))
+        buffer = bytearray(6)
+        self.assertEqual(self.memory.read_into(40, buffer), 6)
+        self.assertEqual(buffer, b"abcdef")
+
+    def test_fill_copy_within(self):
+        self.memory.fill(0, 0x5A, 8)
+        self.assertEqual(self.memory.read(0, 9), b"Z" * 8 + b"\x00")
+
+        self.memory.write(100, b"0123456789")
+        self.memory.copy_within(102, 100, 6)
+        self.assertEqual(self.memory.read(100, 10), b"0101234589")
+
+    def test_pack_unpack(self):
+        records = [(i, -i, i / 4) for i in range(100)]
+
+        # standard sizes in one call, native ones record by record
+        for layout in ("<iif", struct.Struct("<iif"), "iif"):
+            self.assertEqual(self.memory.pack_into(layout, 1024, records), 100 * 12)
+            self.assertEqual(self.memory.unpack_from(layout, 1024, 100), records)
+
+    def test_pack_wrong_field_count(self):
+        for layout in ("<ii", "ii"):
+            with self.assertRaises(struct.error):
+                self.memory.pack_into(layout, 0, [(1, 2, 3), (4,)])
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            self.memory.read(PAGE_SIZE - 2, 4)
+
+        with self.assertRaises(IndexError):
+            self.memory.write(-1, b"x")
+
+        with self.assertRaises(IndexError):
+            self.memory.fill(PAGE_SIZE, 0, 1)
+
+        with self.assertRaises(IndexError):
+            self.memory.copy_within(0, PAGE_SIZE - 1, 2)
+
+        with self.assertRaises(IndexError):
+            self.memory.unpack_from("<q", PAGE_SIZE - 8, 2)
+
+    def test_bulk_after_grow(self):
+        self.guest_grow()
+        self.memory.write(PAGE_SIZE + 8, b"grown")
+        self.assertEqual(self.memory.read(PAGE_SIZE + 8, 5), b"grown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import gc
+import os
+import unittest
+import weakref
+
+import wamr.ffi as ffi
+from wamr import *
+from wamr.exports import ExportEntry, ExportIndex
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+#   (memory (export "mem") 1)
+#   (global (export "counter") (mut i32) (i32.const 7))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x05\x03\x01\x00\x01\x06\x06\x01\x7f\x01A"
+    b"\x07\x0b\x07\x17\x03\x03run\x00\x01\x03mem\x02\x00\x07counter\x03\x00\n"
+    b"\x08\x01\x06\x00 \x00\x10\x00\x0b"
+)
+
+HELLO_WASM = os.path.join(os.path.dirname(__file__), "..", "examples", "hello.wasm")
+
+
+class OOPTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._engine = Engine()
+        cls._module = Module(cls._engine, MODULE_BINARY)
+
+    def setUp(self):
+        self.store = Store(self._engine)
+        self.double = Func(
+            self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2
+        )
+        self.instance = Instance(self.store, self._module, [self.double])
+
+    def test_exports(self):
+        exports = self.instance.exports(self.store)
+        self.assertEqual(list(exports), ["run", "mem", "counter"])
+        self.assertIsInstance(exports["run"], Func)
+        self.assertIsInstance(exports["mem"], Memory)
+        self.assertIsInstance(exports["counter"], Global)
+
+        # built once
+        self.assertIs(self.instance.exports(self.store), exports)
+        self.assertIs(self.instance.exports(self.store)["run"], exports["run"])
+
+        with self.assertRaises(TypeError):
+            exports["run"] = None
+
+    def test_export_index(self):
+        index = self._module.exports
+        self.assertEqual(list(index), ["run", "mem", "counter"])
+        self.assertEqual(
+            index["run"],
+            ExportEntry(0, ffi.WASM_EXTERN_FUNC, ((ffi.WASM_F32,), (ffi.WASM_F64,))),
+        )
+        # the maximum of (memory 1) depends on the runtime
+        self.assertEqual(index["mem"][:2], (1, ffi.WASM_EXTERN_MEMORY))
+        self.assertEqual(index["mem"].type[0], 1)
+        self.assertEqual(
+            index["counter"],
+            ExportEntry(2, ffi.WASM_EXTERN_GLOBAL, (ffi.WASM_I32, True)),
+        )
+        self.assertEqual(index.names(ffi.WASM_EXTERN_FUNC), ["run"])
+        self.assertNotIn("missing", index)
+
+    def test_export_by_name(self):
+        counter = self.instance.export(self.store, "counter")
+        self.assertIsInstance(counter, Global)
+        self.assertIs(self.instance.export(self.store, "counter"), counter)
+        self.assertIs(self.instance.exports(self.store)["counter"], counter)
+
+        with self.assertRaises(KeyError):
+            self.instance.export(self.store, "missing")
+
+    def test_export_index_procedural(self):
+        index = ExportIndex(self._module.pointer)
+        externs = ffi.wasm_extern_vec_t()
+        ffi.wasm_instance_exports(self.instance.pointer, externs)
+
+        memory = index.extern(externs, "mem")
+        self.assertEqual(ffi.wasm_extern_kind(memory), ffi.WASM_EXTERN_MEMORY)
+        ffi.wasm_extern_vec_delete(externs)
+
+    def test_call(self):
+        run = self.instance.exports(self.store)["run"]
+        self.assertEqual(run.params, (ffi.WASM_F32,))
+        self.assertEqual(run.results, (ffi.WASM_F64,))
+        self.assertEqual(run(self.store, 1.5), 3.0)
+
+        # calls a host function directly
+        self.assertEqual(self.double(self.store, 2.0), 4.0)
+
+    def test_call_with_another_store(self):
+        run = self.instance.exports(self.store)["run"]
+        with self.assertRaises(RuntimeError):
+            run(Store(self._engine), 1.5)
+
+    def test_trap(self):
+        def fail(value):
+            raise ValueError(value)
+
+        failing = Func(self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), fail)
+        instance = Instance(self.store, self._module, [failing])
+        with self.assertRaises(Trap):
+            instance.exports(self.store)["run"](self.store, 1.0)
+
+    def test_global(self):
+        counter = self.instance.exports(self.store)["counter"]
+        self.assertEqual(counter.kind, ffi.WASM_I32)
+        self.assertTrue(counter.mutable)
+        self.assertEqual(counter.value, 7)
+
+        counter.value = 42
+        self.assertEqual(counter.value, 42)
+
+    def test_memory(self):
+        memory = self.instance.exports(self.store)["mem"]
+        memory.write(0, b"wamr")
+        self.assertEqual(memory.read(0, 4), b"wamr")
+
+    def test_export_outlives_instance(self):
+        run = Instance(self.store, self._module, [self.double]).exports(self.store)[
+            "run"
+        ]
+        gc.collect()
+        self.assertEqual(run(self.store, 0.5), 1.0)
+
+    def test_export_no_cycle(self):
+        instance = Instance(self.store, self._module, [self.double])
+        run = instance.export(self.store, "run")
+        self.assertIs(run.instance, instance)
+
+        # deleted by reference counting, not by the cyclic GC
+        alive = weakref.ref(instance)
+        gc.disable()
+        try:
+            del instance
+            self.assertIsNone(alive())
+        finally:
+            gc.enable()
+
+        self.assertIsNone(run.instance)
+        self.assertEqual(run(self.store, 0.5), 1.0)
+
+    def test_missing_imports(self):
+        with self.assertRaises((RuntimeError, Trap)):
+            Instance(self.store, self._module, [])
+
+    def test_bad_module(self):
+        with self.assertRaises(RuntimeError):
+            Module(self._engine, b"\x00asm\x01\x00\x00\x00\xff")
+
+    def test_delete(self):
+        with Store(self._engine) as store:
+            func = Func(store, FuncType([], []), lambda: None)
+            func.delete()
+            func.delete()
+
+    def test_delete_with_dependents(self):
+        engine = Engine()
+        module = Module(engine, MODULE_BINARY)
+        store = Store(engine)
+        double = Func(store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2)
+        instance = Instance(store, module, [double])
+        handles = [engine._handle, module._handle, store._handle, instance._handle]
+
+        with engine:
+            module.delete()
+        # deferred, the store and the instance still depend on them
+        self.assertFalse(any(handle.deleted for handle in handles))
+        self.assertEqual(instance.export(store, "run")(store, 0.5), 1.0)
+
+        # with its exports, at once
+        instance.delete()
+        self.assertTrue(handles[3].deleted)
+        self.assertTrue(handles[1].deleted)
+        self.assertFalse(handles[0].deleted)
+
+        double.delete()
+        store.delete()
+        self.assertTrue(all(handle.deleted for handle in handles))
+
+    def test_hello(self):
+        called = []
+        store = Store(self._engine)
+        module = Module.from_file(self._engine, HELLO_WASM)
+        hello = Func(store, FuncType([], []), lambda: called.append(True))
+        instance = Instance(store, module, [hello])
+        self.assertIsNone(instance.exports(store)["run"](store))
+        self.assertEqual(called, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
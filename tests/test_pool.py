@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import threading
+import time
+import unittest
+
+import wamr.ffi as ffi
+from wamr import *
+from wamr.pool import InstancePool
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+#   (memory (export "mem") 1)
+#   (global (export "counter") (mut i32) (i32.const 7))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x05\x03\x01\x00\x01\x06\x06\x01\x7f\x01A"
+    b"\x07\x0b\x07\x17\x03\x03run\x00\x01\x03mem\x02\x00\x07counter\x03\x00\n"
+    b"\x08\x01\x06\x00 \x00\x10\x00\x0b"
+)
+
+
+class PoolTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._engine = Engine()
+        cls._module = Module(cls._engine, MODULE_BINARY)
+
+    def setUp(self):
+        self.store = Store(self._engine)
+        self.double = Func(
+            self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2
+        )
+        self.pool = InstancePool(
+            self.store, self._module, [self.double], min_size=2, max_size=3
+        )
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_prewarm(self):
+        self.assertEqual(self.pool.size, 2)
+        self.assertEqual(self.pool.idle, 2)
+        self.assertEqual(self.pool.created, 2)
+
+    def test_call(self):
+        with self.pool.checkout() as instance:
+            self.assertEqual(instance.export(self.store, "run")(self.store, 1.5), 3.0)
+
+        self.assertEqual(self.pool.created, 2)
+        self.assertEqual((self.pool.checkouts, self.pool.resets), (1, 1))
+
+    def test_reset(self):
+        with self.pool.checkout() as instance:
+            instance.export(self.store, "mem").write(0, b"dirty")
+            instance.export(self.store, "counter").value = 42
+
+        # the most recently used one again
+        with self.pool.checkout() as again:
+            self.assertIs(again, instance)
+            self.assertEqual(again.export(self.store, "mem").read(0, 5), b"\0" * 5)
+            self.assertEqual(again.export(self.store, "counter").value, 7)
+
+    def test_reset_after_trap(self):
+        def fail(value):
+            raise ValueError(value)
+
+        failing = Func(self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), fail)
+        pool = InstancePool(self.store, self._module, lambda: [failing], min_size=1)
+
+        with self.assertRaises(Trap):
+            with pool.checkout() as instance:
+                instance.export(self.store, "counter").value = 1
+                instance.export(self.store, "run")(self.store, 1.0)
+
+        self.assertEqual(pool.resets, 1)
+        with pool.checkout() as instance:
+            self.assertEqual(instance.export(self.store, "counter").value, 7)
+
+    def test_reset_failure(self):
+        class Broken:
+            def restore(self, instance):
+                raise RuntimeError("can't reset")
+
+        instances = [self.pool.acquire() for _ in range(3)]
+        # pylint: disable=protected-access
+        self.pool._pristine[instances[0]] = Broken()
+        with self.assertRaises(RuntimeError):
+            self.pool.release(instances[0])
+
+        # dropped, a new one takes its place
+        self.assertEqual(self.pool.size, 2)
+        with self.pool.checkout(timeout=0.01) as instance:
+            self.assertNotIn(instance, instances)
+        for instance in instances[1:]:
+            self.pool.release(instance)
+
+    def test_release_twice(self):
+        instance = self.pool.acquire()
+        self.pool.release(instance)
+        with self.assertRaises(ValueError):
+            self.pool.release(instance)
+
+        # still one entry each
+        self.assertEqual(self.pool.idle, 2)
+        self.assertIsNot(self.pool.acquire(), self.pool.acquire())
+
+    def test_release_unknown(self):
+        stranger = Instance(self.store, self._module, [self.double])
+        with self.assertRaises(ValueError):
+            self.pool.release(stranger)
+        self.assertEqual((self.pool.size, self.pool.idle), (2, 2))
+
+    def test_grow_to_max(self):
+        instances = [self.pool.acquire() for _ in range(3)]
+        self.assertEqual(len({id(instance) for instance in instances}), 3)
+        self.assertEqual(self.pool.size, 3)
+
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire(timeout=0.01)
+        self.assertEqual(self.pool.waits, 1)
+
+        for instance in instances:
+            self.pool.release(instance)
+        self.assertEqual(self.pool.idle, 3)
+
+    def test_wait(self):
+        instances = [self.pool.acquire() for _ in range(3)]
+        releaser = threading.Timer(0.05, self.pool.release, [instances[0]])
+        releaser.start()
+
+        with self.pool.checkout(timeout=5) as instance:
+            self.assertIs(instance, instances[0])
+        releaser.join()
+
+        self.assertEqual(self.pool.waits, 1)
+        self.assertGreater(self.pool.wait_time, 0)
+        for instance in instances[1:]:
+            self.pool.release(instance)
+
+    def test_trim(self):
+        instances = [self.pool.acquire() for _ in range(3)]
+        for instance in instances:
+            self.pool.release(instance)
+
+        self.assertEqual(self.pool.trim(), 0)
+        self.pool.idle_timeout = 0.01
+        time.sleep(0.02)
+        self.assertEqual(self.pool.trim(), 1)
+        self.assertEqual((self.pool.size, self.pool.trimmed), (2, 1))
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(RuntimeError):
+            InstancePool(self.store, self._module, [self.double], 2, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=protected-access
+
+import os
+import tempfile
+import unittest
+
+import numpy
+
+import wamr.ffi as ffi
+from wamr import Func, FuncType, Trap
+from wamr.process import ProcessPool
+
+# It is a module likes:
+# (module
+#   (func (export "add") (param i32 i32) (result i32)
+#     (i32.add (local.get 0) (local.get 1)))
+#   (func (export "div") (param i32 i32) (result i32)
+#     (i32.div_s (local.get 0) (local.get 1)))
+#   (func (export "swap") (param i64 f64) (result f64 i64)
+#     (local.get 1) (local.get 0))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x0e\x02`\x02\x7f\x7f\x01\x7f`\x02~|\x02"
+    b"|~\x03\x04\x03\x00\x00\x01\x07\x14\x03\x03add\x00\x00\x03div\x00\x01"
+    b"\x04swap\x00\x02\n\x18\x03\x07\x00 \x00 \x01j\x0b\x07\x00 \x00 \x01m"
+    b"\x0b\x06\x00 \x01 \x00\x0b"
+)
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+# )
+DOUBLE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x07\x07\x01\x03run\x00\x01\n\x08\x01\x06"
+    b"\x00 \x00\x10\x00\x0b"
+)
+
+
+def double_imports(store):
+    # pickled by reference, a worker imports this module
+    return [Func(store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2)]
+
+
+def affinity():
+    return sorted(os.sched_getaffinity(0))
+
+
+class ProcessPoolTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._pool = ProcessPool(MODULE_BINARY, processes=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._pool.close()
+
+    def test_submit(self):
+        self.assertEqual(self._pool.submit("add", 20, 22).result(), 42)
+        self.assertEqual(self._pool.submit("swap", 1, 2.5).result(), (2.5, 1))
+
+    def test_call_many(self):
+        lhs = numpy.arange(1000, dtype=numpy.int32)
+        rhs = numpy.full(1000, 3, dtype=numpy.int32)
+        numpy.testing.assert_array_equal(
+            self._pool.call_many("add", [lhs, rhs]), lhs + rhs
+        )
+        numpy.testing.assert_array_equal(
+            self._pool.call_many("add", numpy.stack([lhs, rhs], axis=1), 64),
+            lhs + rhs,
+        )
+
+    def test_call_many_multi_value(self):
+        floats, ints = self._pool.call_many(
+            "swap", [numpy.arange(10, dtype=numpy.int64), numpy.ones(10)]
+        )
+        numpy.testing.assert_array_equal(floats, numpy.ones(10))
+        numpy.testing.assert_array_equal(ints, numpy.arange(10))
+
+    def test_call_many_empty(self):
+        results = self._pool.call_many(
+            "add", [numpy.array([], numpy.int32), numpy.array([], numpy.int32)]
+        )
+        self.assertEqual(len(results), 0)
+
+    def test_trap(self):
+        with self.assertRaises(Trap) as context:
+            self._pool.call_many(
+                "div", [numpy.array([4, 6, 8, 10]), numpy.array([2, 2, 0, 1])], 2
+            )
+        self.assertIn("from row 2", str(context.exception))
+
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "no CPU affinity")
+    def test_affinity(self):
+        # a worker runs on one core
+        with ProcessPool(MODULE_BINARY, processes=1) as pool:
+            cores = pool._executor.submit(affinity).result()
+        self.assertEqual(len(cores), 1)
+
+    def test_imports(self):
+        with ProcessPool(DOUBLE_BINARY, double_imports, processes=1) as pool:
+            self.assertEqual(pool.submit("run", 1.5).result(), 3.0)
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as workspace:
+            with ProcessPool(MODULE_BINARY, processes=2, cache=workspace) as pool:
+                self.assertEqual(pool.submit("add", 1, 2).result(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
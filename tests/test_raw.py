@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import unittest
+
+import wamr.ffi as ffi
+from wamr.ffi import raw
+
+
+class RawTestSuite(unittest.TestCase):
+    def test_raw_handles_are_ints(self):
+        engine = raw.wasm_engine_new()
+        self.assertIsInstance(engine, int)
+        self.assertNotEqual(engine, 0)
+
+        store = raw.wasm_store_new(engine)
+        self.assertIsInstance(store, int)
+        self.assertNotEqual(store, 0)
+
+        raw.wasm_store_delete(store)
+
+    def test_raw_null(self):
+        valtype = raw.wasm_valtype_new(ffi.WASM_I32)
+        self.assertEqual(raw.wasm_valtype_kind(valtype), ffi.WASM_I32)
+        self.assertEqual(raw.wasm_valtype_copy(None), 0)
+        raw.wasm_valtype_delete(valtype)
+
+    def test_raw_from_ctypes(self):
+        valtype = ffi.wasm_valtype_new(ffi.WASM_F64)
+        addr = c.cast(valtype, c.c_void_p).value
+        self.assertEqual(raw.wasm_valtype_kind(addr), ffi.WASM_F64)
+        ffi.wasm_valtype_delete(valtype)
+
+    def test_raw_buffer_by_ref(self):
+        vec = ffi.wasm_byte_vec_t()
+        raw.wasm_byte_vec_new_uninitialized(c.byref(vec), 8)
+        self.assertEqual(vec.size, 8)
+        raw.wasm_byte_vec_delete(c.addressof(vec))
+
+    def test_raw_handle_only(self):
+        # pylint: disable=protected-access
+        self.assertTrue(raw.HANDLE_ONLY <= set(raw._PROTOTYPES))
+        self.assertIn("wasm_module_delete", raw.HANDLE_ONLY)
+        self.assertNotIn("wasm_func_call", raw.HANDLE_ONLY)
+        self.assertNotIn("wasm_func_new", raw.HANDLE_ONLY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import unittest
+
+import wamr.ffi as ffi
+from wamr.runtime import *
+
+# It is a module likes:
+# (module
+#   (func (export "add") (param i32 i32) (result i32)
+#     (i32.add (local.get 0) (local.get 1)))
+#   (func (export "trap") (unreachable))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x0a\x02`\x02\x7f\x7f\x01\x7f`\x00\x00"
+    b"\x03\x03\x02\x00\x01\x07\x0e\x02\x03add\x00\x00\x04trap\x00\x01"
+    b"\x0a\x0d\x02\x07\x00\x20\x00\x20\x01\x6a\x0b\x03\x00\x00\x0b"
+)
+
+
+class RuntimeTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # wasm_engine_new() initializes the runtime, the runtime API shares it
+        cls._wasm_engine = ffi.wasm_engine_new()
+
+        cls._binary = (c.c_uint8 * len(MODULE_BINARY)).from_buffer_copy(MODULE_BINARY)
+        error_buf = c.create_string_buffer(128)
+        cls._module = wasm_runtime_load(
+            cls._binary, len(MODULE_BINARY), error_buf, len(error_buf)
+        )
+        if not cls._module:
+            raise RuntimeError(error_buf.value)
+
+        cls._module_inst = wasm_runtime_instantiate(
+            cls._module, 8192, 0, error_buf, len(error_buf)
+        )
+        if not cls._module_inst:
+            raise RuntimeError(error_buf.value)
+
+        cls._exec_env = wasm_runtime_create_exec_env(cls._module_inst, 8192)
+
+    @classmethod
+    def tearDownClass(cls):
+        wasm_runtime_destroy_exec_env(cls._exec_env)
+        wasm_runtime_deinstantiate(cls._module_inst)
+        wasm_runtime_unload(cls._module)
+
+    def test_structures(self):
+        self.assertEqual(c.sizeof(NativeSymbol), 4 * c.sizeof(c.c_void_p))
+        self.assertEqual(c.sizeof(wasm_val_t), 16)
+        self.assertEqual(c.sizeof(RuntimeInitArgs.ip_addr), 128)
+
+        args = RuntimeInitArgs()
+        args.mem_alloc_type = Alloc_With_System_Allocator
+        args.running_mode = Mode_Interp
+        self.assertEqual(args.mem_alloc_option.pool.heap_size, 0)
+
+    def test_shared_types(self):
+        self.assertIs(wasm_module_t, ffi.wasm_module_t)
+        self.assertIs(wasm_val_t, ffi.wasm_val_t)
+
+    def test_lookup_function(self):
+        func = wasm_runtime_lookup_function(self._module_inst, b"add", None)
+        self.assertTrue(func)
+        self.assertEqual(wasm_func_get_param_count(func, self._module_inst), 2)
+        self.assertEqual(wasm_func_get_result_count(func, self._module_inst), 1)
+
+        param_types = (wasm_valkind_t * 2)()
+        wasm_func_get_param_types(func, self._module_inst, param_types)
+        self.assertEqual(list(param_types), [WASM_I32, WASM_I32])
+
+    def test_lookup_function_unknown(self):
+        self.assertFalse(wasm_runtime_lookup_function(self._module_inst, b"sub", None))
+
+    def test_call_wasm_a(self):
+        func = wasm_runtime_lookup_function(self._module_inst, b"add", None)
+        args = (wasm_val_t * 2)(ffi.wasm_i32_val(20), ffi.wasm_i32_val(22))
+        results = (wasm_val_t * 1)()
+
+        self.assertTrue(
+            wasm_runtime_call_wasm_a(self._exec_env, func, 1, results, 2, args)
+        )
+        self.assertEqual(results[0].kind, WASM_I32)
+        self.assertEqual(results[0].of.i32, 42)
+
+    def test_call_wasm_a_trap(self):
+        func = wasm_runtime_lookup_function(self._module_inst, b"trap", None)
+
+        self.assertFalse(
+            wasm_runtime_call_wasm_a(self._exec_env, func, 0, None, 0, None)
+        )
+        self.assertIn(b"unreachable", wasm_runtime_get_exception(self._module_inst))
+        wasm_runtime_clear_exception(self._module_inst)
+        self.assertIsNone(wasm_runtime_get_exception(self._module_inst))
+
+    def test_module_malloc(self):
+        native_addr = c.c_void_p()
+        offset = wasm_runtime_module_malloc(self._module_inst, 16, c.byref(native_addr))
+        # the module has no memory
+        self.assertEqual(offset, 0)
+        self.assertIsNone(native_addr.value)
+        wasm_runtime_clear_exception(self._module_inst)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import unittest
+
+import wamr.ffi as ffi
+from wamr import *
+from wamr.snapshot import Snapshot
+
+# It is a module likes:
+# (module
+#   (import "env" "double" (func $double (param f32) (result f64)))
+#   (func (export "run") (param f32) (result f64) (call $double (local.get 0)))
+#   (memory (export "mem") 1)
+#   (global (export "counter") (mut i32) (i32.const 7))
+# )
+MODULE_BINARY = (
+    b"\x00asm\x01\x00\x00\x00\x01\x06\x01`\x01}\x01|\x02\x0e\x01\x03env\x06"
+    b"double\x00\x00\x03\x02\x01\x00\x05\x03\x01\x00\x01\x06\x06\x01\x7f\x01A"
+    b"\x07\x0b\x07\x17\x03\x03run\x00\x01\x03mem\x02\x00\x07counter\x03\x00\n"
+    b"\x08\x01\x06\x00 \x00\x10\x00\x0b"
+)
+
+
+class SnapshotTestSuite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._engine = Engine()
+        cls._module = Module(cls._engine, MODULE_BINARY)
+
+    def setUp(self):
+        self.store = Store(self._engine)
+        self.double = Func(
+            self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), lambda v: v * 2
+        )
+        self.instance = Instance(self.store, self._module, [self.double])
+        self.memory = self.instance.export(self.store, "mem")
+        self.counter = self.instance.export(self.store, "counter")
+
+    def test_restore(self):
+        self.memory.write(16, b"state")
+        snapshot = self.instance.snapshot(self.store)
+        self.assertIsInstance(snapshot, Snapshot)
+
+        self.memory.write(0, b"dirty")
+        self.memory.write(1024, b"dirty")
+        self.counter.value = 42
+
+        self.instance.restore(self.store, snapshot)
+        self.assertEqual(self.memory.read(0, 21), b"\0" * 16 + b"state")
+        self.assertEqual(self.memory.read(1024, 5), b"\0" * 5)
+        self.assertEqual(self.counter.value, 7)
+
+    def test_used_prefix(self):
+        snapshot = self.instance.snapshot(self.store)
+        # the memory is all zeros, the value of the global is all
+        self.assertEqual(snapshot.nbytes, c.sizeof(ffi.wasm_val_t))
+
+        self.memory.write(99, b"\x01")
+        self.assertEqual(
+            self.instance.snapshot(self.store).nbytes, 100 + c.sizeof(ffi.wasm_val_t)
+        )
+
+    def test_restore_again(self):
+        snapshot = self.instance.snapshot(self.store)
+        for value in range(3):
+            self.counter.value = value
+            self.memory.write(0, bytes([value + 1]))
+            self.instance.restore(self.store, snapshot)
+            self.assertEqual(self.counter.value, 7)
+            self.assertEqual(self.memory.read(0, 1), b"\0")
+
+    def test_another_instance(self):
+        self.memory.write(0, b"first")
+        self.counter.value = 1
+        snapshot = self.instance.snapshot(self.store)
+
+        other = Instance(self.store, self._module, [self.double])
+        other.restore(self.store, snapshot)
+        self.assertEqual(other.export(self.store, "mem").read(0, 5), b"first")
+        self.assertEqual(other.export(self.store, "counter").value, 1)
+
+    def test_another_instance_grown(self):
+        self.assertTrue(self.memory.grow(1))
+        self.memory.write(65536 + 8, b"grown")
+        snapshot = self.instance.snapshot(self.store)
+
+        other = Instance(self.store, self._module, [self.double])
+        memory = other.export(self.store, "mem")
+        self.assertEqual(memory.pages, 1)
+        other.restore(self.store, snapshot)
+        self.assertEqual(memory.pages, 2)
+        self.assertEqual(memory.read(65536 + 8, 5), b"grown")
+
+    def test_another_instance_zero_pages(self):
+        # the grown pages are all zeros, not in the saved prefix
+        self.assertTrue(self.memory.grow(2))
+        self.memory.write(8, b"low")
+        snapshot = self.instance.snapshot(self.store)
+
+        other = Instance(self.store, self._module, [self.double])
+        memory = other.export(self.store, "mem")
+        other.restore(self.store, snapshot)
+        self.assertEqual(memory.pages, 3)
+        self.assertEqual(memory.read(8, 3), b"low")
+        memory.write(3 * 65536 - 1, b"\x01")
+
+    def test_after_trap(self):
+        def fail(value):
+            raise ValueError(value)
+
+        failing = Func(self.store, FuncType([ffi.WASM_F32], [ffi.WASM_F64]), fail)
+        instance = Instance(self.store, self._module, [failing])
+        snapshot = instance.snapshot(self.store)
+
+        instance.export(self.store, "counter").value = 0
+        with self.assertRaises(Trap):
+            instance.export(self.store, "run")(self.store, 1.0)
+
+        instance.restore(self.store, snapshot)
+        self.assertEqual(instance.export(self.store, "counter").value, 7)
+
+    def test_another_store(self):
+        with self.assertRaises(RuntimeError):
+            self.instance.snapshot(Store(self._engine))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+import ctypes as c
+import unittest
+
+import numpy
+
+import wamr.ffi as ffi
+from wamr.values import WASM_VAL_DTYPE, as_ndarray, borrow_val_vec, pack, unpack
+
+
+class ValuesTestSuite(unittest.TestCase):
+    def test_dtype_layout(self):
+        self.assertEqual(WASM_VAL_DTYPE.itemsize, c.sizeof(ffi.wasm_val_t))
+        self.assertEqual(WASM_VAL_DTYPE.fields["kind"][1], ffi.wasm_val_t.kind.offset)
+        for field in ("i32", "i64", "f32", "f64", "ref"):
+            self.assertEqual(WASM_VAL_DTYPE.fields[field][1], ffi.wasm_val_t.of.offset)
+
+    def test_pack_inferred_kinds(self):
+        vals = pack(numpy.arange(4, dtype="float32"))
+        self.assertEqual(len(vals), 4)
+        for i, val in enumerate(vals):
+            self.assertEqual(val, ffi.wasm_f32_val(i))
+
+    def test_pack_one_kind(self):
+        vals = pack([1, 2, 3], kinds=ffi.WASM_I64)
+        self.assertEqual(list(vals), [ffi.wasm_i64_val(i) for i in (1, 2, 3)])
+
+    def test_pack_mixed_kinds(self):
+        kinds = [ffi.WASM_I32, ffi.WASM_I64, ffi.WASM_F32, ffi.WASM_F64]
+        vals = pack([-1, 2**62 + 1, 0.5, 0.25], kinds=kinds)
+
+        self.assertEqual(vals[0], ffi.wasm_i32_val(-1))
+        self.assertEqual(vals[1], ffi.wasm_i64_val(2**62 + 1))
+        self.assertEqual(vals[2], ffi.wasm_f32_val(0.5))
+        self.assertEqual(vals[3], ffi.wasm_f64_val(0.25))
+
+    def test_pack_into(self):
+        out = (ffi.wasm_val_t * 8)()
+        self.assertIs(pack(numpy.array([7, 8], dtype="int32"), out=out), out)
+        self.assertEqual(out[1], ffi.wasm_i32_val(8))
+
+        with self.assertRaises(RuntimeError):
+            pack(numpy.arange(9, dtype="int32"), out=out)
+
+    def test_pack_neg(self):
+        with self.assertRaises(RuntimeError):
+            pack(numpy.arange(2, dtype="uint8"))
+
+        with self.assertRaises(RuntimeError):
+            pack([1, 2], kinds=[ffi.WASM_I32])
+
+    def test_unpack(self):
+        vals = pack(numpy.array([1.5, 2.5]))
+        values = unpack(vals)
+        self.assertEqual(values.dtype, numpy.float64)
+        self.assertEqual(values.tolist(), [1.5, 2.5])
+
+        kinds = [ffi.WASM_I32, ffi.WASM_F64]
+        values = unpack(pack([3, 4.5], kinds=kinds))
+        self.assertEqual(values.dtype, object)
+        self.assertEqual(values.tolist(), [3, 4.5])
+
+    def test_as_ndarray_aliases(self):
+        vals = (ffi.wasm_val_t * 2)(ffi.wasm_i32_val(1), ffi.wasm_i32_val(2))
+        array = as_ndarray(vals)
+        array["i32"][1] = 42
+        self.assertEqual(vals[1].of.i32, 42)
+
+    def test_borrow_val_vec(self):
+        vals = pack(numpy.arange(3, dtype="int64"))
+        vec = borrow_val_vec(vals)
+
+        self.assertEqual(vec.num_elems, 3)
+        self.assertEqual(vec.size_of_elem, c.sizeof(ffi.wasm_val_t))
+        self.assertEqual(unpack(vec).tolist(), [0, 1, 2])
+        self.assertEqual(unpack(c.pointer(vec)).tolist(), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,20 +11,48 @@
 """
 - Need to run *download_wamr.py* firstly.
 - Parse *./wasm-micro-runtime/core/iwasm/include/wasm_c_api.h* and generate
-  *wamr/binding.py*
+  *wamr/binding.py* (ctypes), *wamr/binding_cffi.py* (cffi, ABI mode) and
+  *wamr/binding_raw.py* (ctypes, handles as integers)
+- Parse *./wasm-micro-runtime/core/iwasm/include/wasm_export.h* and generate
+  *wamr/runtime.py* (ctypes)
 """
+
+from fnmatch import fnmatchcase
 import os
 import pathlib
 import shutil
 import sys
+import textwrap
 
-from pycparser import c_ast, parse_file
+from pycparser import c_ast, c_generator, parse_file
 
 WASM_C_API_HEADER = "core/iwasm/include/wasm_c_api.h"
+WASM_EXPORT_HEADER = "core/iwasm/include/wasm_export.h"
 BINDING_PATH = "wamr/binding.py"
+CFFI_BINDING_PATH = "wamr/binding_cffi.py"
+RAW_BINDING_PATH = "wamr/binding_raw.py"
+RUNTIME_BINDING_PATH = "wamr/runtime.py"
+
+# declarations of the runtime API come from these headers, not others like
+# system headers
+RUNTIME_HEADERS = ("wasm_export.h", "lib_export.h")
+
+# defined by hand in ffi.py, not by binding.py
+FFI_TYPES = ("wasm_ref_t", "wasm_val_t")
 # 4 spaces as default indent
 INDENT = "    "
 
+FILE_HEADER = (
+    "# -*- coding: utf-8 -*-\n"
+    "#!/usr/bin/env python3\n"
+    "#\n"
+    "# Copyright (C) 2019 Intel Corporation.  All rights reserved.\n"
+    "# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception\n"
+    "#\n"
+    "#It is a generated file. DO NOT EDIT.\n"
+    "#\n"
+)
+
 IGNORE_SYMOLS = (
     "wasm_engine_new_with_args",
     "wasm_valkind_is_num",
@@ -58,6 +86,97 @@ IGNORE_SYMOLS = (
     "wasm_name_new_from_string_nt",
 )
 
+# GIL policy. Foreign functions matching these are bound through a PyDLL handle
+# and keep the GIL, since releasing and reacquiring it costs more than what they
+# do and turns into contention when many threads are active. They have to be
+# short and never block or call back into Python. Others, especially
+# long-running ones like wasm_func_call, wasm_module_new or wasm_instance_new,
+# stay on CDLL and release the GIL
+HOLD_GIL = (
+    "wasm_*_kind",
+    "wasm_*_as_*",
+    "wasm_*_same",
+    "wasm_*_get_host_info",
+    "wasm_*type_params",
+    "wasm_*type_results",
+    "wasm_*type_content",
+    "wasm_*type_mutability",
+    "wasm_*type_element",
+    "wasm_*type_limits",
+    "wasm_*type_module",
+    "wasm_*type_name",
+    "wasm_*type_type",
+    "wasm_func_param_arity",
+    "wasm_func_result_arity",
+    "wasm_global_get",
+    "wasm_global_set",
+    "wasm_memory_data",
+    "wasm_memory_data_size",
+    "wasm_memory_size",
+    "wasm_table_size",
+    "wasm_func_get_param_count",
+    "wasm_func_get_result_count",
+    "wasm_runtime_get_module_inst",
+    "wasm_runtime_get_running_mode",
+    "wasm_runtime_get_exception",
+    "wasm_runtime_clear_exception",
+    "wasm_runtime_get_custom_data",
+    "wasm_runtime_get_user_data",
+    "wasm_runtime_get_function_attachment",
+    "wasm_runtime_validate_*",
+    "wasm_runtime_addr_*",
+    "wasm_runtime_get_*_addr_range",
+)
+
+
+# shared by binding.py and binding_raw.py
+LAZY_LOADER = (
+    "def _prototype(name, restype, argtypes):\n"
+    f"{INDENT}# resolve and type a foreign function once, callers use it directly.\n"
+    f"{INDENT}# Short accessors in _HOLD_GIL come from a PyDLL handle\n"
+    f"{INDENT}func = load_library(name in _HOLD_GIL)[name]\n"
+    f"{INDENT}func.restype = restype\n"
+    f"{INDENT}func.argtypes = argtypes\n"
+    f"{INDENT}return func\n"
+    "\n"
+    "\n"
+    "def __getattr__(name):\n"
+    f"{INDENT}# materialize a foreign function when it is touched for the first time\n"
+    f"{INDENT}if name not in _PROTOTYPES:\n"
+    f'{INDENT*2}raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")\n'
+    "\n"
+    f"{INDENT}func = _prototype(name, *_PROTOTYPES[name])\n"
+    f"{INDENT}globals()[name] = func\n"
+    f"{INDENT}return func\n"
+    "\n"
+    "\n"
+    "def __dir__():\n"
+    f"{INDENT}return sorted(set(globals()) | set(_PROTOTYPES))\n"
+    "\n"
+    "\n"
+)
+
+
+def holds_gil(func_name):
+    return any(fnmatchcase(func_name, pattern) for pattern in HOLD_GIL)
+
+
+def gen_hold_gil_table(func_names):
+    content = "_HOLD_GIL = frozenset(\n" f"{INDENT}[\n"
+    content += "".join(
+        [f'{INDENT*2}"{name}",\n' for name in func_names if holds_gil(name)]
+    )
+    content += f"{INDENT}]\n)\n"
+    return content
+
+
+def gen_prototype(func_name, restype, argtypes):
+    # an entry of _PROTOTYPES. `__getattr__` of the binding module turns it into
+    # a prepared foreign function on the first touch. The public name is the
+    # foreign function itself, so a call doesn't pay for a python frame or for
+    # re-resolving and re-typing
+    return f'{INDENT}"{func_name}": ({restype}, {argtypes}),\n'
+
 
 class Visitor(c_ast.NodeVisitor):
     def __init__(self):
@@ -74,20 +193,23 @@ class Visitor(c_ast.NodeVisitor):
             "void": "None",
         }
         self.ret = (
-            "# -*- coding: utf-8 -*-\n"
-            "#!/usr/bin/env python3\n"
-            "#\n"
-            "# Copyright (C) 2019 Intel Corporation.  All rights reserved.\n"
-            "# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception\n"
-            "#\n"
-            "#It is a generated file. DO NOT EDIT.\n"
-            "#\n"
-            "from ctypes import *\n"
+            FILE_HEADER + "from ctypes import *\n"
             "\n"
-            "from .ffi import dereference, libiwasm, wasm_ref_t, wasm_val_t\n"
+            "from .ffi import dereference, load_library, wasm_ref_t, wasm_val_t\n"
             "\n"
             "\n"
+            f"{LAZY_LOADER}"
         )
+        self.prototypes = []
+        self.symbols = []
+        # classes, aliases and consts which have been generated
+        self.names = set()
+        # for binding_raw.py
+        self.aliases = {}
+        self.opaque_types = set()
+        self.raw_prototypes = []
+        self.raw_symbols = []
+        self.handle_only = []
 
     def get_type_name(self, c_type):
         if isinstance(c_type, c_ast.TypeDecl):
@@ -202,6 +324,8 @@ class Visitor(c_ast.NodeVisitor):
             for decl in node.decls:
                 info[decl.name] = self.get_type_name(decl.type)
 
+        self.names.add(name)
+
         if info:
             self.ret += (
                 f"class {name}(Structure):\n"
@@ -225,6 +349,7 @@ class Visitor(c_ast.NodeVisitor):
 
         else:
             self.ret += f"class {name}(Structure):\n{INDENT}pass\n"
+            self.opaque_types.add(name)
 
         self.ret += "\n"
 
@@ -251,6 +376,8 @@ class Visitor(c_ast.NodeVisitor):
         else:
             self.ret += f"{node.name} = {self.get_type_name(node.type)}\n"
             self.ret += "\n"
+            self.aliases[node.name] = self.get_type_name(node.type)
+            self.names.add(node.name)
 
     def visit_FuncDecl(self, node):
         # pylint: disable=invalid-name
@@ -269,7 +396,7 @@ class Visitor(c_ast.NodeVisitor):
         if func_name in IGNORE_SYMOLS:
             return
 
-        params_len = 0
+        params = []
         for arg in node.args.params:
             # ignore void but not void*
             if isinstance(arg.type, c_ast.TypeDecl):
@@ -277,21 +404,103 @@ class Visitor(c_ast.NodeVisitor):
                 if "None" == type_name:
                     continue
 
-            params_len += 1
+            params.append(self.get_type_name(arg.type))
+
+        argtypes = f"[{self.get_type_name(node.args)}]" if params else "None"
+
+        self.prototypes.append(gen_prototype(func_name, restype, argtypes))
+        self.symbols.append(func_name)
+
+        self.visit_raw_FuncDecl(func_name, restype, params)
+
+    def resolve_alias(self, type_name):
+        while type_name in self.aliases:
+            type_name = self.aliases[type_name]
+        return type_name
+
+    def get_raw_type_name(self, type_name):
+        # every kind of pointer becomes an address
+        type_name = self.resolve_alias(type_name)
+        if type_name.startswith("POINTER(") or type_name.startswith("CFUNCTYPE("):
+            return "c_void_p"
+
+        # None, c_void_p and scalars. A structure passed by value is not supported
+        return type_name if "None" == type_name or type_name.startswith("c_") else ""
+
+    def is_handle(self, type_name):
+        # a pointer of an opaque type, what it points to is owned by the runtime
+        type_name = self.resolve_alias(type_name)
+        if "c_void_p" == type_name:
+            return True
+
+        if not type_name.startswith("POINTER("):
+            return False
+
+        pointed_type = type_name[len("POINTER(") : -1]
+        if pointed_type in self.opaque_types:
+            return True
+
+        # like wasm_module_t, a typedef of a pointer of an opaque type
+        return self.resolve_alias(pointed_type).startswith("POINTER(")
 
-        args = (
-            "" if not params_len else ",".join([f"arg{i}" for i in range(params_len)])
+    def visit_raw_FuncDecl(self, func_name, restype, params):
+        # pylint: disable=invalid-name
+        raw_params = [self.get_raw_type_name(param) for param in params]
+        raw_restype = self.get_raw_type_name(restype)
+        if not all(raw_params) or not raw_restype:
+            return
+
+        # results of pointers are always `int`s, 0 for NULL
+        raw_restype = "c_size_t" if "c_void_p" == raw_restype else raw_restype
+        raw_argtypes = f"[{','.join(raw_params)}]" if raw_params else "None"
+        self.raw_prototypes.append(gen_prototype(func_name, raw_restype, raw_argtypes))
+        self.raw_symbols.append(func_name)
+
+        if all(
+            self.is_handle(param)
+            or (raw_param.startswith("c_") and "c_void_p" != raw_param)
+            for param, raw_param in zip(params, raw_params)
+        ):
+            self.handle_only.append(func_name)
+
+    def gen_raw_binding(self):
+        content = (
+            FILE_HEADER
+            + "# Handles are plain integers. Pointer arguments accept `int`s, None, or\n"
+            "# ctypes objects from byref()/pointer()/addressof(). Pointer results are\n"
+            "# `int`s and 0 means NULL.\n"
+            "#\n"
+            "from ctypes import *\n"
+            "\n"
+            "from .ffi import load_library\n"
+            "\n"
+            "\n"
+            f"{LAZY_LOADER}"
+            "_PROTOTYPES = {\n"
         )
-        argtypes = f"[{self.get_type_name(node.args)}]" if params_len else "None"
-
-        self.ret += (
-            f"def {func_name}({args}):\n"
-            f"{INDENT}_{func_name} = libiwasm.{func_name}\n"
-            f"{INDENT}_{func_name}.restype = {restype}\n"
-            f"{INDENT}_{func_name}.argtypes = {argtypes}\n"
-            f"{INDENT}return _{func_name}({args})\n"
+        content += "".join(self.raw_prototypes)
+        content += (
+            "}\n"
+            "\n"
+            "# take only handles and scalars. Others need addresses of buffers which\n"
+            "# are owned by callers, like wasm_xxx_vec_t, wasm_val_t or callbacks\n"
+            "HANDLE_ONLY = frozenset(\n"
+            f"{INDENT}[\n"
+        )
+        content += "".join([f'{INDENT*2}"{name}",\n' for name in self.handle_only])
+        content += f"{INDENT}]\n)\n"
+        content += "\n" + gen_hold_gil_table(self.raw_symbols)
+        return content
+
+    def gen_prototype_table(self):
+        # all structured data types have been defined at the end of the module
+        return (
+            "_PROTOTYPES = {\n"
+            + "".join(self.prototypes)
+            + "}\n"
+            + "\n"
+            + gen_hold_gil_table(self.symbols)
         )
-        self.ret += "\n"
 
     def visit_Enum(self, node):
         # pylint: disable=invalid-name
@@ -299,9 +508,10 @@ class Visitor(c_ast.NodeVisitor):
         # generate enum elementes directly as consts with values
         for i, elem in enumerate(node.values.enumerators):
             self.ret += f"{elem.name}"
+            self.names.add(elem.name)
 
             if elem.value:
-                elem_value = int(elem.value.value)
+                elem_value = int(elem.value.value, 0)
             else:
                 if 0 == i:
                     elem_value = 0
@@ -313,11 +523,210 @@ class Visitor(c_ast.NodeVisitor):
         self.ret += "\n"
 
 
+class RuntimeVisitor(Visitor):
+    """
+    Declarations of wasm_export.h. Types which binding.py or ffi.py has already
+    defined, like wasm_module_t or wasm_val_t, are imported instead of being
+    redefined, so both bindings share them
+    """
+
+    def __init__(self, shared_names):
+        super().__init__()
+        self.type_map.update(
+            {
+                "double": "c_double",
+                "float": "c_float",
+                "int32_t": "c_int32",
+                "int64_t": "c_int64",
+                "uint16_t": "c_uint16",
+                "uint64_t": "c_uint64",
+                "uintptr_t": "c_size_t",
+                "unsigned int": "c_uint",
+            }
+        )
+        self.ret = ""
+        self.shared_names = shared_names
+        self.imports = set()
+
+    def visit_FileAST(self, node):
+        # pylint: disable=invalid-name
+        for ext in node.ext:
+            if (
+                not ext.coord
+                or pathlib.Path(ext.coord.file).name not in RUNTIME_HEADERS
+            ):
+                continue
+
+            # static inline functions are not exported
+            if isinstance(ext, c_ast.FuncDef):
+                continue
+
+            self.visit(ext)
+
+    def is_shared(self, name):
+        if name in self.shared_names:
+            self.imports.add(name)
+            return True
+
+        return False
+
+    def get_type_name(self, c_type):
+        if isinstance(c_type, c_ast.IdentifierType):
+            type_name = " ".join(c_type.names)
+            if self.is_shared(type_name):
+                return type_name
+
+            if type_name in self.aliases:
+                # like `typedef void WASMFunctionInstanceCommon`
+                return "None" if "None" == self.resolve_alias(type_name) else type_name
+
+            if type_name in self.names:
+                return type_name
+
+            if not type_name in self.type_map:
+                raise RuntimeError(f"a new type should be in type_map: {type_name}")
+
+            return self.type_map[type_name]
+        elif isinstance(c_type, (c_ast.Struct, c_ast.Union)) and c_type.name:
+            self.is_shared(c_type.name)
+            return c_type.name
+        elif isinstance(c_type, c_ast.Enum):
+            # the size of an enum is the size of an int
+            return "c_int"
+        elif (
+            isinstance(c_type, c_ast.PtrDecl)
+            and isinstance(c_type.type, c_ast.TypeDecl)
+            and isinstance(c_type.type.type, c_ast.IdentifierType)
+            and ["char"] == c_type.type.type.names
+        ):
+            # strings are `bytes`
+            return "c_char_p"
+
+        return super().get_type_name(c_type)
+
+    def get_field_type_name(self, owner, field):
+        c_type = field.type
+        if isinstance(c_type, c_ast.ArrayDecl) and c_type.dim:
+            # inlined, not a pointer
+            return f"{self.get_type_name(c_type.type)} * {c_type.dim.value}"
+
+        if isinstance(c_type, c_ast.TypeDecl) and isinstance(
+            c_type.type, (c_ast.Struct, c_ast.Union)
+        ):
+            if not c_type.type.name:
+                # like `MemAllocOption.pool`, name it after the owner
+                nested_name = f"{owner}_{field.name}"
+                self.gen_record(nested_name, c_type.type)
+                return nested_name
+
+        return self.get_type_name(c_type)
+
+    def gen_record(self, name, node):
+        if name in self.names or self.is_shared(name):
+            return
+
+        base = "Union" if isinstance(node, c_ast.Union) else "Structure"
+        self.names.add(name)
+
+        if not node.decls:
+            self.ret += f"class {name}({base}):\n{INDENT}pass\n\n"
+            self.opaque_types.add(name)
+            return
+
+        fields = "".join(
+            [
+                f'{INDENT}("{decl.name}", {self.get_field_type_name(name, decl)}),\n'
+                for decl in node.decls
+            ]
+        )
+
+        if f"POINTER({name})" in fields:
+            # refers to itself, like `wasm_section_t.next`
+            self.ret += (
+                f"class {name}({base}):\n{INDENT}pass\n\n"
+                f"{name}._fields_ = [\n{fields}]\n\n"
+            )
+        else:
+            self.ret += (
+                f"class {name}({base}):\n"
+                f"{INDENT}_fields_ = [\n"
+                f"{textwrap.indent(fields, INDENT)}"
+                f"{INDENT}]\n\n"
+            )
+
+    def visit_Struct(self, node):
+        # pylint: disable=invalid-name
+        if node.name:
+            self.gen_record(node.name, node)
+
+    def visit_Union(self, node):
+        # pylint: disable=invalid-name
+        if node.name:
+            self.gen_record(node.name, node)
+
+    def visit_Typedef(self, node):
+        # pylint: disable=invalid-name
+        if self.is_shared(node.name) or node.name in self.names:
+            return
+
+        record = node.type.type if isinstance(node.type, c_ast.TypeDecl) else None
+        if isinstance(record, (c_ast.Struct, c_ast.Union)) and not record.name:
+            # like `typedef struct {...} name`
+            self.gen_record(node.name, record)
+            return
+
+        self.visit(node.type)
+
+        type_name = self.get_type_name(node.type)
+        if node.name == type_name:
+            return
+
+        self.ret += f"{node.name} = {type_name}\n\n"
+        self.aliases[node.name] = type_name
+        self.names.add(node.name)
+
+    def visit_Enum(self, node):
+        # pylint: disable=invalid-name
+        if all(elem.name in self.shared_names for elem in node.values.enumerators):
+            return
+
+        super().visit_Enum(node)
+
+    def visit_FuncDecl(self, node):
+        # pylint: disable=invalid-name
+        # ctypes can't type variadic functions, like wasm_runtime_call_wasm_v
+        if node.args and any(
+            isinstance(param, c_ast.EllipsisParam) for param in node.args.params
+        ):
+            return
+
+        super().visit_FuncDecl(node)
+
+    def gen_runtime_binding(self):
+        imports = ", ".join(sorted(self.imports, key=str.lower))
+        return (
+            FILE_HEADER + "from ctypes import *\n"
+            "\n"
+            f"from .ffi import load_library, {imports}\n"
+            "\n"
+            "\n"
+            f"{LAZY_LOADER}"
+            f"{self.ret}"
+            "\n"
+            f"{self.gen_prototype_table()}"
+            "\n"
+            "# foreign functions are not in globals() until they are touched\n"
+            '__all__ = [name for name in globals() if not name.startswith("_")]\n'
+            "__all__ += list(_PROTOTYPES)\n"
+        )
+
+
 def preflight_check(workspace):
     wamr_repo = workspace.joinpath("wasm-micro-runtime")
     file_check_list = [
         wamr_repo.exists(),
         wamr_repo.joinpath(WASM_C_API_HEADER).exists(),
+        wamr_repo.joinpath(WASM_EXPORT_HEADER).exists(),
     ]
 
     if not all(file_check_list):
@@ -333,12 +742,81 @@ def preflight_check(workspace):
     return True
 
 
-def do_parse(workspace):
-    filename = workspace.joinpath(WASM_C_API_HEADER)
-    filename = str(filename)
+def gen_cffi_binding(ast, symbols):
+    """
+    Declarations in wasm_c_api.h go to `cdef()` as they are. Public names are
+    the same as the ctypes binding. `symbols` comes from `Visitor`
+    """
+    generator = c_generator.CGenerator()
+    header_name = pathlib.Path(WASM_C_API_HEADER).name
+
+    cdef = ""
+    for node in ast.ext:
+        # skip system headers
+        if not node.coord or not node.coord.file.endswith(header_name):
+            continue
+
+        # static inline functions are not exported
+        if isinstance(node, c_ast.FuncDef):
+            continue
+
+        if (
+            isinstance(node, c_ast.Decl)
+            and isinstance(node.type, c_ast.FuncDecl)
+            and node.name in IGNORE_SYMOLS
+        ):
+            continue
+
+        cdef += f"{generator.visit(node)};\n"
+
+    content = (
+        FILE_HEADER + "import os\n"
+        "\n"
+        "from cffi import FFI\n"
+        "\n"
+        "from .ffi import load_library\n"
+        "\n"
+        "ffi = FFI()\n"
+        f'ffi.cdef(\n{INDENT}"""\n{cdef}"""\n)\n'
+        "\n"
+        "_lib = None\n"
+        "\n"
+        "\n"
+        "def _library():\n"
+        f"{INDENT}# dlopen the same libiwasm which wamr.ffi loads\n"
+        f"{INDENT}global _lib\n"
+        "\n"
+        f"{INDENT}if _lib is None:\n"
+        f"{INDENT*2}# a pathlib.Path for ctypes, cffi takes a str\n"
+        f"{INDENT*2}_lib = ffi.dlopen(os.fspath(load_library()._name))\n"
+        "\n"
+        f"{INDENT}return _lib\n"
+        "\n"
+        "\n"
+        "def __getattr__(name):\n"
+        f"{INDENT}if name not in _SYMBOLS:\n"
+        f'{INDENT*2}raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")\n'
+        "\n"
+        f"{INDENT}func = getattr(_library(), name)\n"
+        f"{INDENT}globals()[name] = func\n"
+        f"{INDENT}return func\n"
+        "\n"
+        "\n"
+        "def __dir__():\n"
+        f"{INDENT}return sorted(set(globals()) | set(_SYMBOLS))\n"
+        "\n"
+        "\n"
+        "_SYMBOLS = frozenset(\n"
+        f"{INDENT}[\n"
+    )
+    content += "".join([f'{INDENT*2}"{symbol}",\n' for symbol in symbols])
+    content += f"{INDENT}]\n)\n"
+    return content
+
 
-    ast = parse_file(
-        filename,
+def parse_header(filename):
+    return parse_file(
+        str(filename),
         use_cpp=True,
         cpp_path="gcc",
         cpp_args=[
@@ -358,9 +836,23 @@ def do_parse(workspace):
         ],
     )
 
+
+def do_parse(workspace):
+    ast = parse_header(workspace.joinpath(WASM_C_API_HEADER))
+
     ast_visitor = Visitor()
     ast_visitor.visit(ast)
-    return ast_visitor.ret
+
+    runtime_ast = parse_header(workspace.joinpath(WASM_EXPORT_HEADER))
+
+    runtime_visitor = RuntimeVisitor(ast_visitor.names | set(FFI_TYPES))
+    runtime_visitor.visit(runtime_ast)
+    return (
+        ast_visitor.ret + "\n" + ast_visitor.gen_prototype_table(),
+        gen_cffi_binding(ast, ast_visitor.symbols),
+        ast_visitor.gen_raw_binding(),
+        runtime_visitor.gen_runtime_binding(),
+    )
 
 
 def main():
@@ -375,9 +867,23 @@ def main():
         return False
 
     wamr_repo = root_dir.joinpath("wasm-micro-runtime")
+    ctypes_binding, cffi_binding, raw_binding, runtime_binding = do_parse(wamr_repo)
+
     binding_file_path = root_dir.joinpath(BINDING_PATH)
     with open(binding_file_path, "wt", encoding="utf-8") as binding_file:
-        binding_file.write(do_parse(wamr_repo))
+        binding_file.write(ctypes_binding)
+
+    binding_file_path = root_dir.joinpath(CFFI_BINDING_PATH)
+    with open(binding_file_path, "wt", encoding="utf-8") as binding_file:
+        binding_file.write(cffi_binding)
+
+    binding_file_path = root_dir.joinpath(RAW_BINDING_PATH)
+    with open(binding_file_path, "wt", encoding="utf-8") as binding_file:
+        binding_file.write(raw_binding)
+
+    binding_file_path = root_dir.joinpath(RUNTIME_BINDING_PATH)
+    with open(binding_file_path, "wt", encoding="utf-8") as binding_file:
+        binding_file.write(runtime_binding)
 
     return True
 
@@ -4,4 +4,21 @@
 # Copyright (C) 2019 Intel Corporation.  All rights reserved.
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 #
-__all__ = ["ffi"]
+from . import oop
+from .oop import *
+
+# values and process need NumPy, an optional extra, they are imported by name
+__all__ = [
+    "aio",
+    "cache",
+    "call",
+    "executor",
+    "exports",
+    "ffi",
+    "host",
+    "memory",
+    "oop",
+    "pool",
+    "runtime",
+    "snapshot",
+] + oop.__all__
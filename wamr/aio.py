@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+asyncio APIs, compilation, instantiation and calls in worker threads
+instead of blocking the event loop.
+
+An AsyncRunner owns a bounded thread pool and a semaphore. A coroutine
+waits on the semaphore before it submits, so a burst of requests queues in
+the event loop instead of piling up in the pool. A cancelled call which
+hasn't started is skipped. One which is already running finishes in the
+background, unless the runner is created with terminate=True, then it is
+stopped by wasm_runtime_terminate() of its instance.
+
+Module.compile_async(), Instance.new_async() and Func.call_async() use the
+default runner, or the one given.
+"""
+
+import asyncio
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+import ctypes as c
+from functools import lru_cache
+import os
+import threading
+import weakref
+
+from . import runtime
+from .oop import Instance, Module
+
+
+class _instance_layout(c.Structure):
+    # struct wasm_instance_t of wasm_c_api_internal.h, it is opaque in
+    # wasm_c_api.h and there is no accessor of the module instance
+    _fields_ = [
+        ("store", c.c_void_p),
+        ("exports", c.c_void_p),
+        ("host_info", c.c_void_p),
+        ("host_info_finalizer", c.c_void_p),
+        ("inst_comm_rt", runtime.wasm_module_inst_t),
+    ]
+
+
+# [first, last) versions of libiwasm with the layout above
+_LAYOUT_VERSIONS = ((1, 0, 0), (3, 0, 0))
+
+
+@lru_cache(maxsize=None)
+def _layout_known():
+    try:
+        get_version = runtime.wasm_runtime_get_version
+    except AttributeError:
+        # a library older than the accessor
+        return False
+
+    major, minor, patch = c.c_uint32(), c.c_uint32(), c.c_uint32()
+    get_version(c.byref(major), c.byref(minor), c.byref(patch))
+    first, last = _LAYOUT_VERSIONS
+    return first <= (major.value, minor.value, patch.value) < last
+
+
+def module_inst(instance):
+    """
+    The wasm_module_inst_t of an oop.Instance for the runtime API, or None if
+    the layout of wasm_instance_t isn't known for the version of libiwasm or
+    it doesn't look like one
+    """
+    if not _layout_known():
+        return None
+
+    layout = c.cast(instance.pointer, c.POINTER(_instance_layout)).contents
+    address = c.cast(layout.inst_comm_rt, c.c_void_p).value
+    if not address:
+        return None
+
+    # WASMModuleInstanceCommon starts with `uint32 module_type`
+    if c.c_uint32.from_address(address).value not in (
+        runtime.Wasm_Module_Bytecode,
+        runtime.Wasm_Module_AoT,
+    ):
+        return None
+
+    return layout.inst_comm_rt
+
+
+def _init_thread_env():
+    if not runtime.wasm_runtime_thread_env_inited():
+        runtime.wasm_runtime_init_thread_env()
+
+
+class _Call:
+    """
+    A call of a function of an instance. It is terminated only while it
+    runs, never while another call of the store does
+    """
+
+    __slots__ = (
+        "func",
+        "store",
+        "args",
+        "module_inst",
+        "lock",
+        "running",
+        "stopped",
+        "terminated",
+    )
+
+    def __init__(self, func, store, args, module_inst):
+        self.func = func
+        self.store = store
+        self.args = args
+        self.module_inst = module_inst
+        self.lock = threading.Lock()
+        self.running = False
+        self.stopped = False
+        self.terminated = False
+
+    def __call__(self, store_lock):
+        with store_lock:
+            with self.lock:
+                if self.stopped:
+                    raise CancelledError()
+                self.running = True
+
+            try:
+                return self.func(self.store, *self.args)
+            finally:
+                with self.lock:
+                    self.running = False
+                    if self.terminated:
+                        # the instance can be called again
+                        runtime.wasm_runtime_clear_exception(self.module_inst)
+
+    def stop(self):
+        """
+        Skips the call if it hasn't started, terminates it if it runs.
+        Returns True if it is terminated
+        """
+        with self.lock:
+            self.stopped = True
+            if not self.running or self.module_inst is None:
+                return False
+
+            runtime.wasm_runtime_terminate(self.module_inst)
+            self.terminated = True
+            return True
+
+
+class AsyncRunner:
+    """
+    *max_workers* threads, one per core by default, and at most *limit*
+    submitted jobs per event loop, twice the workers by default. Each thread
+    sets up the runtime thread environment first.
+
+    Calls of one store run one after another, a store and its instances
+    aren't thread-safe.
+
+    *terminate* opts in to stopping a cancelled call which is running, see
+    call(). It relies on module_inst(), which reads a private structure of
+    libiwasm, and raises RuntimeError if the library lacks
+    wasm_runtime_terminate().
+    """
+
+    def __init__(self, max_workers=None, limit=None, terminate=False):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.limit = limit or 2 * self.max_workers
+        self.terminate = terminate
+        if terminate:
+            # resolved now, not in the handler of a cancellation
+            for name in ("wasm_runtime_terminate", "wasm_runtime_clear_exception"):
+                try:
+                    getattr(runtime, name)
+                except AttributeError as e:
+                    raise RuntimeError(
+                        f"terminate=True needs {name}() of libiwasm"
+                    ) from e
+
+        self._executor = ThreadPoolExecutor(
+            self.max_workers,
+            thread_name_prefix="wamr_aio",
+            initializer=_init_thread_env,
+        )
+        # event loop -> asyncio.Semaphore, a semaphore is bound to one loop
+        self._semaphores = {}
+        # Store -> threading.Lock
+        self._store_locks = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.terminations = 0
+
+    def _store_lock(self, store):
+        with self._lock:
+            lock = self._store_locks.get(store)
+            if lock is None:
+                lock = self._store_locks[store] = threading.Lock()
+            return lock
+
+    def _slots(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                # a semaphore refers to its loop, ones of closed loops go here
+                for closed in [key for key in self._semaphores if key.is_closed()]:
+                    del self._semaphores[closed]
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+            return semaphore
+
+    async def run(self, fn, *args):
+        """
+        fn(*args) in a worker, after a free slot of the limit
+        """
+        async with self._slots():
+            return await asyncio.wrap_future(self._executor.submit(fn, *args))
+
+    async def compile(self, engine, binary, cache=None):
+        return await self.run(self._compile, engine, binary, cache)
+
+    def _compile(self, engine, binary, cache):
+        # every module of an engine is compiled with one store of it
+        # pylint: disable=protected-access
+        with self._store_lock(engine._store()):
+            return Module(engine, binary, cache)
+
+    async def instantiate(self, store, module, imports=()):
+        return await self.run(self._instantiate, store, module, imports)
+
+    def _instantiate(self, store, module, imports):
+        with self._store_lock(store):
+            return Instance(store, module, imports)
+
+    async def call(self, func, store, *args):
+        """
+        func(store, *args) in a worker. If the task is cancelled before the
+        call starts, it is skipped. If it is cancelled while the call runs,
+        the call finishes in the background, or with *terminate* the instance
+        of an exported *func* is terminated and the call returns a trap in
+        the worker. The task raises CancelledError either way
+        """
+        instance = getattr(func, "instance", None) if self.terminate else None
+        job = _Call(
+            func, store, args, None if instance is None else module_inst(instance)
+        )
+
+        async with self._slots():
+            future = self._executor.submit(job, self._store_lock(store))
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if not future.cancel() and job.stop():
+                    self.terminations += 1
+                raise
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_runner():
+    """
+    An AsyncRunner shared by the process, created by the first use
+    """
+    # pylint: disable=global-statement
+    global _default
+
+    with _default_lock:
+        if _default is None:
+            _default = AsyncRunner()
+        return _default
@@ -0,0 +1,760 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+#It is a generated file. DO NOT EDIT.
+#
+import os
+
+from cffi import FFI
+
+from .ffi import load_library
+
+ffi = FFI()
+ffi.cdef(
+    """
+typedef unsigned char byte_t;
+typedef float float32_t;
+typedef double float64_t;
+struct wasm_ref_t;
+typedef struct wasm_ref_t wasm_ref_t;
+typedef struct wasm_val_t
+{
+  uint8_t kind;
+  union 
+  {
+    int32_t i32;
+    int64_t i64;
+    float32_t f32;
+    float64_t f64;
+    struct wasm_ref_t *ref;
+  } of;
+} wasm_val_t;
+typedef byte_t wasm_byte_t;
+typedef struct wasm_byte_vec_t
+{
+  size_t size;
+  wasm_byte_t *data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_byte_vec_t;
+void wasm_byte_vec_new_empty(wasm_byte_vec_t *);
+void wasm_byte_vec_new_uninitialized(wasm_byte_vec_t *, size_t);
+void wasm_byte_vec_new(wasm_byte_vec_t *, size_t, wasm_byte_t *);
+void wasm_byte_vec_copy(wasm_byte_vec_t *, wasm_byte_vec_t *);
+void wasm_byte_vec_delete(wasm_byte_vec_t *);
+typedef wasm_byte_vec_t wasm_name_t;
+typedef struct wasm_config_t wasm_config_t;
+void wasm_config_delete(wasm_config_t *);
+wasm_config_t *wasm_config_new(void);
+typedef struct wasm_engine_t wasm_engine_t;
+void wasm_engine_delete(wasm_engine_t *);
+wasm_engine_t *wasm_engine_new(void);
+wasm_engine_t *wasm_engine_new_with_config(wasm_config_t *);
+typedef struct wasm_store_t wasm_store_t;
+void wasm_store_delete(wasm_store_t *);
+wasm_store_t *wasm_store_new(wasm_engine_t *);
+typedef uint8_t wasm_mutability_t;
+enum wasm_enum_1
+{
+  WASM_CONST = 0,
+  WASM_VAR = 1
+};
+typedef struct wasm_limits_t
+{
+  uint32_t min;
+  uint32_t max;
+} wasm_limits_t;
+typedef struct wasm_valtype_t wasm_valtype_t;
+void wasm_valtype_delete(wasm_valtype_t *);
+typedef struct wasm_valtype_vec_t
+{
+  size_t size;
+  wasm_valtype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_valtype_vec_t;
+void wasm_valtype_vec_new_empty(wasm_valtype_vec_t *);
+void wasm_valtype_vec_new_uninitialized(wasm_valtype_vec_t *, size_t);
+void wasm_valtype_vec_new(wasm_valtype_vec_t *, size_t, wasm_valtype_t **);
+void wasm_valtype_vec_copy(wasm_valtype_vec_t *, wasm_valtype_vec_t *);
+void wasm_valtype_vec_delete(wasm_valtype_vec_t *);
+wasm_valtype_t *wasm_valtype_copy(wasm_valtype_t *);
+typedef uint8_t wasm_valkind_t;
+enum wasm_enum_2
+{
+  WASM_I32 = 0,
+  WASM_I64 = 1,
+  WASM_F32 = 2,
+  WASM_F64 = 3,
+  WASM_ANYREF = 128,
+  WASM_FUNCREF = 129
+};
+wasm_valtype_t *wasm_valtype_new(wasm_valkind_t);
+wasm_valkind_t wasm_valtype_kind(wasm_valtype_t *);
+typedef struct wasm_functype_t wasm_functype_t;
+void wasm_functype_delete(wasm_functype_t *);
+typedef struct wasm_functype_vec_t
+{
+  size_t size;
+  wasm_functype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_functype_vec_t;
+void wasm_functype_vec_new_empty(wasm_functype_vec_t *);
+void wasm_functype_vec_new_uninitialized(wasm_functype_vec_t *, size_t);
+void wasm_functype_vec_new(wasm_functype_vec_t *, size_t, wasm_functype_t **);
+void wasm_functype_vec_copy(wasm_functype_vec_t *, wasm_functype_vec_t *);
+void wasm_functype_vec_delete(wasm_functype_vec_t *);
+wasm_functype_t *wasm_functype_copy(wasm_functype_t *);
+wasm_functype_t *wasm_functype_new(wasm_valtype_vec_t *, wasm_valtype_vec_t *);
+wasm_valtype_vec_t *wasm_functype_params(wasm_functype_t *);
+wasm_valtype_vec_t *wasm_functype_results(wasm_functype_t *);
+typedef struct wasm_globaltype_t wasm_globaltype_t;
+void wasm_globaltype_delete(wasm_globaltype_t *);
+typedef struct wasm_globaltype_vec_t
+{
+  size_t size;
+  wasm_globaltype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_globaltype_vec_t;
+void wasm_globaltype_vec_new_empty(wasm_globaltype_vec_t *);
+void wasm_globaltype_vec_new_uninitialized(wasm_globaltype_vec_t *, size_t);
+void wasm_globaltype_vec_new(wasm_globaltype_vec_t *, size_t, wasm_globaltype_t **);
+void wasm_globaltype_vec_copy(wasm_globaltype_vec_t *, wasm_globaltype_vec_t *);
+void wasm_globaltype_vec_delete(wasm_globaltype_vec_t *);
+wasm_globaltype_t *wasm_globaltype_copy(wasm_globaltype_t *);
+wasm_globaltype_t *wasm_globaltype_new(wasm_valtype_t *, wasm_mutability_t);
+wasm_valtype_t *wasm_globaltype_content(wasm_globaltype_t *);
+wasm_mutability_t wasm_globaltype_mutability(wasm_globaltype_t *);
+typedef struct wasm_tabletype_t wasm_tabletype_t;
+void wasm_tabletype_delete(wasm_tabletype_t *);
+typedef struct wasm_tabletype_vec_t
+{
+  size_t size;
+  wasm_tabletype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_tabletype_vec_t;
+void wasm_tabletype_vec_new_empty(wasm_tabletype_vec_t *);
+void wasm_tabletype_vec_new_uninitialized(wasm_tabletype_vec_t *, size_t);
+void wasm_tabletype_vec_new(wasm_tabletype_vec_t *, size_t, wasm_tabletype_t **);
+void wasm_tabletype_vec_copy(wasm_tabletype_vec_t *, wasm_tabletype_vec_t *);
+void wasm_tabletype_vec_delete(wasm_tabletype_vec_t *);
+wasm_tabletype_t *wasm_tabletype_copy(wasm_tabletype_t *);
+wasm_tabletype_t *wasm_tabletype_new(wasm_valtype_t *, wasm_limits_t *);
+wasm_valtype_t *wasm_tabletype_element(wasm_tabletype_t *);
+wasm_limits_t *wasm_tabletype_limits(wasm_tabletype_t *);
+typedef struct wasm_memorytype_t wasm_memorytype_t;
+void wasm_memorytype_delete(wasm_memorytype_t *);
+typedef struct wasm_memorytype_vec_t
+{
+  size_t size;
+  wasm_memorytype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_memorytype_vec_t;
+void wasm_memorytype_vec_new_empty(wasm_memorytype_vec_t *);
+void wasm_memorytype_vec_new_uninitialized(wasm_memorytype_vec_t *, size_t);
+void wasm_memorytype_vec_new(wasm_memorytype_vec_t *, size_t, wasm_memorytype_t **);
+void wasm_memorytype_vec_copy(wasm_memorytype_vec_t *, wasm_memorytype_vec_t *);
+void wasm_memorytype_vec_delete(wasm_memorytype_vec_t *);
+wasm_memorytype_t *wasm_memorytype_copy(wasm_memorytype_t *);
+wasm_memorytype_t *wasm_memorytype_new(wasm_limits_t *);
+wasm_limits_t *wasm_memorytype_limits(wasm_memorytype_t *);
+typedef struct wasm_externtype_t wasm_externtype_t;
+void wasm_externtype_delete(wasm_externtype_t *);
+typedef struct wasm_externtype_vec_t
+{
+  size_t size;
+  wasm_externtype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_externtype_vec_t;
+void wasm_externtype_vec_new_empty(wasm_externtype_vec_t *);
+void wasm_externtype_vec_new_uninitialized(wasm_externtype_vec_t *, size_t);
+void wasm_externtype_vec_new(wasm_externtype_vec_t *, size_t, wasm_externtype_t **);
+void wasm_externtype_vec_copy(wasm_externtype_vec_t *, wasm_externtype_vec_t *);
+void wasm_externtype_vec_delete(wasm_externtype_vec_t *);
+wasm_externtype_t *wasm_externtype_copy(wasm_externtype_t *);
+typedef uint8_t wasm_externkind_t;
+enum wasm_enum_3
+{
+  WASM_EXTERN_FUNC = 0,
+  WASM_EXTERN_GLOBAL = 1,
+  WASM_EXTERN_TABLE = 2,
+  WASM_EXTERN_MEMORY = 3
+};
+wasm_externkind_t wasm_externtype_kind(wasm_externtype_t *);
+wasm_externtype_t *wasm_functype_as_externtype(wasm_functype_t *);
+wasm_externtype_t *wasm_globaltype_as_externtype(wasm_globaltype_t *);
+wasm_externtype_t *wasm_tabletype_as_externtype(wasm_tabletype_t *);
+wasm_externtype_t *wasm_memorytype_as_externtype(wasm_memorytype_t *);
+wasm_functype_t *wasm_externtype_as_functype(wasm_externtype_t *);
+wasm_globaltype_t *wasm_externtype_as_globaltype(wasm_externtype_t *);
+wasm_tabletype_t *wasm_externtype_as_tabletype(wasm_externtype_t *);
+wasm_memorytype_t *wasm_externtype_as_memorytype(wasm_externtype_t *);
+wasm_externtype_t *wasm_functype_as_externtype_const(wasm_functype_t *);
+wasm_externtype_t *wasm_globaltype_as_externtype_const(wasm_globaltype_t *);
+wasm_externtype_t *wasm_tabletype_as_externtype_const(wasm_tabletype_t *);
+wasm_externtype_t *wasm_memorytype_as_externtype_const(wasm_memorytype_t *);
+wasm_functype_t *wasm_externtype_as_functype_const(wasm_externtype_t *);
+wasm_globaltype_t *wasm_externtype_as_globaltype_const(wasm_externtype_t *);
+wasm_tabletype_t *wasm_externtype_as_tabletype_const(wasm_externtype_t *);
+wasm_memorytype_t *wasm_externtype_as_memorytype_const(wasm_externtype_t *);
+typedef struct wasm_importtype_t wasm_importtype_t;
+void wasm_importtype_delete(wasm_importtype_t *);
+typedef struct wasm_importtype_vec_t
+{
+  size_t size;
+  wasm_importtype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_importtype_vec_t;
+void wasm_importtype_vec_new_empty(wasm_importtype_vec_t *);
+void wasm_importtype_vec_new_uninitialized(wasm_importtype_vec_t *, size_t);
+void wasm_importtype_vec_new(wasm_importtype_vec_t *, size_t, wasm_importtype_t **);
+void wasm_importtype_vec_copy(wasm_importtype_vec_t *, wasm_importtype_vec_t *);
+void wasm_importtype_vec_delete(wasm_importtype_vec_t *);
+wasm_importtype_t *wasm_importtype_copy(wasm_importtype_t *);
+wasm_importtype_t *wasm_importtype_new(wasm_name_t *, wasm_name_t *, wasm_externtype_t *);
+wasm_name_t *wasm_importtype_module(wasm_importtype_t *);
+wasm_name_t *wasm_importtype_name(wasm_importtype_t *);
+wasm_externtype_t *wasm_importtype_type(wasm_importtype_t *);
+typedef struct wasm_exporttype_t wasm_exporttype_t;
+void wasm_exporttype_delete(wasm_exporttype_t *);
+typedef struct wasm_exporttype_vec_t
+{
+  size_t size;
+  wasm_exporttype_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_exporttype_vec_t;
+void wasm_exporttype_vec_new_empty(wasm_exporttype_vec_t *);
+void wasm_exporttype_vec_new_uninitialized(wasm_exporttype_vec_t *, size_t);
+void wasm_exporttype_vec_new(wasm_exporttype_vec_t *, size_t, wasm_exporttype_t **);
+void wasm_exporttype_vec_copy(wasm_exporttype_vec_t *, wasm_exporttype_vec_t *);
+void wasm_exporttype_vec_delete(wasm_exporttype_vec_t *);
+wasm_exporttype_t *wasm_exporttype_copy(wasm_exporttype_t *);
+wasm_exporttype_t *wasm_exporttype_new(wasm_name_t *, wasm_externtype_t *);
+wasm_name_t *wasm_exporttype_name(wasm_exporttype_t *);
+wasm_externtype_t *wasm_exporttype_type(wasm_exporttype_t *);
+void wasm_val_delete(wasm_val_t *);
+void wasm_val_copy(wasm_val_t *, wasm_val_t *);
+typedef struct wasm_val_vec_t
+{
+  size_t size;
+  wasm_val_t *data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_val_vec_t;
+void wasm_val_vec_new_empty(wasm_val_vec_t *);
+void wasm_val_vec_new_uninitialized(wasm_val_vec_t *, size_t);
+void wasm_val_vec_new(wasm_val_vec_t *, size_t, wasm_val_t *);
+void wasm_val_vec_copy(wasm_val_vec_t *, wasm_val_vec_t *);
+void wasm_val_vec_delete(wasm_val_vec_t *);
+void wasm_ref_delete(wasm_ref_t *);
+wasm_ref_t *wasm_ref_copy(wasm_ref_t *);
+_Bool wasm_ref_same(wasm_ref_t *, wasm_ref_t *);
+void *wasm_ref_get_host_info(wasm_ref_t *);
+void wasm_ref_set_host_info(wasm_ref_t *, void *);
+void wasm_ref_set_host_info_with_finalizer(wasm_ref_t *, void *, void (*)(void *));
+typedef struct wasm_frame_t wasm_frame_t;
+void wasm_frame_delete(wasm_frame_t *);
+typedef struct wasm_frame_vec_t
+{
+  size_t size;
+  wasm_frame_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_frame_vec_t;
+void wasm_frame_vec_new_empty(wasm_frame_vec_t *);
+void wasm_frame_vec_new_uninitialized(wasm_frame_vec_t *, size_t);
+void wasm_frame_vec_new(wasm_frame_vec_t *, size_t, wasm_frame_t **);
+void wasm_frame_vec_copy(wasm_frame_vec_t *, wasm_frame_vec_t *);
+void wasm_frame_vec_delete(wasm_frame_vec_t *);
+wasm_frame_t *wasm_frame_copy(wasm_frame_t *);
+struct wasm_instance_t *wasm_frame_instance(wasm_frame_t *);
+uint32_t wasm_frame_func_index(wasm_frame_t *);
+size_t wasm_frame_func_offset(wasm_frame_t *);
+size_t wasm_frame_module_offset(wasm_frame_t *);
+typedef wasm_name_t wasm_message_t;
+typedef struct wasm_trap_t wasm_trap_t;
+void wasm_trap_delete(wasm_trap_t *);
+wasm_trap_t *wasm_trap_copy(wasm_trap_t *);
+_Bool wasm_trap_same(wasm_trap_t *, wasm_trap_t *);
+void *wasm_trap_get_host_info(wasm_trap_t *);
+void wasm_trap_set_host_info(wasm_trap_t *, void *);
+void wasm_trap_set_host_info_with_finalizer(wasm_trap_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_trap_as_ref(wasm_trap_t *);
+wasm_trap_t *wasm_ref_as_trap(wasm_ref_t *);
+wasm_ref_t *wasm_trap_as_ref_const(wasm_trap_t *);
+wasm_trap_t *wasm_ref_as_trap_const(wasm_ref_t *);
+wasm_trap_t *wasm_trap_new(wasm_store_t *, wasm_message_t *);
+void wasm_trap_message(wasm_trap_t *, wasm_message_t *);
+wasm_frame_t *wasm_trap_origin(wasm_trap_t *);
+void wasm_trap_trace(wasm_trap_t *, wasm_frame_vec_t *);
+typedef struct wasm_foreign_t wasm_foreign_t;
+void wasm_foreign_delete(wasm_foreign_t *);
+wasm_foreign_t *wasm_foreign_copy(wasm_foreign_t *);
+_Bool wasm_foreign_same(wasm_foreign_t *, wasm_foreign_t *);
+void *wasm_foreign_get_host_info(wasm_foreign_t *);
+void wasm_foreign_set_host_info(wasm_foreign_t *, void *);
+void wasm_foreign_set_host_info_with_finalizer(wasm_foreign_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_foreign_as_ref(wasm_foreign_t *);
+wasm_foreign_t *wasm_ref_as_foreign(wasm_ref_t *);
+wasm_ref_t *wasm_foreign_as_ref_const(wasm_foreign_t *);
+wasm_foreign_t *wasm_ref_as_foreign_const(wasm_ref_t *);
+wasm_foreign_t *wasm_foreign_new(wasm_store_t *);
+struct WASMModuleCommon;
+typedef struct WASMModuleCommon *wasm_module_t;
+wasm_module_t *wasm_module_new(wasm_store_t *, wasm_byte_vec_t *);
+void wasm_module_delete(wasm_module_t *);
+_Bool wasm_module_validate(wasm_store_t *, wasm_byte_vec_t *);
+void wasm_module_imports(wasm_module_t *, wasm_importtype_vec_t *);
+void wasm_module_exports(wasm_module_t *, wasm_exporttype_vec_t *);
+void wasm_module_serialize(wasm_module_t *, wasm_byte_vec_t *);
+wasm_module_t *wasm_module_deserialize(wasm_store_t *, wasm_byte_vec_t *);
+typedef struct wasm_func_t wasm_func_t;
+void wasm_func_delete(wasm_func_t *);
+wasm_func_t *wasm_func_copy(wasm_func_t *);
+_Bool wasm_func_same(wasm_func_t *, wasm_func_t *);
+void *wasm_func_get_host_info(wasm_func_t *);
+void wasm_func_set_host_info(wasm_func_t *, void *);
+void wasm_func_set_host_info_with_finalizer(wasm_func_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_func_as_ref(wasm_func_t *);
+wasm_func_t *wasm_ref_as_func(wasm_ref_t *);
+wasm_ref_t *wasm_func_as_ref_const(wasm_func_t *);
+wasm_func_t *wasm_ref_as_func_const(wasm_ref_t *);
+typedef wasm_trap_t *(*wasm_func_callback_t)(wasm_val_vec_t *, wasm_val_vec_t *);
+typedef wasm_trap_t *(*wasm_func_callback_with_env_t)(void *, wasm_val_vec_t *, wasm_val_vec_t *);
+wasm_func_t *wasm_func_new(wasm_store_t *, wasm_functype_t *, wasm_func_callback_t);
+wasm_func_t *wasm_func_new_with_env(wasm_store_t *, wasm_functype_t *, wasm_func_callback_with_env_t, void *, void (*)(void *));
+wasm_functype_t *wasm_func_type(wasm_func_t *);
+size_t wasm_func_param_arity(wasm_func_t *);
+size_t wasm_func_result_arity(wasm_func_t *);
+wasm_trap_t *wasm_func_call(wasm_func_t *, wasm_val_vec_t *, wasm_val_vec_t *);
+typedef struct wasm_global_t wasm_global_t;
+void wasm_global_delete(wasm_global_t *);
+wasm_global_t *wasm_global_copy(wasm_global_t *);
+_Bool wasm_global_same(wasm_global_t *, wasm_global_t *);
+void *wasm_global_get_host_info(wasm_global_t *);
+void wasm_global_set_host_info(wasm_global_t *, void *);
+void wasm_global_set_host_info_with_finalizer(wasm_global_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_global_as_ref(wasm_global_t *);
+wasm_global_t *wasm_ref_as_global(wasm_ref_t *);
+wasm_ref_t *wasm_global_as_ref_const(wasm_global_t *);
+wasm_global_t *wasm_ref_as_global_const(wasm_ref_t *);
+wasm_global_t *wasm_global_new(wasm_store_t *, wasm_globaltype_t *, wasm_val_t *);
+wasm_globaltype_t *wasm_global_type(wasm_global_t *);
+void wasm_global_get(wasm_global_t *, wasm_val_t *);
+void wasm_global_set(wasm_global_t *, wasm_val_t *);
+typedef struct wasm_table_t wasm_table_t;
+void wasm_table_delete(wasm_table_t *);
+wasm_table_t *wasm_table_copy(wasm_table_t *);
+_Bool wasm_table_same(wasm_table_t *, wasm_table_t *);
+void *wasm_table_get_host_info(wasm_table_t *);
+void wasm_table_set_host_info(wasm_table_t *, void *);
+void wasm_table_set_host_info_with_finalizer(wasm_table_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_table_as_ref(wasm_table_t *);
+wasm_table_t *wasm_ref_as_table(wasm_ref_t *);
+wasm_ref_t *wasm_table_as_ref_const(wasm_table_t *);
+wasm_table_t *wasm_ref_as_table_const(wasm_ref_t *);
+typedef uint32_t wasm_table_size_t;
+wasm_table_t *wasm_table_new(wasm_store_t *, wasm_tabletype_t *, wasm_ref_t *);
+wasm_tabletype_t *wasm_table_type(wasm_table_t *);
+wasm_ref_t *wasm_table_get(wasm_table_t *, wasm_table_size_t);
+_Bool wasm_table_set(wasm_table_t *, wasm_table_size_t, wasm_ref_t *);
+wasm_table_size_t wasm_table_size(wasm_table_t *);
+_Bool wasm_table_grow(wasm_table_t *, wasm_table_size_t, wasm_ref_t *);
+typedef struct wasm_memory_t wasm_memory_t;
+void wasm_memory_delete(wasm_memory_t *);
+wasm_memory_t *wasm_memory_copy(wasm_memory_t *);
+_Bool wasm_memory_same(wasm_memory_t *, wasm_memory_t *);
+void *wasm_memory_get_host_info(wasm_memory_t *);
+void wasm_memory_set_host_info(wasm_memory_t *, void *);
+void wasm_memory_set_host_info_with_finalizer(wasm_memory_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_memory_as_ref(wasm_memory_t *);
+wasm_memory_t *wasm_ref_as_memory(wasm_ref_t *);
+wasm_ref_t *wasm_memory_as_ref_const(wasm_memory_t *);
+wasm_memory_t *wasm_ref_as_memory_const(wasm_ref_t *);
+typedef uint32_t wasm_memory_pages_t;
+wasm_memory_t *wasm_memory_new(wasm_store_t *, wasm_memorytype_t *);
+wasm_memorytype_t *wasm_memory_type(wasm_memory_t *);
+byte_t *wasm_memory_data(wasm_memory_t *);
+size_t wasm_memory_data_size(wasm_memory_t *);
+wasm_memory_pages_t wasm_memory_size(wasm_memory_t *);
+_Bool wasm_memory_grow(wasm_memory_t *, wasm_memory_pages_t);
+typedef struct wasm_extern_t wasm_extern_t;
+void wasm_extern_delete(wasm_extern_t *);
+wasm_extern_t *wasm_extern_copy(wasm_extern_t *);
+_Bool wasm_extern_same(wasm_extern_t *, wasm_extern_t *);
+void *wasm_extern_get_host_info(wasm_extern_t *);
+void wasm_extern_set_host_info(wasm_extern_t *, void *);
+void wasm_extern_set_host_info_with_finalizer(wasm_extern_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_extern_as_ref(wasm_extern_t *);
+wasm_extern_t *wasm_ref_as_extern(wasm_ref_t *);
+wasm_ref_t *wasm_extern_as_ref_const(wasm_extern_t *);
+wasm_extern_t *wasm_ref_as_extern_const(wasm_ref_t *);
+typedef struct wasm_extern_vec_t
+{
+  size_t size;
+  wasm_extern_t **data;
+  size_t num_elems;
+  size_t size_of_elem;
+  void *lock;
+} wasm_extern_vec_t;
+void wasm_extern_vec_new_empty(wasm_extern_vec_t *);
+void wasm_extern_vec_new_uninitialized(wasm_extern_vec_t *, size_t);
+void wasm_extern_vec_new(wasm_extern_vec_t *, size_t, wasm_extern_t **);
+void wasm_extern_vec_copy(wasm_extern_vec_t *, wasm_extern_vec_t *);
+void wasm_extern_vec_delete(wasm_extern_vec_t *);
+wasm_externkind_t wasm_extern_kind(wasm_extern_t *);
+wasm_externtype_t *wasm_extern_type(wasm_extern_t *);
+wasm_extern_t *wasm_func_as_extern(wasm_func_t *);
+wasm_extern_t *wasm_global_as_extern(wasm_global_t *);
+wasm_extern_t *wasm_table_as_extern(wasm_table_t *);
+wasm_extern_t *wasm_memory_as_extern(wasm_memory_t *);
+wasm_func_t *wasm_extern_as_func(wasm_extern_t *);
+wasm_global_t *wasm_extern_as_global(wasm_extern_t *);
+wasm_table_t *wasm_extern_as_table(wasm_extern_t *);
+wasm_memory_t *wasm_extern_as_memory(wasm_extern_t *);
+wasm_extern_t *wasm_func_as_extern_const(wasm_func_t *);
+wasm_extern_t *wasm_global_as_extern_const(wasm_global_t *);
+wasm_extern_t *wasm_table_as_extern_const(wasm_table_t *);
+wasm_extern_t *wasm_memory_as_extern_const(wasm_memory_t *);
+wasm_func_t *wasm_extern_as_func_const(wasm_extern_t *);
+wasm_global_t *wasm_extern_as_global_const(wasm_extern_t *);
+wasm_table_t *wasm_extern_as_table_const(wasm_extern_t *);
+wasm_memory_t *wasm_extern_as_memory_const(wasm_extern_t *);
+typedef struct wasm_instance_t wasm_instance_t;
+void wasm_instance_delete(wasm_instance_t *);
+wasm_instance_t *wasm_instance_copy(wasm_instance_t *);
+_Bool wasm_instance_same(wasm_instance_t *, wasm_instance_t *);
+void *wasm_instance_get_host_info(wasm_instance_t *);
+void wasm_instance_set_host_info(wasm_instance_t *, void *);
+void wasm_instance_set_host_info_with_finalizer(wasm_instance_t *, void *, void (*)(void *));
+wasm_ref_t *wasm_instance_as_ref(wasm_instance_t *);
+wasm_instance_t *wasm_ref_as_instance(wasm_ref_t *);
+wasm_ref_t *wasm_instance_as_ref_const(wasm_instance_t *);
+wasm_instance_t *wasm_ref_as_instance_const(wasm_ref_t *);
+wasm_instance_t *wasm_instance_new(wasm_store_t *, wasm_module_t *, wasm_extern_vec_t *, wasm_trap_t **);
+wasm_instance_t *wasm_instance_new_with_args(wasm_store_t *, wasm_module_t *, wasm_extern_vec_t *, wasm_trap_t **, uint32_t, uint32_t);
+void wasm_instance_exports(wasm_instance_t *, wasm_extern_vec_t *);
+"""
+)
+
+_lib = None
+
+
+def _library():
+    # dlopen the same libiwasm which wamr.ffi loads
+    global _lib
+
+    if _lib is None:
+        # a pathlib.Path for ctypes, cffi takes a str
+        _lib = ffi.dlopen(os.fspath(load_library()._name))
+
+    return _lib
+
+
+def __getattr__(name):
+    if name not in _SYMBOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(_library(), name)
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SYMBOLS))
+
+
+_SYMBOLS = frozenset(
+    [
+        "wasm_byte_vec_new_empty",
+        "wasm_byte_vec_new_uninitialized",
+        "wasm_byte_vec_new",
+        "wasm_byte_vec_copy",
+        "wasm_byte_vec_delete",
+        "wasm_config_delete",
+        "wasm_config_new",
+        "wasm_engine_delete",
+        "wasm_engine_new",
+        "wasm_engine_new_with_config",
+        "wasm_store_delete",
+        "wasm_store_new",
+        "wasm_valtype_delete",
+        "wasm_valtype_vec_new_empty",
+        "wasm_valtype_vec_new_uninitialized",
+        "wasm_valtype_vec_new",
+        "wasm_valtype_vec_copy",
+        "wasm_valtype_vec_delete",
+        "wasm_valtype_copy",
+        "wasm_valtype_new",
+        "wasm_valtype_kind",
+        "wasm_functype_delete",
+        "wasm_functype_vec_new_empty",
+        "wasm_functype_vec_new_uninitialized",
+        "wasm_functype_vec_new",
+        "wasm_functype_vec_copy",
+        "wasm_functype_vec_delete",
+        "wasm_functype_copy",
+        "wasm_functype_new",
+        "wasm_functype_params",
+        "wasm_functype_results",
+        "wasm_globaltype_delete",
+        "wasm_globaltype_vec_new_empty",
+        "wasm_globaltype_vec_new_uninitialized",
+        "wasm_globaltype_vec_new",
+        "wasm_globaltype_vec_copy",
+        "wasm_globaltype_vec_delete",
+        "wasm_globaltype_copy",
+        "wasm_globaltype_new",
+        "wasm_globaltype_content",
+        "wasm_globaltype_mutability",
+        "wasm_tabletype_delete",
+        "wasm_tabletype_vec_new_empty",
+        "wasm_tabletype_vec_new_uninitialized",
+        "wasm_tabletype_vec_new",
+        "wasm_tabletype_vec_copy",
+        "wasm_tabletype_vec_delete",
+        "wasm_tabletype_copy",
+        "wasm_tabletype_new",
+        "wasm_tabletype_element",
+        "wasm_tabletype_limits",
+        "wasm_memorytype_delete",
+        "wasm_memorytype_vec_new_empty",
+        "wasm_memorytype_vec_new_uninitialized",
+        "wasm_memorytype_vec_new",
+        "wasm_memorytype_vec_copy",
+        "wasm_memorytype_vec_delete",
+        "wasm_memorytype_copy",
+        "wasm_memorytype_new",
+        "wasm_memorytype_limits",
+        "wasm_externtype_delete",
+        "wasm_externtype_vec_new_empty",
+        "wasm_externtype_vec_new_uninitialized",
+        "wasm_externtype_vec_new",
+        "wasm_externtype_vec_copy",
+        "wasm_externtype_vec_delete",
+        "wasm_externtype_copy",
+        "wasm_externtype_kind",
+        "wasm_functype_as_externtype",
+        "wasm_globaltype_as_externtype",
+        "wasm_tabletype_as_externtype",
+        "wasm_memorytype_as_externtype",
+        "wasm_externtype_as_functype",
+        "wasm_externtype_as_globaltype",
+        "wasm_externtype_as_tabletype",
+        "wasm_externtype_as_memorytype",
+        "wasm_functype_as_externtype_const",
+        "wasm_globaltype_as_externtype_const",
+        "wasm_tabletype_as_externtype_const",
+        "wasm_memorytype_as_externtype_const",
+        "wasm_externtype_as_functype_const",
+        "wasm_externtype_as_globaltype_const",
+        "wasm_externtype_as_tabletype_const",
+        "wasm_externtype_as_memorytype_const",
+        "wasm_importtype_delete",
+        "wasm_importtype_vec_new_empty",
+        "wasm_importtype_vec_new_uninitialized",
+        "wasm_importtype_vec_new",
+        "wasm_importtype_vec_copy",
+        "wasm_importtype_vec_delete",
+        "wasm_importtype_copy",
+        "wasm_importtype_new",
+        "wasm_importtype_module",
+        "wasm_importtype_name",
+        "wasm_importtype_type",
+        "wasm_exporttype_delete",
+        "wasm_exporttype_vec_new_empty",
+        "wasm_exporttype_vec_new_uninitialized",
+        "wasm_exporttype_vec_new",
+        "wasm_exporttype_vec_copy",
+        "wasm_exporttype_vec_delete",
+        "wasm_exporttype_copy",
+        "wasm_exporttype_new",
+        "wasm_exporttype_name",
+        "wasm_exporttype_type",
+        "wasm_val_delete",
+        "wasm_val_copy",
+        "wasm_val_vec_new_empty",
+        "wasm_val_vec_new_uninitialized",
+        "wasm_val_vec_new",
+        "wasm_val_vec_copy",
+        "wasm_val_vec_delete",
+        "wasm_ref_delete",
+        "wasm_ref_copy",
+        "wasm_ref_same",
+        "wasm_ref_get_host_info",
+        "wasm_ref_set_host_info",
+        "wasm_ref_set_host_info_with_finalizer",
+        "wasm_frame_delete",
+        "wasm_frame_vec_new_empty",
+        "wasm_frame_vec_new_uninitialized",
+        "wasm_frame_vec_new",
+        "wasm_frame_vec_copy",
+        "wasm_frame_vec_delete",
+        "wasm_frame_copy",
+        "wasm_frame_instance",
+        "wasm_frame_func_index",
+        "wasm_frame_func_offset",
+        "wasm_frame_module_offset",
+        "wasm_trap_delete",
+        "wasm_trap_copy",
+        "wasm_trap_same",
+        "wasm_trap_get_host_info",
+        "wasm_trap_set_host_info",
+        "wasm_trap_set_host_info_with_finalizer",
+        "wasm_trap_as_ref",
+        "wasm_ref_as_trap",
+        "wasm_trap_as_ref_const",
+        "wasm_ref_as_trap_const",
+        "wasm_trap_new",
+        "wasm_trap_message",
+        "wasm_trap_origin",
+        "wasm_trap_trace",
+        "wasm_foreign_delete",
+        "wasm_foreign_copy",
+        "wasm_foreign_same",
+        "wasm_foreign_get_host_info",
+        "wasm_foreign_set_host_info",
+        "wasm_foreign_set_host_info_with_finalizer",
+        "wasm_foreign_as_ref",
+        "wasm_ref_as_foreign",
+        "wasm_foreign_as_ref_const",
+        "wasm_ref_as_foreign_const",
+        "wasm_foreign_new",
+        "wasm_module_new",
+        "wasm_module_delete",
+        "wasm_module_validate",
+        "wasm_module_imports",
+        "wasm_module_exports",
+        "wasm_module_serialize",
+        "wasm_module_deserialize",
+        "wasm_func_delete",
+        "wasm_func_copy",
+        "wasm_func_same",
+        "wasm_func_get_host_info",
+        "wasm_func_set_host_info",
+        "wasm_func_set_host_info_with_finalizer",
+        "wasm_func_as_ref",
+        "wasm_ref_as_func",
+        "wasm_func_as_ref_const",
+        "wasm_ref_as_func_const",
+        "wasm_func_new",
+        "wasm_func_new_with_env",
+        "wasm_func_type",
+        "wasm_func_param_arity",
+        "wasm_func_result_arity",
+        "wasm_func_call",
+        "wasm_global_delete",
+        "wasm_global_copy",
+        "wasm_global_same",
+        "wasm_global_get_host_info",
+        "wasm_global_set_host_info",
+        "wasm_global_set_host_info_with_finalizer",
+        "wasm_global_as_ref",
+        "wasm_ref_as_global",
+        "wasm_global_as_ref_const",
+        "wasm_ref_as_global_const",
+        "wasm_global_new",
+        "wasm_global_type",
+        "wasm_global_get",
+        "wasm_global_set",
+        "wasm_table_delete",
+        "wasm_table_copy",
+        "wasm_table_same",
+        "wasm_table_get_host_info",
+        "wasm_table_set_host_info",
+        "wasm_table_set_host_info_with_finalizer",
+        "wasm_table_as_ref",
+        "wasm_ref_as_table",
+        "wasm_table_as_ref_const",
+        "wasm_ref_as_table_const",
+        "wasm_table_new",
+        "wasm_table_type",
+        "wasm_table_get",
+        "wasm_table_set",
+        "wasm_table_size",
+        "wasm_table_grow",
+        "wasm_memory_delete",
+        "wasm_memory_copy",
+        "wasm_memory_same",
+        "wasm_memory_get_host_info",
+        "wasm_memory_set_host_info",
+        "wasm_memory_set_host_info_with_finalizer",
+        "wasm_memory_as_ref",
+        "wasm_ref_as_memory",
+        "wasm_memory_as_ref_const",
+        "wasm_ref_as_memory_const",
+        "wasm_memory_new",
+        "wasm_memory_type",
+        "wasm_memory_data",
+        "wasm_memory_data_size",
+        "wasm_memory_size",
+        "wasm_memory_grow",
+        "wasm_extern_delete",
+        "wasm_extern_copy",
+        "wasm_extern_same",
+        "wasm_extern_get_host_info",
+        "wasm_extern_set_host_info",
+        "wasm_extern_set_host_info_with_finalizer",
+        "wasm_extern_as_ref",
+        "wasm_ref_as_extern",
+        "wasm_extern_as_ref_const",
+        "wasm_ref_as_extern_const",
+        "wasm_extern_vec_new_empty",
+        "wasm_extern_vec_new_uninitialized",
+        "wasm_extern_vec_new",
+        "wasm_extern_vec_copy",
+        "wasm_extern_vec_delete",
+        "wasm_extern_kind",
+        "wasm_extern_type",
+        "wasm_func_as_extern",
+        "wasm_global_as_extern",
+        "wasm_table_as_extern",
+        "wasm_memory_as_extern",
+        "wasm_extern_as_func",
+        "wasm_extern_as_global",
+        "wasm_extern_as_table",
+        "wasm_extern_as_memory",
+        "wasm_func_as_extern_const",
+        "wasm_global_as_extern_const",
+        "wasm_table_as_extern_const",
+        "wasm_memory_as_extern_const",
+        "wasm_extern_as_func_const",
+        "wasm_extern_as_global_const",
+        "wasm_extern_as_table_const",
+        "wasm_extern_as_memory_const",
+        "wasm_instance_delete",
+        "wasm_instance_copy",
+        "wasm_instance_same",
+        "wasm_instance_get_host_info",
+        "wasm_instance_set_host_info",
+        "wasm_instance_set_host_info_with_finalizer",
+        "wasm_instance_as_ref",
+        "wasm_ref_as_instance",
+        "wasm_instance_as_ref_const",
+        "wasm_ref_as_instance_const",
+        "wasm_instance_new",
+        "wasm_instance_new_with_args",
+        "wasm_instance_exports",
+    ]
+)
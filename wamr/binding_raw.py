@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+#It is a generated file. DO NOT EDIT.
+#
+# Handles are plain integers. Pointer arguments accept `int`s, None, or
+# ctypes objects from byref()/pointer()/addressof(). Pointer results are
+# `int`s and 0 means NULL.
+#
+from ctypes import *
+
+from .ffi import load_library
+
+
+def _prototype(name, restype, argtypes):
+    # resolve and type a foreign function once, callers use it directly.
+    # Short accessors in _HOLD_GIL come from a PyDLL handle
+    func = load_library(name in _HOLD_GIL)[name]
+    func.restype = restype
+    func.argtypes = argtypes
+    return func
+
+
+def __getattr__(name):
+    # materialize a foreign function when it is touched for the first time
+    if name not in _PROTOTYPES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = _prototype(name, *_PROTOTYPES[name])
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PROTOTYPES))
+
+
+_PROTOTYPES = {
+    "wasm_byte_vec_new_empty": (None, [c_void_p]),
+    "wasm_byte_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_byte_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_byte_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_byte_vec_delete": (None, [c_void_p]),
+    "wasm_config_delete": (None, [c_void_p]),
+    "wasm_config_new": (c_size_t, None),
+    "wasm_engine_delete": (None, [c_void_p]),
+    "wasm_engine_new": (c_size_t, None),
+    "wasm_engine_new_with_config": (c_size_t, [c_void_p]),
+    "wasm_store_delete": (None, [c_void_p]),
+    "wasm_store_new": (c_size_t, [c_void_p]),
+    "wasm_valtype_delete": (None, [c_void_p]),
+    "wasm_valtype_vec_new_empty": (None, [c_void_p]),
+    "wasm_valtype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_valtype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_valtype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_valtype_vec_delete": (None, [c_void_p]),
+    "wasm_valtype_copy": (c_size_t, [c_void_p]),
+    "wasm_valtype_new": (c_size_t, [c_uint8]),
+    "wasm_valtype_kind": (c_uint8, [c_void_p]),
+    "wasm_functype_delete": (None, [c_void_p]),
+    "wasm_functype_vec_new_empty": (None, [c_void_p]),
+    "wasm_functype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_functype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_functype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_functype_vec_delete": (None, [c_void_p]),
+    "wasm_functype_copy": (c_size_t, [c_void_p]),
+    "wasm_functype_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_functype_params": (c_size_t, [c_void_p]),
+    "wasm_functype_results": (c_size_t, [c_void_p]),
+    "wasm_globaltype_delete": (None, [c_void_p]),
+    "wasm_globaltype_vec_new_empty": (None, [c_void_p]),
+    "wasm_globaltype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_globaltype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_globaltype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_globaltype_vec_delete": (None, [c_void_p]),
+    "wasm_globaltype_copy": (c_size_t, [c_void_p]),
+    "wasm_globaltype_new": (c_size_t, [c_void_p,c_uint8]),
+    "wasm_globaltype_content": (c_size_t, [c_void_p]),
+    "wasm_globaltype_mutability": (c_uint8, [c_void_p]),
+    "wasm_tabletype_delete": (None, [c_void_p]),
+    "wasm_tabletype_vec_new_empty": (None, [c_void_p]),
+    "wasm_tabletype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_tabletype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_tabletype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_tabletype_vec_delete": (None, [c_void_p]),
+    "wasm_tabletype_copy": (c_size_t, [c_void_p]),
+    "wasm_tabletype_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_tabletype_element": (c_size_t, [c_void_p]),
+    "wasm_tabletype_limits": (c_size_t, [c_void_p]),
+    "wasm_memorytype_delete": (None, [c_void_p]),
+    "wasm_memorytype_vec_new_empty": (None, [c_void_p]),
+    "wasm_memorytype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_memorytype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_memorytype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_memorytype_vec_delete": (None, [c_void_p]),
+    "wasm_memorytype_copy": (c_size_t, [c_void_p]),
+    "wasm_memorytype_new": (c_size_t, [c_void_p]),
+    "wasm_memorytype_limits": (c_size_t, [c_void_p]),
+    "wasm_externtype_delete": (None, [c_void_p]),
+    "wasm_externtype_vec_new_empty": (None, [c_void_p]),
+    "wasm_externtype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_externtype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_externtype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_externtype_vec_delete": (None, [c_void_p]),
+    "wasm_externtype_copy": (c_size_t, [c_void_p]),
+    "wasm_externtype_kind": (c_uint8, [c_void_p]),
+    "wasm_functype_as_externtype": (c_size_t, [c_void_p]),
+    "wasm_globaltype_as_externtype": (c_size_t, [c_void_p]),
+    "wasm_tabletype_as_externtype": (c_size_t, [c_void_p]),
+    "wasm_memorytype_as_externtype": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_functype": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_globaltype": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_tabletype": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_memorytype": (c_size_t, [c_void_p]),
+    "wasm_functype_as_externtype_const": (c_size_t, [c_void_p]),
+    "wasm_globaltype_as_externtype_const": (c_size_t, [c_void_p]),
+    "wasm_tabletype_as_externtype_const": (c_size_t, [c_void_p]),
+    "wasm_memorytype_as_externtype_const": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_functype_const": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_globaltype_const": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_tabletype_const": (c_size_t, [c_void_p]),
+    "wasm_externtype_as_memorytype_const": (c_size_t, [c_void_p]),
+    "wasm_importtype_delete": (None, [c_void_p]),
+    "wasm_importtype_vec_new_empty": (None, [c_void_p]),
+    "wasm_importtype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_importtype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_importtype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_importtype_vec_delete": (None, [c_void_p]),
+    "wasm_importtype_copy": (c_size_t, [c_void_p]),
+    "wasm_importtype_new": (c_size_t, [c_void_p,c_void_p,c_void_p]),
+    "wasm_importtype_module": (c_size_t, [c_void_p]),
+    "wasm_importtype_name": (c_size_t, [c_void_p]),
+    "wasm_importtype_type": (c_size_t, [c_void_p]),
+    "wasm_exporttype_delete": (None, [c_void_p]),
+    "wasm_exporttype_vec_new_empty": (None, [c_void_p]),
+    "wasm_exporttype_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_exporttype_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_exporttype_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_exporttype_vec_delete": (None, [c_void_p]),
+    "wasm_exporttype_copy": (c_size_t, [c_void_p]),
+    "wasm_exporttype_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_exporttype_name": (c_size_t, [c_void_p]),
+    "wasm_exporttype_type": (c_size_t, [c_void_p]),
+    "wasm_val_delete": (None, [c_void_p]),
+    "wasm_val_copy": (None, [c_void_p,c_void_p]),
+    "wasm_val_vec_new_empty": (None, [c_void_p]),
+    "wasm_val_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_val_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_val_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_val_vec_delete": (None, [c_void_p]),
+    "wasm_ref_delete": (None, [c_void_p]),
+    "wasm_ref_copy": (c_size_t, [c_void_p]),
+    "wasm_ref_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_ref_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_ref_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_ref_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_frame_delete": (None, [c_void_p]),
+    "wasm_frame_vec_new_empty": (None, [c_void_p]),
+    "wasm_frame_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_frame_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_frame_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_frame_vec_delete": (None, [c_void_p]),
+    "wasm_frame_copy": (c_size_t, [c_void_p]),
+    "wasm_frame_instance": (c_size_t, [c_void_p]),
+    "wasm_frame_func_index": (c_uint32, [c_void_p]),
+    "wasm_frame_func_offset": (c_size_t, [c_void_p]),
+    "wasm_frame_module_offset": (c_size_t, [c_void_p]),
+    "wasm_trap_delete": (None, [c_void_p]),
+    "wasm_trap_copy": (c_size_t, [c_void_p]),
+    "wasm_trap_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_trap_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_trap_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_trap_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_trap_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_trap": (c_size_t, [c_void_p]),
+    "wasm_trap_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_trap_const": (c_size_t, [c_void_p]),
+    "wasm_trap_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_trap_message": (None, [c_void_p,c_void_p]),
+    "wasm_trap_origin": (c_size_t, [c_void_p]),
+    "wasm_trap_trace": (None, [c_void_p,c_void_p]),
+    "wasm_foreign_delete": (None, [c_void_p]),
+    "wasm_foreign_copy": (c_size_t, [c_void_p]),
+    "wasm_foreign_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_foreign_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_foreign_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_foreign_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_foreign_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_foreign": (c_size_t, [c_void_p]),
+    "wasm_foreign_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_foreign_const": (c_size_t, [c_void_p]),
+    "wasm_foreign_new": (c_size_t, [c_void_p]),
+    "wasm_module_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_module_delete": (None, [c_void_p]),
+    "wasm_module_validate": (c_bool, [c_void_p,c_void_p]),
+    "wasm_module_imports": (None, [c_void_p,c_void_p]),
+    "wasm_module_exports": (None, [c_void_p,c_void_p]),
+    "wasm_module_serialize": (None, [c_void_p,c_void_p]),
+    "wasm_module_deserialize": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_func_delete": (None, [c_void_p]),
+    "wasm_func_copy": (c_size_t, [c_void_p]),
+    "wasm_func_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_func_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_func_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_func_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_func_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_func": (c_size_t, [c_void_p]),
+    "wasm_func_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_func_const": (c_size_t, [c_void_p]),
+    "wasm_func_new": (c_size_t, [c_void_p,c_void_p,c_void_p]),
+    "wasm_func_new_with_env": (c_size_t, [c_void_p,c_void_p,c_void_p,c_void_p,c_void_p]),
+    "wasm_func_type": (c_size_t, [c_void_p]),
+    "wasm_func_param_arity": (c_size_t, [c_void_p]),
+    "wasm_func_result_arity": (c_size_t, [c_void_p]),
+    "wasm_func_call": (c_size_t, [c_void_p,c_void_p,c_void_p]),
+    "wasm_global_delete": (None, [c_void_p]),
+    "wasm_global_copy": (c_size_t, [c_void_p]),
+    "wasm_global_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_global_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_global_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_global_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_global_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_global": (c_size_t, [c_void_p]),
+    "wasm_global_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_global_const": (c_size_t, [c_void_p]),
+    "wasm_global_new": (c_size_t, [c_void_p,c_void_p,c_void_p]),
+    "wasm_global_type": (c_size_t, [c_void_p]),
+    "wasm_global_get": (None, [c_void_p,c_void_p]),
+    "wasm_global_set": (None, [c_void_p,c_void_p]),
+    "wasm_table_delete": (None, [c_void_p]),
+    "wasm_table_copy": (c_size_t, [c_void_p]),
+    "wasm_table_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_table_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_table_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_table_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_table_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_table": (c_size_t, [c_void_p]),
+    "wasm_table_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_table_const": (c_size_t, [c_void_p]),
+    "wasm_table_new": (c_size_t, [c_void_p,c_void_p,c_void_p]),
+    "wasm_table_type": (c_size_t, [c_void_p]),
+    "wasm_table_get": (c_size_t, [c_void_p,c_uint32]),
+    "wasm_table_set": (c_bool, [c_void_p,c_uint32,c_void_p]),
+    "wasm_table_size": (c_uint32, [c_void_p]),
+    "wasm_table_grow": (c_bool, [c_void_p,c_uint32,c_void_p]),
+    "wasm_memory_delete": (None, [c_void_p]),
+    "wasm_memory_copy": (c_size_t, [c_void_p]),
+    "wasm_memory_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_memory_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_memory_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_memory_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_memory_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_memory": (c_size_t, [c_void_p]),
+    "wasm_memory_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_memory_const": (c_size_t, [c_void_p]),
+    "wasm_memory_new": (c_size_t, [c_void_p,c_void_p]),
+    "wasm_memory_type": (c_size_t, [c_void_p]),
+    "wasm_memory_data": (c_size_t, [c_void_p]),
+    "wasm_memory_data_size": (c_size_t, [c_void_p]),
+    "wasm_memory_size": (c_uint32, [c_void_p]),
+    "wasm_memory_grow": (c_bool, [c_void_p,c_uint32]),
+    "wasm_extern_delete": (None, [c_void_p]),
+    "wasm_extern_copy": (c_size_t, [c_void_p]),
+    "wasm_extern_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_extern_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_extern_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_extern_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_extern_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_extern": (c_size_t, [c_void_p]),
+    "wasm_extern_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_extern_const": (c_size_t, [c_void_p]),
+    "wasm_extern_vec_new_empty": (None, [c_void_p]),
+    "wasm_extern_vec_new_uninitialized": (None, [c_void_p,c_size_t]),
+    "wasm_extern_vec_new": (None, [c_void_p,c_size_t,c_void_p]),
+    "wasm_extern_vec_copy": (None, [c_void_p,c_void_p]),
+    "wasm_extern_vec_delete": (None, [c_void_p]),
+    "wasm_extern_kind": (c_uint8, [c_void_p]),
+    "wasm_extern_type": (c_size_t, [c_void_p]),
+    "wasm_func_as_extern": (c_size_t, [c_void_p]),
+    "wasm_global_as_extern": (c_size_t, [c_void_p]),
+    "wasm_table_as_extern": (c_size_t, [c_void_p]),
+    "wasm_memory_as_extern": (c_size_t, [c_void_p]),
+    "wasm_extern_as_func": (c_size_t, [c_void_p]),
+    "wasm_extern_as_global": (c_size_t, [c_void_p]),
+    "wasm_extern_as_table": (c_size_t, [c_void_p]),
+    "wasm_extern_as_memory": (c_size_t, [c_void_p]),
+    "wasm_func_as_extern_const": (c_size_t, [c_void_p]),
+    "wasm_global_as_extern_const": (c_size_t, [c_void_p]),
+    "wasm_table_as_extern_const": (c_size_t, [c_void_p]),
+    "wasm_memory_as_extern_const": (c_size_t, [c_void_p]),
+    "wasm_extern_as_func_const": (c_size_t, [c_void_p]),
+    "wasm_extern_as_global_const": (c_size_t, [c_void_p]),
+    "wasm_extern_as_table_const": (c_size_t, [c_void_p]),
+    "wasm_extern_as_memory_const": (c_size_t, [c_void_p]),
+    "wasm_instance_delete": (None, [c_void_p]),
+    "wasm_instance_copy": (c_size_t, [c_void_p]),
+    "wasm_instance_same": (c_bool, [c_void_p,c_void_p]),
+    "wasm_instance_get_host_info": (c_size_t, [c_void_p]),
+    "wasm_instance_set_host_info": (None, [c_void_p,c_void_p]),
+    "wasm_instance_set_host_info_with_finalizer": (None, [c_void_p,c_void_p,c_void_p]),
+    "wasm_instance_as_ref": (c_size_t, [c_void_p]),
+    "wasm_ref_as_instance": (c_size_t, [c_void_p]),
+    "wasm_instance_as_ref_const": (c_size_t, [c_void_p]),
+    "wasm_ref_as_instance_const": (c_size_t, [c_void_p]),
+    "wasm_instance_new": (c_size_t, [c_void_p,c_void_p,c_void_p,c_void_p]),
+    "wasm_instance_new_with_args": (c_size_t, [c_void_p,c_void_p,c_void_p,c_void_p,c_uint32,c_uint32]),
+    "wasm_instance_exports": (None, [c_void_p,c_void_p]),
+}
+
+# take only handles and scalars. Others need addresses of buffers which
+# are owned by callers, like wasm_xxx_vec_t, wasm_val_t or callbacks
+HANDLE_ONLY = frozenset(
+    [
+        "wasm_config_delete",
+        "wasm_config_new",
+        "wasm_engine_delete",
+        "wasm_engine_new",
+        "wasm_engine_new_with_config",
+        "wasm_store_delete",
+        "wasm_store_new",
+        "wasm_valtype_delete",
+        "wasm_valtype_copy",
+        "wasm_valtype_new",
+        "wasm_valtype_kind",
+        "wasm_functype_delete",
+        "wasm_functype_copy",
+        "wasm_functype_params",
+        "wasm_functype_results",
+        "wasm_globaltype_delete",
+        "wasm_globaltype_copy",
+        "wasm_globaltype_new",
+        "wasm_globaltype_content",
+        "wasm_globaltype_mutability",
+        "wasm_tabletype_delete",
+        "wasm_tabletype_copy",
+        "wasm_tabletype_element",
+        "wasm_tabletype_limits",
+        "wasm_memorytype_delete",
+        "wasm_memorytype_copy",
+        "wasm_memorytype_limits",
+        "wasm_externtype_delete",
+        "wasm_externtype_copy",
+        "wasm_externtype_kind",
+        "wasm_functype_as_externtype",
+        "wasm_globaltype_as_externtype",
+        "wasm_tabletype_as_externtype",
+        "wasm_memorytype_as_externtype",
+        "wasm_externtype_as_functype",
+        "wasm_externtype_as_globaltype",
+        "wasm_externtype_as_tabletype",
+        "wasm_externtype_as_memorytype",
+        "wasm_functype_as_externtype_const",
+        "wasm_globaltype_as_externtype_const",
+        "wasm_tabletype_as_externtype_const",
+        "wasm_memorytype_as_externtype_const",
+        "wasm_externtype_as_functype_const",
+        "wasm_externtype_as_globaltype_const",
+        "wasm_externtype_as_tabletype_const",
+        "wasm_externtype_as_memorytype_const",
+        "wasm_importtype_delete",
+        "wasm_importtype_copy",
+        "wasm_importtype_module",
+        "wasm_importtype_name",
+        "wasm_importtype_type",
+        "wasm_exporttype_delete",
+        "wasm_exporttype_copy",
+        "wasm_exporttype_name",
+        "wasm_exporttype_type",
+        "wasm_frame_delete",
+        "wasm_frame_copy",
+        "wasm_frame_instance",
+        "wasm_frame_func_index",
+        "wasm_frame_func_offset",
+        "wasm_frame_module_offset",
+        "wasm_trap_delete",
+        "wasm_trap_copy",
+        "wasm_trap_same",
+        "wasm_trap_get_host_info",
+        "wasm_trap_set_host_info",
+        "wasm_trap_as_ref",
+        "wasm_trap_as_ref_const",
+        "wasm_trap_origin",
+        "wasm_foreign_delete",
+        "wasm_foreign_copy",
+        "wasm_foreign_same",
+        "wasm_foreign_get_host_info",
+        "wasm_foreign_set_host_info",
+        "wasm_foreign_as_ref",
+        "wasm_foreign_as_ref_const",
+        "wasm_foreign_new",
+        "wasm_module_delete",
+        "wasm_func_delete",
+        "wasm_func_copy",
+        "wasm_func_same",
+        "wasm_func_get_host_info",
+        "wasm_func_set_host_info",
+        "wasm_func_as_ref",
+        "wasm_func_as_ref_const",
+        "wasm_func_type",
+        "wasm_func_param_arity",
+        "wasm_func_result_arity",
+        "wasm_global_delete",
+        "wasm_global_copy",
+        "wasm_global_same",
+        "wasm_global_get_host_info",
+        "wasm_global_set_host_info",
+        "wasm_global_as_ref",
+        "wasm_global_as_ref_const",
+        "wasm_global_type",
+        "wasm_table_delete",
+        "wasm_table_copy",
+        "wasm_table_same",
+        "wasm_table_get_host_info",
+        "wasm_table_set_host_info",
+        "wasm_table_as_ref",
+        "wasm_table_as_ref_const",
+        "wasm_table_type",
+        "wasm_table_get",
+        "wasm_table_size",
+        "wasm_memory_delete",
+        "wasm_memory_copy",
+        "wasm_memory_same",
+        "wasm_memory_get_host_info",
+        "wasm_memory_set_host_info",
+        "wasm_memory_as_ref",
+        "wasm_memory_as_ref_const",
+        "wasm_memory_new",
+        "wasm_memory_type",
+        "wasm_memory_data",
+        "wasm_memory_data_size",
+        "wasm_memory_size",
+        "wasm_memory_grow",
+        "wasm_extern_delete",
+        "wasm_extern_copy",
+        "wasm_extern_same",
+        "wasm_extern_get_host_info",
+        "wasm_extern_set_host_info",
+        "wasm_extern_as_ref",
+        "wasm_extern_as_ref_const",
+        "wasm_extern_kind",
+        "wasm_extern_type",
+        "wasm_func_as_extern",
+        "wasm_global_as_extern",
+        "wasm_table_as_extern",
+        "wasm_memory_as_extern",
+        "wasm_extern_as_func",
+        "wasm_extern_as_global",
+        "wasm_extern_as_table",
+        "wasm_extern_as_memory",
+        "wasm_func_as_extern_const",
+        "wasm_global_as_extern_const",
+        "wasm_table_as_extern_const",
+        "wasm_memory_as_extern_const",
+        "wasm_extern_as_func_const",
+        "wasm_extern_as_global_const",
+        "wasm_extern_as_table_const",
+        "wasm_extern_as_memory_const",
+        "wasm_instance_delete",
+        "wasm_instance_copy",
+        "wasm_instance_same",
+        "wasm_instance_get_host_info",
+        "wasm_instance_set_host_info",
+        "wasm_instance_as_ref",
+        "wasm_instance_as_ref_const",
+    ]
+)
+
+_HOLD_GIL = frozenset(
+    [
+        "wasm_valtype_kind",
+        "wasm_functype_params",
+        "wasm_functype_results",
+        "wasm_globaltype_content",
+        "wasm_globaltype_mutability",
+        "wasm_tabletype_element",
+        "wasm_tabletype_limits",
+        "wasm_memorytype_limits",
+        "wasm_externtype_kind",
+        "wasm_functype_as_externtype",
+        "wasm_globaltype_as_externtype",
+        "wasm_tabletype_as_externtype",
+        "wasm_memorytype_as_externtype",
+        "wasm_externtype_as_functype",
+        "wasm_externtype_as_globaltype",
+        "wasm_externtype_as_tabletype",
+        "wasm_externtype_as_memorytype",
+        "wasm_functype_as_externtype_const",
+        "wasm_globaltype_as_externtype_const",
+        "wasm_tabletype_as_externtype_const",
+        "wasm_memorytype_as_externtype_const",
+        "wasm_externtype_as_functype_const",
+        "wasm_externtype_as_globaltype_const",
+        "wasm_externtype_as_tabletype_const",
+        "wasm_externtype_as_memorytype_const",
+        "wasm_importtype_module",
+        "wasm_importtype_name",
+        "wasm_importtype_type",
+        "wasm_exporttype_name",
+        "wasm_exporttype_type",
+        "wasm_ref_same",
+        "wasm_ref_get_host_info",
+        "wasm_trap_same",
+        "wasm_trap_get_host_info",
+        "wasm_trap_as_ref",
+        "wasm_ref_as_trap",
+        "wasm_trap_as_ref_const",
+        "wasm_ref_as_trap_const",
+        "wasm_foreign_same",
+        "wasm_foreign_get_host_info",
+        "wasm_foreign_as_ref",
+        "wasm_ref_as_foreign",
+        "wasm_foreign_as_ref_const",
+        "wasm_ref_as_foreign_const",
+        "wasm_func_same",
+        "wasm_func_get_host_info",
+        "wasm_func_as_ref",
+        "wasm_ref_as_func",
+        "wasm_func_as_ref_const",
+        "wasm_ref_as_func_const",
+        "wasm_func_param_arity",
+        "wasm_func_result_arity",
+        "wasm_global_same",
+        "wasm_global_get_host_info",
+        "wasm_global_as_ref",
+        "wasm_ref_as_global",
+        "wasm_global_as_ref_const",
+        "wasm_ref_as_global_const",
+        "wasm_global_get",
+        "wasm_global_set",
+        "wasm_table_same",
+        "wasm_table_get_host_info",
+        "wasm_table_as_ref",
+        "wasm_ref_as_table",
+        "wasm_table_as_ref_const",
+        "wasm_ref_as_table_const",
+        "wasm_table_size",
+        "wasm_memory_same",
+        "wasm_memory_get_host_info",
+        "wasm_memory_as_ref",
+        "wasm_ref_as_memory",
+        "wasm_memory_as_ref_const",
+        "wasm_ref_as_memory_const",
+        "wasm_memory_data",
+        "wasm_memory_data_size",
+        "wasm_memory_size",
+        "wasm_extern_same",
+        "wasm_extern_get_host_info",
+        "wasm_extern_as_ref",
+        "wasm_ref_as_extern",
+        "wasm_extern_as_ref_const",
+        "wasm_ref_as_extern_const",
+        "wasm_extern_kind",
+        "wasm_func_as_extern",
+        "wasm_global_as_extern",
+        "wasm_table_as_extern",
+        "wasm_memory_as_extern",
+        "wasm_extern_as_func",
+        "wasm_extern_as_global",
+        "wasm_extern_as_table",
+        "wasm_extern_as_memory",
+        "wasm_func_as_extern_const",
+        "wasm_global_as_extern_const",
+        "wasm_table_as_extern_const",
+        "wasm_memory_as_extern_const",
+        "wasm_extern_as_func_const",
+        "wasm_extern_as_global_const",
+        "wasm_extern_as_table_const",
+        "wasm_extern_as_memory_const",
+        "wasm_instance_same",
+        "wasm_instance_get_host_info",
+        "wasm_instance_as_ref",
+        "wasm_ref_as_instance",
+        "wasm_instance_as_ref_const",
+        "wasm_ref_as_instance_const",
+    ]
+)
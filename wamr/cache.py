@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Caches of compiled modules.
+
+ModuleCache keeps modules on disk, so a new process deserializes a module
+instead of compiling it again. An entry is the output of
+wasm_module_serialize() named by the SHA-256 of the binary and of the
+libiwasm which has compiled it. Another build of libiwasm never reads
+entries of the previous one.
+
+SharedModuleCache keeps modules in memory, so loading the same binary again
+in a process returns the same wasm_module_t.
+
+Both return a module from `load(store, source)` which is given back with
+`release(module)` instead of wasm_module_delete().
+"""
+
+from collections import OrderedDict
+from contextlib import ExitStack
+import ctypes as c
+import hashlib
+import os
+import tempfile
+import threading
+
+from . import ffi
+
+SUFFIX = ".wamr"
+
+_build_id = None
+
+
+def build_id():
+    """
+    The SHA-256 of the libiwasm file, computed once per process
+    """
+    # pylint: disable=global-statement
+    global _build_id
+
+    if _build_id is None:
+        digest = hashlib.sha256()
+        with open(ffi.libpath, "rb") as library:
+            for chunk in iter(lambda: library.read(1 << 20), b""):
+                digest.update(chunk)
+        _build_id = digest.digest()
+
+    return _build_id
+
+
+class ModuleCache:
+    """
+    Serialized modules in *directory*, at most *max_bytes* in total. The
+    least recently used entries are removed when it is over, an entry is used
+    when it is written or loaded.
+
+    Entries are written to a temporary file and renamed, processes can share
+    a directory.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, binary):
+        """
+        The name of the entry of *binary*, a buffer
+        """
+        digest = hashlib.sha256(build_id())
+        digest.update(binary)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, store, source):
+        """
+        A module of *source*, a path, bytes or a buffer, from the cache, or
+        compiled with ffi.load_module() and put in the cache. It returns NULL
+        if failed, like wasm_module_new()
+        """
+        with ExitStack() as stack:
+            # pylint: disable=protected-access
+            if isinstance(source, (str, os.PathLike)):
+                source = ffi._map_module_file(source, stack)
+
+            key = self.key(source)
+
+            module = self._deserialize(store, key)
+            if module is not None:
+                self.hits += 1
+                return module
+
+            self.misses += 1
+            module = ffi.load_module(store, source)
+            if not ffi.is_null_pointer(module):
+                self._serialize(module, key)
+            return module
+
+    def release(self, module):
+        """
+        Deletes a module of load(), the module is owned by the caller
+        """
+        ffi.wasm_module_delete(module)
+
+    def _deserialize(self, store, key):
+        path = self.path(key)
+        try:
+            with ffi.borrow_byte_vec(path) as serialized:
+                module = ffi.wasm_module_deserialize(store, serialized)
+        except FileNotFoundError:
+            return None
+
+        if ffi.is_null_pointer(module):
+            # broken or unreadable, compile it again
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # evicted by another process, the module has been loaded anyway
+            pass
+
+        return module
+
+    def _serialize(self, module, key):
+        serialized = ffi.wasm_byte_vec_t()
+        ffi.wasm_module_serialize(module, serialized)
+        try:
+            if not serialized.num_elems:
+                # the runtime doesn't support it
+                return
+
+            content = c.string_at(serialized.data, serialized.num_elems)
+        finally:
+            ffi.wasm_byte_vec_delete(serialized)
+
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self.directory, prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as entry:
+                entry.write(content)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+        self.evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def entries(self):
+        """
+        (path, size, last used) of all entries, the least recently used first
+        """
+        entries = []
+        with os.scandir(self.directory) as scanner:
+            for entry in scanner:
+                if not entry.name.endswith(SUFFIX):
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the total size is
+        within max_bytes
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+
+            self._remove(path)
+            self.evictions += 1
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            self._remove(path)
+
+
+class _Shared:
+    __slots__ = ("module", "size", "references")
+
+    def __init__(self, module, size):
+        self.module = module
+        self.size = size
+        self.references = 0
+
+
+class SharedModuleCache:
+    """
+    Compiled modules by the SHA-256 of their binaries, at most *max_bytes* of
+    binaries and *max_entries* modules. Misses are compiled, or loaded by
+    *disk*, a ModuleCache, if given.
+
+    load() returns the same POINTER(wasm_module_t) for the same binary and
+    counts a reference, release() drops it. When a bound is exceeded the
+    least recently used modules without references are deleted, a module in
+    use is never deleted, so the cache can stay over the bounds until they
+    are released. The size of a module is estimated as the size of its
+    binary.
+
+    It is thread-safe. Stores passed to load() have to outlive the cache, or
+    clear() it before deleting them.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, max_entries=1024, disk=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> _Shared, the least recently used first
+        self._entries = OrderedDict()
+        # the address of a module -> its key
+        self._keys = {}
+        self._size = 0
+
+    def load(self, store, source):
+        """
+        The module of *source*, a path, bytes or a buffer. Every module
+        returned has to be given back by release(). It returns NULL if failed,
+        like wasm_module_new()
+        """
+        with ExitStack() as stack:
+            # pylint: disable=protected-access
+            if isinstance(source, (str, os.PathLike)):
+                source = ffi._map_module_file(source, stack)
+
+            key = hashlib.sha256(source).digest()
+            with self._lock:
+                shared = self._entries.get(key)
+                if shared is not None:
+                    self.hits += 1
+                    return self._acquire(key, shared)
+
+                self.misses += 1
+
+            # compiles without the lock, a concurrent miss of the same binary
+            # compiles it twice and keeps the first one
+            if self.disk is None:
+                module = ffi.load_module(store, source)
+            else:
+                module = self.disk.load(store, source)
+            if ffi.is_null_pointer(module):
+                return module
+
+            size = memoryview(source).nbytes
+
+        with self._lock:
+            shared = self._entries.get(key)
+            if shared is not None:
+                duplicate = module
+            else:
+                duplicate = None
+                shared = _Shared(module, size)
+                self._entries[key] = shared
+                self._keys[c.addressof(module.contents)] = key
+                self._size += size
+
+            module = self._acquire(key, shared)
+            self._evict()
+
+        if duplicate is not None:
+            ffi.wasm_module_delete(duplicate)
+        return module
+
+    def _acquire(self, key, shared):
+        shared.references += 1
+        self._entries.move_to_end(key)
+        return shared.module
+
+    def release(self, module):
+        """
+        Drops a reference of a module of load(). The module may be deleted
+        after, if the cache is over the bounds
+        """
+        with self._lock:
+            key = self._keys[c.addressof(module.contents)]
+            shared = self._entries[key]
+            if shared.references <= 0:
+                raise RuntimeError("the module has been released")
+
+            shared.references -= 1
+            self._evict()
+
+    def _evict(self):
+        # the least recently used first, modules in use are skipped
+        for key in list(self._entries):
+            if self._size <= self.max_bytes and len(self._entries) <= self.max_entries:
+                break
+
+            if not self._entries[key].references:
+                self._delete(key)
+                self.evictions += 1
+
+    def _delete(self, key):
+        shared = self._entries.pop(key)
+        del self._keys[c.addressof(shared.module.contents)]
+        self._size -= shared.size
+        ffi.wasm_module_delete(shared.module)
+
+    def references(self, module):
+        with self._lock:
+            return self._entries[self._keys[c.addressof(module.contents)]].references
+
+    def size(self):
+        """
+        The estimated size of all modules in bytes
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Deletes all modules which are not in use
+        """
+        with self._lock:
+            for key in [
+                k for k, shared in self._entries.items() if not shared.references
+            ]:
+                self._delete(key)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Calls wasm functions through frames which are allocated once per function.
+
+A frame owns C arrays of wasm_val_t for params and results and two
+wasm_val_vec_t borrowing them. Arguments are written into the arrays in
+place, so a call in the steady state creates no vectors and no values.
+
+specialize() goes further, a plain Python function generated for the
+signature which takes arguments and returns results as ints and floats.
+"""
+
+import ctypes as c
+from functools import lru_cache
+
+from . import ffi
+
+# kind -> the field of the union
+FIELDS = {
+    ffi.WASM_I32: "i32",
+    ffi.WASM_I64: "i64",
+    ffi.WASM_F32: "f32",
+    ffi.WASM_F64: "f64",
+    ffi.WASM_ANYREF: "ref",
+    ffi.WASM_FUNCREF: "ref",
+}
+
+# wasm_func_call() returning an address, so a successful call returns None
+# instead of a new NULL POINTER(wasm_trap_t)
+_wasm_func_call = None
+
+
+def _func_call():
+    # pylint: disable=global-statement
+    global _wasm_func_call
+
+    if _wasm_func_call is None:
+        # a function object of our own, the shared one keeps its restype
+        func = ffi.load_library()["wasm_func_call"]
+        func.restype = c.c_void_p
+        func.argtypes = [
+            c.POINTER(ffi.wasm_func_t),
+            c.POINTER(ffi.wasm_val_vec_t),
+            c.POINTER(ffi.wasm_val_vec_t),
+        ]
+        _wasm_func_call = func
+
+    return _wasm_func_call
+
+
+class Trap(RuntimeError):
+    """
+    A trap from a function made by specialize(). The message of the trap is
+    the message of the exception
+    """
+
+
+def _trap_message(trap):
+    # the message of a trap address, the trap is deleted
+    trap = c.cast(trap, c.POINTER(ffi.wasm_trap_t))
+    message = ffi.wasm_message_t()
+    ffi.wasm_trap_message(trap, message)
+    text = str(message).rstrip("\0")
+    ffi.wasm_byte_vec_delete(message)
+    ffi.wasm_trap_delete(trap)
+    return text
+
+
+def _raise_trap(trap):
+    raise Trap(_trap_message(trap))
+
+
+def _valtype_kinds(valtypes):
+    return tuple(ffi.wasm_valtype_kind(valtype) for valtype in valtypes.view())
+
+
+def signature(func):
+    """
+    Kinds of params and results of *func*, a POINTER(wasm_func_t), as a pair
+    of tuples
+    """
+    func_type = ffi.wasm_func_type(func)
+    if ffi.is_null_pointer(func_type):
+        raise RuntimeError("can't get the type of the function")
+
+    try:
+        params = _valtype_kinds(ffi.dereference(ffi.wasm_functype_params(func_type)))
+        results = _valtype_kinds(ffi.dereference(ffi.wasm_functype_results(func_type)))
+    finally:
+        ffi.wasm_functype_delete(func_type)
+
+    return params, results
+
+
+class CallFrame:
+    """
+    Preallocated params and results of one POINTER(wasm_func_t).
+
+    Set arguments with set() or set_i32()/... by index, call(), then read
+    results with get() or get_i32()/.... Arguments stay in the frame between
+    calls, only changed ones need to be set again.
+
+    A frame is valid as long as the function is. It is not thread-safe, a
+    thread needs a frame of its own.
+    """
+
+    __slots__ = (
+        "func",
+        "param_kinds",
+        "result_kinds",
+        "params",
+        "results",
+        "_params_vec",
+        "_results_vec",
+        "_params_ptr",
+        "_results_ptr",
+        "_param_slots",
+        "_result_slots",
+        "_param_fields",
+        "_result_fields",
+        "_call",
+    )
+
+    def __init__(self, func):
+        if ffi.is_null_pointer(func):
+            raise RuntimeError("not a function")
+
+        self.func = func
+        self.param_kinds, self.result_kinds = signature(func)
+
+        param_arity = ffi.wasm_func_param_arity(func)
+        result_arity = ffi.wasm_func_result_arity(func)
+        if (param_arity, result_arity) != (
+            len(self.param_kinds),
+            len(self.result_kinds),
+        ):
+            raise RuntimeError("arities don't match the function type")
+
+        # an empty vector still needs a valid address
+        self.params = (ffi.wasm_val_t * max(param_arity, 1))()
+        self.results = (ffi.wasm_val_t * max(result_arity, 1))()
+        for vals, kinds in (
+            (self.params, self.param_kinds),
+            (self.results, self.result_kinds),
+        ):
+            for val, kind in zip(vals, kinds):
+                val.kind = kind
+
+        self._params_vec = ffi.borrow_val_vec(self.params, param_arity)
+        self._results_vec = ffi.borrow_val_vec(self.results, result_arity)
+        self._params_ptr = c.pointer(self._params_vec)
+        self._results_ptr = c.pointer(self._results_vec)
+
+        # unions of every value, setting a field of one writes the array
+        self._param_slots = [val.of for val in self.params[:param_arity]]
+        self._result_slots = [val.of for val in self.results[:result_arity]]
+        self._param_fields = [FIELDS[kind] for kind in self.param_kinds]
+        self._result_fields = [FIELDS[kind] for kind in self.result_kinds]
+
+        self._call = _func_call()
+
+    def set(self, index, value):
+        setattr(self._param_slots[index], self._param_fields[index], value)
+
+    def set_i32(self, index, value):
+        self._param_slots[index].i32 = value
+
+    def set_i64(self, index, value):
+        self._param_slots[index].i64 = value
+
+    def set_f32(self, index, value):
+        self._param_slots[index].f32 = value
+
+    def set_f64(self, index, value):
+        self._param_slots[index].f64 = value
+
+    def get(self, index):
+        return getattr(self._result_slots[index], self._result_fields[index])
+
+    def get_i32(self, index):
+        return self._result_slots[index].i32
+
+    def get_i64(self, index):
+        return self._result_slots[index].i64
+
+    def get_f32(self, index):
+        return self._result_slots[index].f32
+
+    def get_f64(self, index):
+        return self._result_slots[index].f64
+
+    def call(self):
+        """
+        wasm_func_call() with the frame. Returns None, or a
+        POINTER(wasm_trap_t) which the caller has to wasm_trap_delete()
+        """
+        trap = self._call(self.func, self._params_ptr, self._results_ptr)
+        if trap is None:
+            return None
+
+        return c.cast(trap, c.POINTER(ffi.wasm_trap_t))
+
+    def __repr__(self):
+        return f"CallFrame({self.param_kinds} -> {self.result_kinds})"
+
+
+def _func_address(func):
+    return c.cast(func, c.c_void_p).value
+
+
+class FrameCache:
+    """
+    CallFrame per function, keyed by the address of the wasm_func_t.
+
+    An address can be reused after the function is deleted, by
+    wasm_extern_vec_delete() of exports or wasm_instance_delete(). discard()
+    or clear() frames before that.
+    """
+
+    def __init__(self):
+        self._frames = {}
+
+    def frame(self, func):
+        key = _func_address(func)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = CallFrame(func)
+
+        return frame
+
+    def discard(self, func):
+        self._frames.pop(_func_address(func), None)
+
+    def clear(self):
+        self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, func):
+        return _func_address(func) in self._frames
+
+
+@lru_cache(maxsize=256)
+def _factory(param_kinds, result_kinds):
+    """
+    Compiles a function which makes specialized callables of the signature.
+    Unions of the frame are bound to closure cells, a call is a field store per
+    argument, the foreign call and a field load per result
+    """
+    params = [f"a{i}" for i in range(len(param_kinds))]
+    param_slots = [f"p{i}" for i in range(len(param_kinds))]
+    result_slots = [f"r{i}" for i in range(len(result_kinds))]
+
+    returns = [
+        f"{slot}.{FIELDS[kind]}" for slot, kind in zip(result_slots, result_kinds)
+    ]
+    if not returns:
+        returns = "None"
+    elif 1 == len(returns):
+        returns = returns[0]
+    else:
+        returns = f"({', '.join(returns)},)"
+
+    cells = ["func", "params", "results", "call", "raise_trap"]
+    cells += param_slots + result_slots
+
+    lines = [
+        f"def make({', '.join(cells)}):",
+        f"    def specialized({', '.join(params)}):",
+    ]
+    lines += [
+        f"        {slot}.{FIELDS[kind]} = {param}"
+        for slot, kind, param in zip(param_slots, param_kinds, params)
+    ]
+    lines += [
+        "        trap = call(func, params, results)",
+        "        if trap is not None:",
+        "            raise_trap(trap)",
+        f"        return {returns}",
+        "    return specialized",
+    ]
+
+    name = "_".join(FIELDS[kind] for kind in param_kinds) or "void"
+    name += "__" + ("_".join(FIELDS[kind] for kind in result_kinds) or "void")
+
+    # pylint: disable=exec-used
+    namespace = {}
+    exec(compile("\n".join(lines), f"<wamr.call {name}>", "exec"), namespace)
+    return namespace["make"]
+
+
+def specialize(func):
+    """
+    A Python function calling *func*, a POINTER(wasm_func_t), like
+    `f(a, b) -> result`. It returns None without results, a value with one
+    result and a tuple with more. A trap raises Trap.
+
+    The code is generated once per signature and shared by all functions of
+    it. Every function made by specialize() owns a CallFrame, `f.frame`, so
+    it is not thread-safe and is valid as long as *func* is
+    """
+    # pylint: disable=protected-access
+    frame = CallFrame(func)
+    make = _factory(frame.param_kinds, frame.result_kinds)
+    specialized = make(
+        frame.func,
+        frame._params_ptr,
+        frame._results_ptr,
+        frame._call,
+        _raise_trap,
+        *frame._param_slots,
+        *frame._result_slots,
+    )
+    specialized.frame = frame
+    return specialized
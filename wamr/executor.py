@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Calls of exports in worker threads.
+
+wasm_func_call() is bound through CDLL and releases the GIL, so calls in
+several threads run in parallel. A thread which isn't created by the runtime
+has to set up the runtime thread environment before touching wasm, and
+stores and instances aren't meant to be shared by threads. A worker of
+WasmExecutor does wasm_runtime_init_thread_env() first, then creates a store
+and an instance of its own, and wasm_runtime_destroy_thread_env() when it
+exits.
+"""
+
+from concurrent.futures import Executor, Future
+import os
+import queue
+import threading
+
+from . import runtime
+from .oop import Instance, Store
+
+
+class WasmExecutor(Executor):
+    """
+    A concurrent.futures.Executor of *max_workers* threads, each with a Store
+    of *engine* and an Instance of *module*. *imports* are the imports of an
+    instance, or a callable which takes the store of a worker and returns
+    them, for host functions which belong to a store.
+
+    submit(fn, *args) calls, in a worker,
+      - the export named *fn* with *args*, if *fn* is a str
+      - fn(instance, *args, **kwargs) otherwise, `instance.store` is the store
+
+    map() is the one of Executor, `executor.map("run", values)` calls an
+    export for every value. A trap raises wamr.call.Trap from the future.
+    If a worker fails to set up, every call it picks raises the error.
+    """
+
+    def __init__(self, engine, module, imports=(), max_workers=None, name="wamr"):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise RuntimeError("max_workers has to be positive")
+
+        self.engine = engine
+        self.module = module
+        self._imports = imports if callable(imports) else lambda store: imports
+
+        # (future, fn, args, kwargs), None stops a worker
+        self._queue = queue.SimpleQueue()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._threads = [
+            # daemons, the interpreter joins other threads before atexit
+            threading.Thread(target=self._work, name=f"{name}_{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self):
+        # destroyed only if it is set up here
+        inited = False
+        if not runtime.wasm_runtime_thread_env_inited():
+            if runtime.wasm_runtime_init_thread_env():
+                inited = True
+
+        try:
+            # stores and instances of the worker are gone when it returns
+            self._serve()
+        finally:
+            if inited:
+                runtime.wasm_runtime_destroy_thread_env()
+
+    def _serve(self):
+        instance = None
+        try:
+            if not runtime.wasm_runtime_thread_env_inited():
+                raise RuntimeError("failed to init the runtime thread environment")
+
+            store = Store(self.engine)
+            instance = Instance(store, self.module, self._imports(store))
+        except Exception as exception:  # pylint: disable=broad-except
+            failure = exception
+        else:
+            failure = None
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if failure is not None:
+                    raise failure
+                if isinstance(fn, str):
+                    func = instance.export(instance.store, fn)
+                    future.set_result(func(instance.store, *args))
+                else:
+                    future.set_result(fn(instance, *args, **kwargs))
+            except BaseException as exception:  # pylint: disable=broad-except
+                future.set_exception(exception)
+
+            # no reference to the last result or arguments while idle
+            del item, future, fn, args, kwargs
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+
+                if cancel_futures:
+                    while True:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is not None:
+                            item[0].cancel()
+
+                for _ in self._threads:
+                    self._queue.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    @property
+    def workers(self):
+        return len(self._threads)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Exports of a module by name.
+
+wasm_instance_exports() lists externs in the order of wasm_module_exports().
+An ExportIndex reads the latter once per module, every instance of the
+module finds an extern by its position instead of comparing names.
+"""
+
+from collections import namedtuple
+from collections.abc import Mapping
+import ctypes as c
+
+from . import ffi
+from .call import _valtype_kinds
+
+# *position* in wasm_instance_exports(), *kind* is WASM_EXTERN_XXX and *type*
+# depends on the kind:
+#   - func, (param kinds, result kinds)
+#   - global, (value kind, mutable)
+#   - table, (element kind, min, max)
+#   - memory, (min, max) in pages
+ExportEntry = namedtuple("ExportEntry", ["position", "kind", "type"])
+
+
+def _limits(limits):
+    limits = ffi.dereference(limits)
+    return limits.min, limits.max
+
+
+def _describe(extern_type):
+    kind = ffi.wasm_externtype_kind(extern_type)
+
+    if ffi.WASM_EXTERN_FUNC == kind:
+        func_type = ffi.wasm_externtype_as_functype(extern_type)
+        return kind, (
+            _valtype_kinds(ffi.dereference(ffi.wasm_functype_params(func_type))),
+            _valtype_kinds(ffi.dereference(ffi.wasm_functype_results(func_type))),
+        )
+
+    if ffi.WASM_EXTERN_GLOBAL == kind:
+        global_type = ffi.wasm_externtype_as_globaltype(extern_type)
+        return kind, (
+            ffi.wasm_valtype_kind(ffi.wasm_globaltype_content(global_type)),
+            ffi.WASM_VAR == ffi.wasm_globaltype_mutability(global_type),
+        )
+
+    if ffi.WASM_EXTERN_TABLE == kind:
+        table_type = ffi.wasm_externtype_as_tabletype(extern_type)
+        return kind, (
+            ffi.wasm_valtype_kind(ffi.wasm_tabletype_element(table_type)),
+            *_limits(ffi.wasm_tabletype_limits(table_type)),
+        )
+
+    memory_type = ffi.wasm_externtype_as_memorytype(extern_type)
+    return kind, _limits(ffi.wasm_memorytype_limits(memory_type))
+
+
+class ExportIndex(Mapping):
+    """
+    Names of exports of a POINTER(wasm_module_t) -> ExportEntry, built once.
+
+    It has no reference to the module, it stays valid after the module is
+    deleted and can be shared by all instances.
+    """
+
+    def __init__(self, module):
+        export_types = ffi.wasm_exporttype_vec_t()
+        ffi.wasm_module_exports(module, export_types)
+
+        try:
+            entries = {}
+            for position, export_type in enumerate(export_types.view()):
+                name = str(ffi.dereference(ffi.wasm_exporttype_name(export_type)))
+                kind, type_ = _describe(ffi.wasm_exporttype_type(export_type))
+                entries[name.rstrip("\0")] = ExportEntry(position, kind, type_)
+        finally:
+            ffi.wasm_exporttype_vec_delete(export_types)
+
+        self._entries = entries
+
+    def __getitem__(self, name):
+        return self._entries[name]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def names(self, kind=None):
+        """
+        Names in the order of exports, only of *kind* if given
+        """
+        return [
+            name
+            for name, entry in self._entries.items()
+            if kind is None or entry.kind == kind
+        ]
+
+    def extern(self, externs, name):
+        """
+        The POINTER(wasm_extern_t) of *name* in *externs*, a wasm_extern_vec_t
+        from wasm_instance_exports() of an instance of the module
+        """
+        # pylint: disable=protected-access
+        if isinstance(externs, c._Pointer):
+            externs = ffi.dereference(externs)
+
+        return externs.data[self._entries[name].position]
+
+    def __repr__(self):
+        return f"ExportIndex({list(self._entries)})"
@@ -8,7 +8,10 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-module-docstring
 
+from collections.abc import Sequence
+from contextlib import ExitStack, contextmanager
 import ctypes as c
+import mmap
 import os
 from pathlib import Path
 import sys
@@ -37,14 +40,37 @@ if current_file.is_symlink():
 current_dir = current_file.parent.resolve()
 root_dir = current_dir.joinpath("..").resolve()
 wamr_dir = root_dir.joinpath("wasm-micro-runtime").resolve()
-if not wamr_dir.exists():
-    raise RuntimeError(f"not found the repo of wasm-micro-runtime under {root_dir}")
-
 libpath = wamr_dir.joinpath(BUILDING_DIR).joinpath(LIBRARY_NAME).resolve()
-if not libpath.exists():
-    raise RuntimeError(f"not found precompiled wamr library at {libpath}")
 
-libiwasm = c.cdll.LoadLibrary(libpath)
+# libiwasm is loaded by the first FFI call, not by `import wamr.ffi`
+_libiwasm = None
+# the same library, functions from it keep the GIL during calls
+_libiwasm_pydll = None
+
+
+def load_library(hold_gil=False):
+    global _libiwasm
+    global _libiwasm_pydll
+
+    if _libiwasm is None:
+        if not wamr_dir.exists():
+            raise RuntimeError(
+                f"not found the repo of wasm-micro-runtime under {root_dir}"
+            )
+
+        if not libpath.exists():
+            raise RuntimeError(f"not found precompiled wamr library at {libpath}")
+
+        _libiwasm = c.cdll.LoadLibrary(libpath)
+
+    if not hold_gil:
+        return _libiwasm
+
+    if _libiwasm_pydll is None:
+        # share the handle, don't dlopen() twice
+        _libiwasm_pydll = c.PyDLL(_libiwasm._name, handle=_libiwasm._handle)
+
+    return _libiwasm_pydll
 
 
 class wasm_ref_t(c.Structure):
@@ -91,34 +117,53 @@ def is_null_pointer(c_pointer):
         raise RuntimeError("not a pointer")
 
 
+class VecView(Sequence):
+    """
+    A lazy view of a vector or a POINTER(vector). len(), indexing, slicing
+    and iteration go to `data` directly, nothing is copied. An element is what
+    `vec.data[i]` is, like a POINTER(wasm_extern_t) of a wasm_extern_vec_t.
+
+    It is valid as long as the vector is not deleted.
+    """
+
+    __slots__ = ("_vec", "_data", "_range")
+
+    def __init__(self, vec, indices=None):
+        # pylint: disable=protected-access
+        if isinstance(vec, c._Pointer):
+            vec = dereference(vec)
+
+        if type(vec) not in _VEC_TYPES:
+            raise RuntimeError("not a known vector type")
+
+        self._vec = vec
+        self._data = vec.data
+        self._range = range(vec.num_elems) if indices is None else indices
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VecView(self._vec, self._range[index])
+
+        return self._data[self._range[index]]
+
+    def __iter__(self):
+        data = self._data
+        for i in self._range:
+            yield data[i]
+
+    def __repr__(self):
+        return f"VecView({type(self._vec).__name__}, {len(self)} elements)"
+
+
 def wasm_vec_to_list(vec):
     """
     Converts a vector or a POINTER(vector) to a list
     vector of type pointers -> list of type pointers
     """
-    known_vec_type = [
-        wasm_byte_vec_t,
-        wasm_valtype_vec_t,
-        wasm_functype_vec_t,
-        wasm_globaltype_vec_t,
-        wasm_tabletype_vec_t,
-        wasm_memorytype_vec_t,
-        wasm_externtype_vec_t,
-        wasm_importtype_vec_t,
-        wasm_exporttype_vec_t,
-        wasm_val_vec_t,
-        wasm_frame_vec_t,
-        wasm_extern_vec_t,
-    ]
-    known_vec_pointer_type = [POINTER(type) for type in known_vec_type]
-
-    if any([isinstance(vec, type) for type in known_vec_pointer_type]):
-        vec = dereference(vec)
-        return [vec.data[i] for i in range(vec.num_elems)]
-    elif any([isinstance(vec, type) for type in known_vec_type]):
-        return [vec.data[i] for i in range(vec.num_elems)]
-    else:
-        raise RuntimeError("not a known vector type")
+    return list(VecView(vec))
 
 
 def list_to_carray(elem_type, *args):
@@ -131,19 +176,117 @@ def list_to_carray(elem_type, *args):
 
 def load_module_file(wasm_content):
     binary = wasm_byte_vec_t()
-    wasm_byte_vec_new_uninitialized(binary, len(wasm_content))
+    binding.wasm_byte_vec_new_uninitialized(binary, len(wasm_content))
     # has to use malloced memory.
     c.memmove(binary.data, wasm_content, len(wasm_content))
     binary.num_elems = len(wasm_content)
     return binary
 
 
+def _map_module_file(path, stack):
+    module_file = stack.enter_context(open(path, "rb"))
+    if not os.fstat(module_file.fileno()).st_size:
+        # can't mmap an empty file
+        return b""
+
+    # copy-on-write, so ctypes can take the address. Pages are never written
+    return stack.enter_context(
+        mmap.mmap(module_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    )
+
+
+@contextmanager
+def borrow_byte_vec(source):
+    """
+    Yields a wasm_byte_vec_t which points at the content of *source* instead of
+    a copy. *source* is a path, bytes, bytearray, memoryview or mmap. A path is
+    mapped into memory and unmapped when leaving the `with` block. Read-only
+    buffers other than bytes, like a mmap with ACCESS_READ, are copied once
+    since ctypes can't take their addresses.
+
+    The vector borrows the memory. Never `wasm_byte_vec_delete()` it and never
+    use it after the `with` block.
+    """
+    with ExitStack() as stack:
+        if isinstance(source, (str, os.PathLike)):
+            source = _map_module_file(source, stack)
+
+        if isinstance(source, bytes):
+            data = source
+            address = c.cast(c.c_char_p(source), c.c_void_p).value
+        else:
+            view = stack.enter_context(memoryview(source)).cast("B")
+            stack.callback(view.release)
+
+            if view.readonly:
+                view = memoryview(bytearray(view))
+
+            data = (c.c_ubyte * len(view)).from_buffer(view)
+            address = c.addressof(data) if len(view) else None
+
+        binary = wasm_byte_vec_t()
+        binary.size = len(data)
+        binary.num_elems = len(data)
+        binary.size_of_elem = 1
+        # only the address, the vector doesn't keep *data* alive
+        binary.data = c.cast(address, c.POINTER(c.c_ubyte))
+
+        try:
+            yield binary
+        finally:
+            # exports of a buffer have to be released before a mmap is closed
+            del data
+
+
+def load_module(store, source):
+    """
+    wasm_module_new() without an extra copy of the binary on the Python side.
+    The runtime keeps its own copy, *source* is only read during compilation.
+    It returns NULL if failed, like wasm_module_new()
+    """
+    with borrow_byte_vec(source) as binary:
+        return binding.wasm_module_new(store, binary)
+
+
+def borrow_val_vec(vals, count=None):
+    """
+    A wasm_val_vec_t pointing at *vals*, a C array of wasm_val_t, instead of
+    a copy from wasm_val_vec_new(). It keeps *vals* alive. Never
+    `wasm_val_vec_delete()` it
+    """
+    count = len(vals) if count is None else count
+
+    vec = wasm_val_vec_t()
+    vec.size = count
+    vec.num_elems = count
+    vec.size_of_elem = c.sizeof(wasm_val_t)
+    vec.data = vals
+    return vec
+
+
 #
 # Enhancment of binding
 #
 
+from . import binding
+from . import binding_raw as raw
 from .binding import *
 
+# all wasm_xxx_vec_t, for VecView
+_VEC_TYPES = frozenset(
+    value
+    for name, value in vars(binding).items()
+    if name.endswith("_vec_t") and isinstance(value, type)
+)
+
+
+def __view_wasm_vec_t(self):
+    return VecView(self)
+
+
+for _vec_type in _VEC_TYPES:
+    _vec_type.view = __view_wasm_vec_t
+
 # Built-in functions for Structure
 
 
@@ -162,11 +305,13 @@ def __compare_wasm_valtype_t(self, other):
     if not isinstance(other, wasm_valtype_t):
         return False
 
-    return wasm_valtype_kind(byref(self)) == wasm_valtype_kind(byref(other))
+    return binding.wasm_valtype_kind(byref(self)) == binding.wasm_valtype_kind(
+        byref(other)
+    )
 
 
 def __repr_wasm_valtype_t(self):
-    val_kind = wasm_valtype_kind(byref(self))
+    val_kind = binding.wasm_valtype_kind(byref(self))
     if WASM_I32 == val_kind:
         return "i32"
     elif WASM_I64 == val_kind:
@@ -210,16 +355,16 @@ def __compare_wasm_functype_t(self, other):
     if not isinstance(other, wasm_functype_t):
         return False
 
-    params1 = dereference(wasm_functype_params(byref(self)))
-    params2 = dereference(wasm_functype_params(byref(other)))
-    results1 = dereference(wasm_functype_results(byref(self)))
-    results2 = dereference(wasm_functype_results(byref(other)))
+    params1 = dereference(binding.wasm_functype_params(byref(self)))
+    params2 = dereference(binding.wasm_functype_params(byref(other)))
+    results1 = dereference(binding.wasm_functype_results(byref(self)))
+    results2 = dereference(binding.wasm_functype_results(byref(other)))
     return params1 == params2 and results1 == results2
 
 
 def __repr_wasm_functype_t(self):
-    params = dereference(wasm_functype_params(byref(self)))
-    results = dereference(wasm_functype_results(byref(self)))
+    params = dereference(binding.wasm_functype_params(byref(self)))
+    results = dereference(binding.wasm_functype_results(byref(self)))
     params = f" (params {params})" if params.size else ""
     results = f" (results {results})" if results.size else ""
     return f"(func{params}{results})"
@@ -233,16 +378,16 @@ def __compare_wasm_globaltype_t(self, other):
     if not isinstance(other, wasm_globaltype_t):
         return False
 
-    content1 = dereference(wasm_globaltype_content(byref(self)))
-    content2 = dereference(wasm_globaltype_content(byref(other)))
-    mutability1 = wasm_globaltype_mutability(byref(self))
-    mutability2 = wasm_globaltype_mutability(byref(other))
+    content1 = dereference(binding.wasm_globaltype_content(byref(self)))
+    content2 = dereference(binding.wasm_globaltype_content(byref(other)))
+    mutability1 = binding.wasm_globaltype_mutability(byref(self))
+    mutability2 = binding.wasm_globaltype_mutability(byref(other))
     return content1 == content2 and mutability1 == mutability2
 
 
 def __repr_wasm_globaltype_t(self):
-    mutability = f"{wasm_globaltype_mutability(byref(self))}"
-    content = f"{dereference(wasm_globaltype_content(byref(self)))}"
+    mutability = f"{binding.wasm_globaltype_mutability(byref(self))}"
+    content = f"{dereference(binding.wasm_globaltype_content(byref(self)))}"
     return f"(global{' mut ' if mutability else ' '}{content})"
 
 
@@ -254,16 +399,16 @@ def __compare_wasm_tabletype_t(self, other):
     if not isinstance(other, wasm_tabletype_t):
         return False
 
-    element1 = dereference(wasm_tabletype_element(byref(self)))
-    element2 = dereference(wasm_tabletype_element(byref(other)))
-    limits1 = dereference(wasm_tabletype_limits(byref(self)))
-    limits2 = dereference(wasm_tabletype_limits(byref(other)))
+    element1 = dereference(binding.wasm_tabletype_element(byref(self)))
+    element2 = dereference(binding.wasm_tabletype_element(byref(other)))
+    limits1 = dereference(binding.wasm_tabletype_limits(byref(self)))
+    limits2 = dereference(binding.wasm_tabletype_limits(byref(other)))
     return element1 == element2 and limits1 == limits2
 
 
 def __repr_wasm_tabletype_t(self):
-    element = dereference(wasm_tabletype_element(byref(self)))
-    limit = dereference(wasm_tabletype_limits(byref(self)))
+    element = dereference(binding.wasm_tabletype_element(byref(self)))
+    limit = dereference(binding.wasm_tabletype_limits(byref(self)))
     return f"(table {limit} {element})"
 
 
@@ -275,13 +420,13 @@ def __compare_wasm_memorytype_t(self, other):
     if not isinstance(other, wasm_memorytype_t):
         return False
 
-    limits1 = dereference(wasm_memorytype_limits(byref(self)))
-    limits2 = dereference(wasm_memorytype_limits(byref(other)))
+    limits1 = dereference(binding.wasm_memorytype_limits(byref(self)))
+    limits2 = dereference(binding.wasm_memorytype_limits(byref(other)))
     return limits1 == limits2
 
 
 def __repr_wasm_memorytype_t(self):
-    limit = dereference(wasm_memorytype_limits(byref(self)))
+    limit = dereference(binding.wasm_memorytype_limits(byref(self)))
     return f"(memory {limit})"
 
 
@@ -293,40 +438,42 @@ def __compare_wasm_externtype_t(self, other):
     if not isinstance(other, wasm_externtype_t):
         return False
 
-    if wasm_externtype_kind(byref(self)) != wasm_externtype_kind(byref(other)):
+    if binding.wasm_externtype_kind(byref(self)) != binding.wasm_externtype_kind(
+        byref(other)
+    ):
         return False
 
-    extern_kind = wasm_externtype_kind(byref(self))
+    extern_kind = binding.wasm_externtype_kind(byref(self))
     if WASM_EXTERN_FUNC == extern_kind:
-        return dereference(wasm_externtype_as_functype(self)) == dereference(
-            wasm_externtype_as_functype(other)
+        return dereference(binding.wasm_externtype_as_functype(self)) == dereference(
+            binding.wasm_externtype_as_functype(other)
         )
     elif WASM_EXTERN_GLOBAL == extern_kind:
-        return dereference(wasm_externtype_as_globaltype(self)) == dereference(
-            wasm_externtype_as_globaltype(other)
+        return dereference(binding.wasm_externtype_as_globaltype(self)) == dereference(
+            binding.wasm_externtype_as_globaltype(other)
         )
     elif WASM_EXTERN_MEMORY == extern_kind:
-        return dereference(wasm_externtype_as_memorytype(self)) == dereference(
-            wasm_externtype_as_memorytype(other)
+        return dereference(binding.wasm_externtype_as_memorytype(self)) == dereference(
+            binding.wasm_externtype_as_memorytype(other)
         )
     elif WASM_EXTERN_TABLE == extern_kind:
-        return dereference(wasm_externtype_as_tabletype(self)) == dereference(
-            wasm_externtype_as_tabletype(other)
+        return dereference(binding.wasm_externtype_as_tabletype(self)) == dereference(
+            binding.wasm_externtype_as_tabletype(other)
         )
     else:
         raise RuntimeError("not a valid wasm_externtype_t")
 
 
 def __repr_wasm_externtype_t(self):
-    extern_kind = wasm_externtype_kind(byref(self))
+    extern_kind = binding.wasm_externtype_kind(byref(self))
     if WASM_EXTERN_FUNC == extern_kind:
-        return str(dereference(wasm_externtype_as_functype(byref(self))))
+        return str(dereference(binding.wasm_externtype_as_functype(byref(self))))
     elif WASM_EXTERN_GLOBAL == extern_kind:
-        return str(dereference(wasm_externtype_as_globaltype(byref(self))))
+        return str(dereference(binding.wasm_externtype_as_globaltype(byref(self))))
     elif WASM_EXTERN_MEMORY == extern_kind:
-        return str(dereference(wasm_externtype_as_memorytype(byref(self))))
+        return str(dereference(binding.wasm_externtype_as_memorytype(byref(self))))
     elif WASM_EXTERN_TABLE == extern_kind:
-        return str(dereference(wasm_externtype_as_tabletype(byref(self))))
+        return str(dereference(binding.wasm_externtype_as_tabletype(byref(self))))
     else:
         raise RuntimeError("not a valid wasm_externtype_t")
 
@@ -339,25 +486,25 @@ def __compare_wasm_importtype_t(self, other):
     if not isinstance(other, wasm_importtype_t):
         return False
 
-    if dereference(wasm_importtype_module(self)) != dereference(
-        wasm_importtype_module(other)
+    if dereference(binding.wasm_importtype_module(self)) != dereference(
+        binding.wasm_importtype_module(other)
     ):
         return False
 
-    if dereference(wasm_importtype_name(self)) != dereference(
-        wasm_importtype_name(other)
+    if dereference(binding.wasm_importtype_name(self)) != dereference(
+        binding.wasm_importtype_name(other)
     ):
         return False
 
-    self_type = dereference(wasm_importtype_type(byref(self)))
-    other_type = dereference(wasm_importtype_type(byref(other)))
+    self_type = dereference(binding.wasm_importtype_type(byref(self)))
+    other_type = dereference(binding.wasm_importtype_type(byref(other)))
     return self_type == other_type
 
 
 def __repr_wasm_importtype_t(self):
-    module = wasm_importtype_module(byref(self))
-    name = wasm_importtype_name(byref(self))
-    extern_type = wasm_importtype_type(byref(self))
+    module = binding.wasm_importtype_module(byref(self))
+    name = binding.wasm_importtype_name(byref(self))
+    extern_type = binding.wasm_importtype_type(byref(self))
     return f'(import "{dereference(module)}" "{dereference(name)}" {dereference(extern_type)})'
 
 
@@ -369,19 +516,19 @@ def __compare_wasm_exporttype_t(self, other):
     if not isinstance(other, wasm_exporttype_t):
         return False
 
-    self_name = dereference(wasm_exporttype_name(byref(self)))
-    other_name = dereference(wasm_exporttype_name(byref(other)))
+    self_name = dereference(binding.wasm_exporttype_name(byref(self)))
+    other_name = dereference(binding.wasm_exporttype_name(byref(other)))
     if self_name != other_name:
         return False
 
-    self_type = dereference(wasm_exporttype_type(byref(self)))
-    other_type = dereference(wasm_exporttype_type(byref(other)))
+    self_type = dereference(binding.wasm_exporttype_type(byref(self)))
+    other_type = dereference(binding.wasm_exporttype_type(byref(other)))
     return self_type == other_type
 
 
 def __repr_wasm_exporttype_t(self):
-    name = wasm_exporttype_name(byref(self))
-    extern_type = wasm_exporttype_type(byref(self))
+    name = binding.wasm_exporttype_name(byref(self))
+    extern_type = binding.wasm_exporttype_type(byref(self))
     return f'(export "{dereference(name)}" {dereference(extern_type)})'
 
 
@@ -403,7 +550,7 @@ def __compare_wasm_val_t(self, other):
     elif WASM_F32 == self.kind:
         return self.of.f32 == other.of.f32
     elif WASM_F64 == self.kind:
-        return self.of.f64 == other.of.f63
+        return self.of.f64 == other.of.f64
     elif WASM_ANYREF == self.kind:
         raise RuntimeError("FIXME")
     else:
@@ -431,7 +578,7 @@ wasm_val_t.__eq__ = __compare_wasm_val_t
 
 def __repr_wasm_trap_t(self):
     message = wasm_message_t()
-    wasm_trap_message(self, message)
+    binding.wasm_trap_message(self, message)
     return f'(trap "{str(message)}")'
 
 
@@ -439,21 +586,22 @@ wasm_trap_t.__repr__ = __repr_wasm_trap_t
 
 
 def __repr_wasm_frame_t(self):
-    instance = wasm_frame_instance(self)
-    module_offset = wasm_frame_module_offset(self)
-    func_index = wasm_frame_func_index(self)
-    func_offset = wasm_frame_func_offset(self)
+    instance = binding.wasm_frame_instance(self)
+    module_offset = binding.wasm_frame_module_offset(self)
+    func_index = binding.wasm_frame_func_index(self)
+    func_offset = binding.wasm_frame_func_offset(self)
     return f"> module:{module_offset:#x} => func#{func_index:#x}.{func_offset:#x}"
 
+
 wasm_frame_t.__repr__ = __repr_wasm_frame_t
 
 
 def __repr_wasm_module_t(self):
     imports = wasm_importtype_vec_t()
-    wasm_module_imports(self, imports)
+    binding.wasm_module_imports(self, imports)
 
     exports = wasm_exporttype_vec_t()
-    wasm_module_exports(self, exports)
+    binding.wasm_module_exports(self, exports)
 
     ret = "(module"
     ret += str(imports).replace("(import", "\n  (import")
@@ -467,7 +615,7 @@ wasm_module_t.__repr__ = __repr_wasm_module_t
 
 def __repr_wasm_instance_t(self):
     exports = wasm_extern_vec_t()
-    wasm_instance_exports(self, exports)
+    binding.wasm_instance_exports(self, exports)
 
     ret = "(instance"
     ret += str(exports).replace("(export", "\n (export")
@@ -479,7 +627,7 @@ wasm_instance_t.__repr__ = __repr_wasm_instance_t
 
 
 def __repr_wasm_func_t(self):
-    ft = wasm_func_type(self)
+    ft = binding.wasm_func_type(self)
     return f"{str(dereference(ft))[:-1]} ... )"
 
 
@@ -487,7 +635,7 @@ wasm_func_t.__repr__ = __repr_wasm_func_t
 
 
 def __repr_wasm_global_t(self):
-    gt = wasm_global_type(self)
+    gt = binding.wasm_global_type(self)
     return f"{str(dereference(gt))[:-1]} ... )"
 
 
@@ -495,7 +643,7 @@ wasm_global_t.__repr__ = __repr_wasm_global_t
 
 
 def __repr_wasm_table_t(self):
-    tt = wasm_table_type(self)
+    tt = binding.wasm_table_type(self)
     return f"{str(dereference(tt))[:-1]} ... )"
 
 
@@ -503,7 +651,7 @@ wasm_table_t.__repr__ = __repr_wasm_table_t
 
 
 def __repr_wasm_memory_t(self):
-    mt = wasm_memory_type(self)
+    mt = binding.wasm_memory_type(self)
     return f"{str(dereference(mt))[:-1]} ... )"
 
 
@@ -511,21 +659,21 @@ wasm_memory_t.__repr__ = __repr_wasm_memory_t
 
 
 def __repr_wasm_extern_t(self):
-    ext_type = wasm_extern_type(self)
-    ext_kind = wasm_extern_kind(self)
+    ext_type = binding.wasm_extern_type(self)
+    ext_kind = binding.wasm_extern_kind(self)
 
     ret = "(export "
     if WASM_EXTERN_FUNC == ext_kind:
-        ft = wasm_externtype_as_functype(ext_type)
+        ft = binding.wasm_externtype_as_functype(ext_type)
         ret += str(dereference(ft))
     elif WASM_EXTERN_GLOBAL == ext_kind:
-        gt = wasm_externtype_as_globaltype(ext_type)
+        gt = binding.wasm_externtype_as_globaltype(ext_type)
         ret += str(dereference(gt))
     elif WASM_EXTERN_MEMORY == ext_kind:
-        mt = wasm_externtype_as_memorytype(ext_type)
+        mt = binding.wasm_externtype_as_memorytype(ext_type)
         ret += str(dereference(mt))
     elif WASM_EXTERN_TABLE == ext_kind:
-        tt = wasm_externtype_as_tabletype(ext_type)
+        tt = binding.wasm_externtype_as_tabletype(ext_type)
         ret += str(dereference(tt))
     else:
         raise RuntimeError("not a valid extern kind")
@@ -540,7 +688,7 @@ wasm_extern_t.__repr__ = __repr_wasm_extern_t
 def wasm_name_new_from_string(s):
     name = wasm_name_t()
     data = ((c.c_ubyte) * len(s)).from_buffer_copy(s.encode())
-    wasm_byte_vec_new(byref(name), len(s), data)
+    binding.wasm_byte_vec_new(byref(name), len(s), data)
     return name
 
 
@@ -549,19 +697,19 @@ def __wasm_functype_new(param_list, result_list):
         vec = wasm_valtype_vec_t()
 
         if not l:
-            wasm_valtype_vec_new_empty(byref(vec))
+            binding.wasm_valtype_vec_new_empty(byref(vec))
         else:
             data_type = POINTER(wasm_valtype_t) * len(l)
             data = data_type()
             for i in range(len(l)):
                 data[i] = l[i]
-            wasm_valtype_vec_new(byref(vec), len(l), data)
+            binding.wasm_valtype_vec_new(byref(vec), len(l), data)
 
         return vec
 
     params = __list_to_wasm_valtype_vec(param_list)
     results = __list_to_wasm_valtype_vec(result_list)
-    return wasm_functype_new(byref(params), byref(results))
+    return binding.wasm_functype_new(byref(params), byref(results))
 
 
 def wasm_functype_new_0_0():
@@ -596,6 +744,16 @@ def wasm_functype_new_3_1(p1, p2, p3, r1):
     return __wasm_functype_new([p1, p2, p3], [r1])
 
 
+def wasm_functype_new_from_kinds(params, results):
+    """
+    A wasm_functype_t of kinds, like ([WASM_I32, WASM_I32], [WASM_I64])
+    """
+    return __wasm_functype_new(
+        [binding.wasm_valtype_new(kind) for kind in params],
+        [binding.wasm_valtype_new(kind) for kind in results],
+    )
+
+
 def wasm_limits_new(min, max):
     limit = wasm_limits_t()
     limit.min = min
@@ -637,3 +795,32 @@ def wasm_func_cb_decl(func):
 
 def wasm_func_with_env_cb_decl(func):
     return wasm_func_callback_with_env_t(func)
+
+
+#
+# Epilogue. Foreign functions of binding are materialized on demand
+#
+
+
+def __getattr__(name):
+    # pylint: disable=protected-access
+    if "libiwasm" == name:
+        return load_library()
+
+    if name not in binding._PROTOTYPES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(binding, name)
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    # pylint: disable=protected-access
+    return sorted(set(globals()) | set(binding._PROTOTYPES))
+
+
+# `from wamr.ffi import *` still brings every foreign function, it is the
+# only way to materialize all of them
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += list(binding._PROTOTYPES)
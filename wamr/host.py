@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Host functions from plain Python functions.
+
+@host_function(params, results) wraps a function taking and returning ints
+and floats. A trampoline generated for the signature reads all arguments
+with one struct.unpack, calls the function and writes results into
+`results.data` with one memmove, instead of a wasm_val_t per value.
+
+A Registry creates functions with wasm_func_new_with_env() and one shared
+callback. `env` is a slot of a table of Python callables.
+"""
+
+import ctypes as c
+from functools import lru_cache, update_wrapper
+import struct
+import threading
+
+from . import ffi
+
+# the union of a wasm_val_t as a struct format, standard sizes
+_FORMATS = {
+    ffi.WASM_I32: "i4x",
+    ffi.WASM_I64: "q",
+    ffi.WASM_F32: "f4x",
+    ffi.WASM_F64: "d",
+}
+
+# (args, results) as addresses, it has the ABI of wasm_func_callback_t
+_trampoline_t = c.CFUNCTYPE(c.c_void_p, c.c_void_p, c.c_void_p)
+# (env, args, results), the ABI of wasm_func_callback_with_env_t
+_dispatcher_t = c.CFUNCTYPE(c.c_void_p, c.c_void_p, c.c_void_p, c.c_void_p)
+
+
+def _layouts(param_kinds, result_kinds):
+    for kind in param_kinds + result_kinds:
+        if kind not in _FORMATS:
+            raise RuntimeError(f"kind {kind} is not supported by host functions")
+
+    # params are only read, skip `kind`. Results are written as whole values
+    params = struct.Struct("=" + "".join("8x" + _FORMATS[k] for k in param_kinds))
+    results = struct.Struct("=" + "".join("B7x" + _FORMATS[k] for k in result_kinds))
+    return params, results
+
+
+def _new_trap(store, exception):
+    # a trap to return from a callback, the runtime takes it
+    text = f"{type(exception).__name__}: {exception}".encode() + b"\0"
+    message = ffi.wasm_message_t()
+    ffi.wasm_byte_vec_new(message, len(text), (c.c_ubyte * len(text))(*text))
+    trap = ffi.wasm_trap_new(store, message)
+    ffi.wasm_byte_vec_delete(message)
+    return c.cast(trap, c.c_void_p).value
+
+
+@lru_cache(maxsize=256)
+def _factory(param_kinds, result_kinds):
+    """
+    Compiles a function which makes trampolines of the signature. Offsets,
+    sizes and kinds are literals of the generated code
+    """
+    params_layout, results_layout = _layouts(param_kinds, result_kinds)
+    data = ffi.wasm_val_vec_t.data.offset
+    num_elems = ffi.wasm_val_vec_t.num_elems.offset
+
+    params = [f"a{i}" for i in range(len(param_kinds))]
+    returns = [f"r{i}" for i in range(len(result_kinds))]
+
+    lines = [
+        "def make(func, store, unpack, pack, string_at, pointer_at, size_at, "
+        "memmove, new_trap):",
+        "    def trampoline(args, results):",
+        "        try:",
+    ]
+
+    if params:
+        # unpack() returns a tuple, even of one
+        targets = ", ".join(params) + ("," if 1 == len(params) else "")
+        lines.append(
+            f"            {targets} = unpack(string_at("
+            f"pointer_at(args + {data}).value, {params_layout.size}))"
+        )
+
+    call = f"func({', '.join(params)})"
+    if not returns:
+        lines.append(f"            {call}")
+    else:
+        values = ", ".join(
+            f"{kind}, {value}" for kind, value in zip(result_kinds, returns)
+        )
+        lines += [
+            # one result is returned as it is, more as a tuple
+            f"            {', '.join(returns)} = {call}",
+            f"            memmove(pointer_at(results + {data}).value, "
+            f"pack({values}), {results_layout.size})",
+            f"            size_at(results + {num_elems}).value = {len(returns)}",
+        ]
+
+    lines += [
+        "        except Exception as exception:",
+        "            return new_trap(store, exception)",
+        "        return None",
+        "    return trampoline",
+    ]
+
+    name = "_".join(_FORMATS[kind][0] for kind in param_kinds) or "void"
+    name += "__" + ("_".join(_FORMATS[kind][0] for kind in result_kinds) or "void")
+
+    # pylint: disable=exec-used
+    namespace = {}
+    exec(compile("\n".join(lines), f"<wamr.host {name}>", "exec"), namespace)
+    make = namespace["make"]
+
+    def bind(func, store):
+        return make(
+            func,
+            store,
+            params_layout.unpack,
+            results_layout.pack,
+            c.string_at,
+            c.c_void_p.from_address,
+            c.c_size_t.from_address,
+            c.memmove,
+            _new_trap,
+        )
+
+    return bind
+
+
+class HostFunction:
+    """
+    A Python function with the signature of a host function. Calling it
+    calls the Python function.
+
+    new(store) creates a wasm_func_t, callback(store) is the
+    wasm_func_callback_t for wasm_func_new() and functype() a new
+    wasm_functype_t. A callback is created once per store and kept alive by
+    this object, so it has to live as long as functions created from it.
+
+    An exception in the function is returned to the runtime as a trap with
+    the exception as the message, results of the call are not written.
+    """
+
+    def __init__(self, func, params=(), results=()):
+        self.func = func
+        self.params = tuple(params)
+        self.results = tuple(results)
+        self._bind = _factory(self.params, self.results)
+        # the address of a store -> its callback
+        self._callbacks = {}
+        update_wrapper(self, func)
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def functype(self):
+        """
+        A new wasm_functype_t, wasm_functype_delete() it after use
+        """
+        return ffi.wasm_functype_new_from_kinds(self.params, self.results)
+
+    def callback(self, store):
+        key = c.cast(store, c.c_void_p).value
+        callback = self._callbacks.get(key)
+        if callback is None:
+            trampoline = _trampoline_t(self._bind(self.func, store))
+            # the cast keeps a reference of the trampoline
+            callback = c.cast(trampoline, ffi.wasm_func_callback_t)
+            self._callbacks[key] = callback
+
+        return callback
+
+    def new(self, store):
+        func_type = self.functype()
+        try:
+            return ffi.wasm_func_new(store, func_type, self.callback(store))
+        finally:
+            ffi.wasm_functype_delete(func_type)
+
+    def __repr__(self):
+        name = getattr(self.func, "__name__", self.func)
+        return f"HostFunction({name}, {self.params} -> {self.results})"
+
+
+def host_function(params=(), results=()):
+    """
+    A decorator which makes a HostFunction of kinds of *params* and *results*
+
+        @host_function([WASM_F32], [WASM_F64])
+        def double(value):
+            return value * 2.0
+    """
+
+    def decorate(func):
+        return HostFunction(func, params, results)
+
+    return decorate
+
+
+class Registry:
+    """
+    Host functions behind one callback and one finalizer, instead of a
+    CFUNCTYPE per function.
+
+    A callable, which takes addresses of args and results and returns None
+    or the address of a trap, is put into a slot of a table. The index of the
+    slot is the `env` of wasm_func_new_with_env(), the shared callback looks
+    it up by index. The finalizer frees the slot when the runtime deletes
+    the function, like by wasm_instance_delete() of the instance importing
+    it.
+
+    new() creates a function of a HostFunction, with the same trampoline as
+    HostFunction.new(). *func* replaces the Python function of the
+    HostFunction, like a functools.partial() with the state of an instance.
+
+    Slots are taken and freed under a lock, functions can be created and
+    deleted in any thread.
+    """
+
+    def __init__(self):
+        # slot 0 is never used, NULL is not a valid `env`
+        self._slots = [None]
+        self._free = []
+        self._lock = threading.Lock()
+        # the registry has to outlive all functions created by it
+        self.callback = c.cast(
+            _dispatcher_t(self._dispatch), ffi.wasm_func_callback_with_env_t
+        )
+        self.finalizer = ffi.wasm_finalizer(self.release)
+
+    def _dispatch(self, env, args, results):
+        return self._slots[env](args, results)
+
+    def register(self, callable_):
+        """
+        Puts *callable_* in a free slot. Returns the index of the slot
+        """
+        with self._lock:
+            if self._free:
+                env = self._free.pop()
+                self._slots[env] = callable_
+            else:
+                env = len(self._slots)
+                self._slots.append(callable_)
+
+        return env
+
+    def release(self, env):
+        """
+        Frees the slot of *env*. It is the finalizer of functions
+        """
+        with self._lock:
+            if env and self._slots[env] is not None:
+                self._slots[env] = None
+                self._free.append(env)
+
+    def new_with_env(self, store, func_type, callable_):
+        """
+        wasm_func_new_with_env() of *callable_* with the shared callback. It
+        returns NULL if failed, like wasm_func_new_with_env()
+        """
+        env = self.register(callable_)
+        func = ffi.wasm_func_new_with_env(
+            store, func_type, self.callback, env, self.finalizer
+        )
+        if ffi.is_null_pointer(func):
+            # the runtime doesn't finalize what it hasn't created
+            self.release(env)
+
+        return func
+
+    def new(self, store, host, func=None):
+        # pylint: disable=protected-access
+        func_type = host.functype()
+        try:
+            trampoline = host._bind(host.func if func is None else func, store)
+            return self.new_with_env(store, func_type, trampoline)
+        finally:
+            ffi.wasm_functype_delete(func_type)
+
+    def __len__(self):
+        return len(self._slots) - 1 - len(self._free)
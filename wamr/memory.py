@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Views of a linear memory which alias guest memory, nothing is copied.
+
+A view is only valid while the memory keeps its base address and size.
+`wasm_memory_grow()`, or `memory.grow` in the guest, may move or extend it.
+"""
+
+import ctypes as c
+from functools import lru_cache
+from itertools import chain
+import struct
+
+from . import ffi
+
+
+def _numpy():
+    # pylint: disable=import-outside-toplevel
+    try:
+        import numpy
+    except ImportError as e:
+        raise RuntimeError("numpy is required, pip install wamr-python[numpy]") from e
+
+    return numpy
+
+
+def _struct(layout):
+    return layout if isinstance(layout, struct.Struct) else struct.Struct(layout)
+
+
+@lru_cache(maxsize=64)
+def _field_count(layout):
+    return len(struct.unpack(layout, bytes(struct.calcsize(layout))))
+
+
+@lru_cache(maxsize=64)
+def _repeated_struct(layout, count):
+    # standard sizes and no alignment, so `count` records pack as one
+    return struct.Struct(layout[0] + layout[1:] * count)
+
+
+class LinearMemory:
+    """
+    Wraps a POINTER(wasm_memory_t), or a POINTER(wasm_extern_t) of a memory.
+
+    view() is a writable memoryview of the whole memory. It is cached and
+    refreshed when the base address or the size changes. A refresh releases
+    the previous view, any access to it raises ValueError instead of touching
+    unmapped memory. Slices of a view and NumPy arrays from ndarray() hold
+    their own references and can't be released, re-fetch them after anything
+    which may grow the memory, or check `stale`.
+    """
+
+    def __init__(self, memory):
+        if isinstance(memory, c.POINTER(ffi.wasm_extern_t)):
+            memory = ffi.wasm_extern_as_memory(memory)
+
+        if ffi.is_null_pointer(memory):
+            raise RuntimeError("not a memory")
+
+        self._memory = memory
+        self._base = None
+        self._size = 0
+        self._view = None
+        self.generation = 0
+
+    def _mapping(self):
+        base = c.cast(ffi.wasm_memory_data(self._memory), c.c_void_p).value
+        return base, ffi.wasm_memory_data_size(self._memory)
+
+    @property
+    def memory(self):
+        return self._memory
+
+    @property
+    def data_size(self):
+        return ffi.wasm_memory_data_size(self._memory)
+
+    @property
+    def pages(self):
+        return ffi.wasm_memory_size(self._memory)
+
+    @property
+    def stale(self):
+        """
+        True if the base address or the size has changed since the last view
+        """
+        return self._mapping() != (self._base, self._size)
+
+    def refresh(self):
+        """
+        Picks up a new base address or size. Returns True if it has changed
+        """
+        base, size = self._mapping()
+        if (base, size) == (self._base, self._size):
+            return False
+
+        if self._view is not None:
+            try:
+                self._view.release()
+            except BufferError:
+                # still exported, like by a NumPy array
+                pass
+
+        self._base = base
+        self._size = size
+        self._view = None
+        self.generation += 1
+        return True
+
+    def view(self):
+        """
+        A writable memoryview of the whole memory, format "B"
+        """
+        self.refresh()
+
+        if self._view is None:
+            if self._base is None:
+                # no memory yet, (memory 0), still a writable view
+                self._view = memoryview(bytearray())
+            else:
+                data = (c.c_ubyte * self._size).from_address(self._base)
+                self._view = memoryview(data).cast("B")
+
+        return self._view
+
+    def ndarray(self, dtype="uint8", offset=0, shape=None):
+        """
+        A NumPy array of *dtype* and *shape* at *offset* in the memory. Without
+        *shape*, it is a 1-D array to the end of the memory
+        """
+        numpy = _numpy()
+        dtype = numpy.dtype(dtype)
+        view = self.view()
+
+        if offset < 0 or offset > len(view):
+            raise IndexError(f"offset {offset} is out of the memory")
+
+        if shape is None:
+            shape = ((len(view) - offset) // dtype.itemsize,)
+        elif isinstance(shape, int):
+            shape = (shape,)
+
+        count = 1
+        for dim in shape:
+            count *= dim
+
+        if offset + count * dtype.itemsize > len(view):
+            raise IndexError(
+                f"{count} elements of {dtype} at {offset} are out of the memory"
+            )
+
+        return numpy.frombuffer(view, dtype=dtype, count=count, offset=offset).reshape(
+            shape
+        )
+
+    def grow(self, delta):
+        """
+        wasm_memory_grow() and refresh the view. Returns False if failed
+        """
+        grown = ffi.wasm_memory_grow(self._memory, delta)
+        self.refresh()
+        return grown
+
+    def __len__(self):
+        return self.data_size
+
+    #
+    # bulk operations. Every one checks bounds against wasm_memory_data_size
+    # and goes through memmove/memset or a buffer over the memory, never
+    # byte by byte
+    #
+
+    def _address(self, offset, size):
+        base, data_size = self._mapping()
+        if offset < 0 or size < 0 or offset + size > data_size:
+            raise IndexError(
+                f"[{offset}, {offset + size}) is out of the memory of {data_size} bytes"
+            )
+
+        return (base or 0) + offset
+
+    def _buffer(self, offset, size):
+        return (c.c_char * size).from_address(self._address(offset, size))
+
+    def read(self, offset, size):
+        """
+        *size* bytes at *offset* as bytes
+        """
+        return c.string_at(self._address(offset, size), size)
+
+    def read_into(self, offset, buffer):
+        """
+        Fills a writable *buffer*, like a bytearray, from *offset*. Returns
+        the number of bytes
+        """
+        view = memoryview(buffer).cast("B")
+        size = view.nbytes
+        c.memmove(
+            (c.c_char * size).from_buffer(view), self._address(offset, size), size
+        )
+        return size
+
+    def write(self, offset, buffer):
+        """
+        Copies bytes, a bytearray, a memoryview or anything with the buffer
+        protocol to *offset*. Returns the number of bytes
+        """
+        if not isinstance(buffer, bytes):
+            view = memoryview(buffer).cast("B")
+            # ctypes only takes addresses of writable buffers
+            buffer = (
+                view.tobytes()
+                if view.readonly
+                else (c.c_char * view.nbytes).from_buffer(view)
+            )
+
+        size = len(buffer)
+        c.memmove(self._address(offset, size), buffer, size)
+        return size
+
+    def fill(self, offset, value, size):
+        """
+        Sets *size* bytes at *offset* to *value*
+        """
+        c.memset(self._address(offset, size), value, size)
+
+    def copy_within(self, destination, source, size):
+        """
+        Copies *size* bytes from *source* to *destination*, they may overlap
+        """
+        source = self._address(source, size)
+        c.memmove(self._address(destination, size), source, size)
+
+    def pack_into(self, layout, offset, records):
+        """
+        Packs *records*, a sequence of tuples, as an array of *layout*, a
+        struct.Struct or its format, at *offset*. Returns the number of bytes
+        """
+        layout = _struct(layout)
+        size = layout.size * len(records)
+        buffer = self._buffer(offset, size)
+
+        if layout.format[0] in "<>!=" and records:
+            # all records in one call, a record of another length would shift
+            # the rest instead of failing
+            fields = _field_count(layout.format)
+            for record in records:
+                if len(record) != fields:
+                    raise struct.error(
+                        f"pack_into expected {fields} items for packing (got {len(record)})"
+                    )
+            _repeated_struct(layout.format, len(records)).pack_into(
+                buffer, 0, *chain.from_iterable(records)
+            )
+        else:
+            for i, record in enumerate(records):
+                layout.pack_into(buffer, i * layout.size, *record)
+
+        return size
+
+    def unpack_from(self, layout, offset, count):
+        """
+        Unpacks *count* records of *layout*, a struct.Struct or its format,
+        from *offset*. Returns a list of tuples
+        """
+        layout = _struct(layout)
+        return list(layout.iter_unpack(self._buffer(offset, layout.size * count)))
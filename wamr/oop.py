@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+OOP APIs over wamr.ffi, Engine, Store, Module, Instance, Func, FuncType,
+Global and Table.
+
+Every object owns one C object through a _Handle. A handle keeps handles it
+depends on alive, a store keeps its engine and an instance keeps its store
+and its module, so C objects are deleted in a valid order when the last
+reference goes away. `delete()` or a `with` block deletes one earlier, or as
+soon as the objects which depend on it are deleted.
+
+Everything is queried once. Func knows its type and calls through a
+function made by wamr.call.specialize(), Instance.exports() is a dict built
+by the first call.
+"""
+
+import ctypes as c
+import threading
+from types import MappingProxyType
+import weakref
+
+from . import ffi
+from .call import FIELDS, Trap, _trap_message, specialize
+from .exports import ExportIndex
+from .host import HostFunction, Registry
+from .memory import LinearMemory
+from .snapshot import Snapshot
+
+# host functions of all stores share one callback
+_REGISTRY = Registry()
+
+# dependents of handles are counted by threads creating and deleting them,
+# a deletion may delete the handles it depends on
+_HANDLES_LOCK = threading.RLock()
+
+
+class _Handle:
+    """
+    One C object, deleted by *deleter* once. *dependencies* are handles which
+    have to outlive it. delete() of a handle which others still depend on is
+    deferred until the last of them is deleted
+    """
+
+    __slots__ = ("pointer", "_deleter", "_dependencies", "_dependents", "_doomed")
+
+    def __init__(self, pointer, deleter, *dependencies):
+        if ffi.is_null_pointer(pointer):
+            raise RuntimeError(f"failed to create {pointer._type_.__name__}")
+
+        self.pointer = pointer
+        self._deleter = deleter
+        self._dependencies = dependencies
+        self._dependents = 0
+        self._doomed = False
+        with _HANDLES_LOCK:
+            for dependency in dependencies:
+                dependency._dependents += 1
+
+    # the lock is bound here, module globals may be gone when __del__() runs
+    # at exit
+    def delete(self, _lock=_HANDLES_LOCK):
+        with _lock:
+            self._doomed = True
+            if self._dependents:
+                return
+
+            deleter, self._deleter = self._deleter, None
+            dependencies, self._dependencies = self._dependencies, ()
+            if deleter is not None:
+                deleter(self.pointer)
+
+            for dependency in dependencies:
+                dependency._dependents -= 1
+                if dependency._doomed and not dependency._dependents:
+                    dependency.delete()
+
+    @property
+    def deleted(self):
+        return self._doomed and self._deleter is None
+
+    def __del__(self):
+        self.delete()
+
+
+def _borrowed(pointer, *dependencies):
+    # a C object owned by someone else, like an export of an instance
+    return _Handle(pointer, None, *dependencies)
+
+
+class _Object:
+    """
+    Has a _Handle. `pointer` is the C object
+    """
+
+    _handle = None
+
+    @property
+    def pointer(self):
+        return self._handle.pointer
+
+    def delete(self):
+        """
+        Deletes the C object now, or once objects created from it, like
+        instances of a module, are deleted. It can't be used after
+        """
+        self._handle.delete()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.delete()
+
+
+class Engine(_Object):
+    def __init__(self):
+        self._handle = _Handle(ffi.wasm_engine_new(), ffi.wasm_engine_delete)
+        # modules are compiled with a store of the engine and instantiated in
+        # any store of it. Created here, not by the first of concurrent
+        # compilations
+        self._compiling_store = Store(self)
+
+    def _store(self):
+        return self._compiling_store
+
+    def delete(self):
+        # the compiling store depends on the engine, it goes first
+        self._compiling_store.delete()
+        super().delete()
+
+
+class Store(_Object):
+    def __init__(self, engine):
+        self.engine = engine
+        self._handle = _Handle(
+            ffi.wasm_store_new(engine.pointer), ffi.wasm_store_delete, engine._handle
+        )
+
+
+class Module(_Object):
+    def __init__(self, engine, binary, cache=None):
+        """
+        Compiles *binary*, a path, bytes or a buffer, see ffi.load_module().
+        With *cache*, a wamr.cache.ModuleCache or SharedModuleCache, it may be
+        deserialized or shared instead. The module is released to the cache
+        when it and all its instances are gone
+        """
+        store = engine._store()
+        if cache is None:
+            module = ffi.load_module(store.pointer, binary)
+            deleter = ffi.wasm_module_delete
+        else:
+            module = cache.load(store.pointer, binary)
+            deleter = cache.release
+        if ffi.is_null_pointer(module):
+            raise RuntimeError("failed to compile the module")
+
+        self.engine = engine
+        self._handle = _Handle(module, deleter, store._handle)
+        # shared by all instances
+        self.exports = ExportIndex(module)
+
+    @classmethod
+    def from_file(cls, engine, path, cache=None):
+        return cls(engine, path, cache)
+
+    @classmethod
+    async def compile_async(cls, engine, binary, cache=None, runner=None):
+        """
+        Compiles in a thread of *runner*, or of wamr.aio.default_runner()
+        """
+        # pylint: disable=import-outside-toplevel
+        from .aio import default_runner
+
+        return await (runner or default_runner()).compile(engine, binary, cache)
+
+
+class FuncType(_Object):
+    def __init__(self, params, results):
+        """
+        *params* and *results* are kinds, like [WASM_I32, WASM_F64]
+        """
+        self.params = tuple(params)
+        self.results = tuple(results)
+        self._handle = _Handle(
+            ffi.wasm_functype_new_from_kinds(self.params, self.results),
+            ffi.wasm_functype_delete,
+        )
+
+    def __repr__(self):
+        return f"FuncType({list(self.params)}, {list(self.results)})"
+
+
+class Func(_Object):
+    """
+    Calls with `func(store, *args)`. It returns None without results, a value
+    with one result and a tuple with more. A trap raises wamr.call.Trap
+    """
+
+    def __init__(self, store, func_type, callback):
+        """
+        A host function, *callback* takes and returns ints and floats of
+        *func_type*
+        """
+        host = HostFunction(callback, func_type.params, func_type.results)
+        func = _REGISTRY.new(store.pointer, host)
+        self._init(store, _Handle(func, ffi.wasm_func_delete, store._handle))
+
+    @classmethod
+    def _from_handle(cls, store, handle):
+        func = cls.__new__(cls)
+        func._init(store, handle)
+        return func
+
+    def _init(self, store, handle):
+        self.store = store
+        # a weak reference to the Instance of an export, which holds the Func
+        self._instance = None
+        self._handle = handle
+        self._call = specialize(handle.pointer)
+        self.params = self._call.frame.param_kinds
+        self.results = self._call.frame.result_kinds
+
+    @property
+    def instance(self):
+        """
+        The Instance of an export while it is alive, None for a host function
+        """
+        return None if self._instance is None else self._instance()
+
+    @property
+    def type(self):
+        """
+        A new FuncType
+        """
+        return FuncType(self.params, self.results)
+
+    def __call__(self, store, *args):
+        if store is not self.store:
+            raise RuntimeError("the function belongs to another store")
+
+        return self._call(*args)
+
+    async def call_async(self, store, *args, runner=None):
+        """
+        Calls in a thread of *runner*, or of wamr.aio.default_runner(). A
+        cancelled call is skipped if it hasn't started, see
+        wamr.aio.AsyncRunner for one which runs
+        """
+        # pylint: disable=import-outside-toplevel
+        from .aio import default_runner
+
+        return await (runner or default_runner()).call(self, store, *args)
+
+    def __repr__(self):
+        return f"Func({list(self.params)} -> {list(self.results)})"
+
+
+class Global(_Object):
+    def __init__(self, store, handle):
+        self.store = store
+        self._handle = handle
+
+        global_type = ffi.wasm_global_type(handle.pointer)
+        self.kind = ffi.wasm_valtype_kind(ffi.wasm_globaltype_content(global_type))
+        self.mutable = ffi.WASM_VAR == ffi.wasm_globaltype_mutability(global_type)
+        ffi.wasm_globaltype_delete(global_type)
+
+        self._field = FIELDS[self.kind]
+        self._val = ffi.wasm_val_t()
+
+    @property
+    def value(self):
+        ffi.wasm_global_get(self.pointer, self._val)
+        return getattr(self._val.of, self._field)
+
+    @value.setter
+    def value(self, value):
+        self._val.kind = self.kind
+        setattr(self._val.of, self._field, value)
+        ffi.wasm_global_set(self.pointer, self._val)
+
+
+class Table(_Object):
+    def __init__(self, store, handle):
+        self.store = store
+        self._handle = handle
+
+    def __len__(self):
+        return ffi.wasm_table_size(self.pointer)
+
+
+class Memory(LinearMemory):
+    def __init__(self, store, handle):
+        super().__init__(handle.pointer)
+        self.store = store
+        # keeps the instance alive
+        self._handle = handle
+
+
+# kind of an extern -> (wasm_extern_as_xxx, the class), by names since foreign
+# functions are resolved on the first call
+_EXPORT_TYPES = {
+    ffi.WASM_EXTERN_FUNC: ("wasm_extern_as_func", Func._from_handle),
+    ffi.WASM_EXTERN_GLOBAL: ("wasm_extern_as_global", Global),
+    ffi.WASM_EXTERN_TABLE: ("wasm_extern_as_table", Table),
+    ffi.WASM_EXTERN_MEMORY: ("wasm_extern_as_memory", Memory),
+}
+
+
+class Instance(_Object):
+    def __init__(self, store, module, imports=()):
+        """
+        *imports* are Func, Global, Table or Memory in the order of imports of
+        *module*. They are kept alive as long as the instance
+        """
+        self.store = store
+        self.module = module
+        self._imports = tuple(imports)
+
+        externs = (c.POINTER(ffi.wasm_extern_t) * max(len(self._imports), 1))()
+        for i, extern in enumerate(self._imports):
+            externs[i] = _as_extern(extern)
+        # borrowed, wasm_extern_vec_delete() would delete the imports
+        imports_vec = ffi.wasm_extern_vec_t()
+        imports_vec.size = imports_vec.num_elems = len(self._imports)
+        imports_vec.size_of_elem = c.sizeof(c.POINTER(ffi.wasm_extern_t))
+        imports_vec.data = externs
+
+        trap = c.POINTER(ffi.wasm_trap_t)()
+        instance = ffi.wasm_instance_new(
+            store.pointer, module.pointer, imports_vec, c.byref(trap)
+        )
+        if trap:
+            raise Trap(_trap_message(c.cast(trap, c.c_void_p).value))
+        if ffi.is_null_pointer(instance):
+            raise RuntimeError("failed to instantiate the module")
+
+        self._handle = _Handle(
+            instance,
+            ffi.wasm_instance_delete,
+            store._handle,
+            module._handle,
+            *(extern._handle for extern in self._imports),
+        )
+        self._externs = None
+        # names -> objects of exports which have been touched
+        self._objects = {}
+        self._exports = None
+
+    def _check_store(self, store):
+        if store is not self.store:
+            raise RuntimeError("the instance belongs to another store")
+
+    def _extern_vec(self):
+        if self._externs is None:
+            externs = ffi.wasm_extern_vec_t()
+            ffi.wasm_instance_exports(self.pointer, externs)
+            # the vector owns exported externs, objects borrow them
+            self._externs = _Handle(
+                c.pointer(externs), ffi.wasm_extern_vec_delete, self._handle
+            )
+
+        return self._externs
+
+    def export(self, store, name):
+        """
+        The object of export *name*, found by the index of the module. Only
+        this one is wrapped. Raises KeyError if there is no such export
+        """
+        self._check_store(store)
+
+        wrapped = self._objects.get(name)
+        if wrapped is None:
+            entry = self.module.exports[name]
+            owner = self._extern_vec()
+            extern = ffi.dereference(owner.pointer).data[entry.position]
+
+            as_kind, wrap = _EXPORT_TYPES[entry.kind]
+            pointer = getattr(ffi, as_kind)(extern)
+            wrapped = self._objects[name] = wrap(self.store, _borrowed(pointer, owner))
+            if isinstance(wrapped, Func):
+                wrapped._instance = weakref.ref(self)
+
+        return wrapped
+
+    def exports(self, store):
+        """
+        A read-only dict of export names to objects. It is built once, every
+        call returns the same one
+        """
+        self._check_store(store)
+
+        if self._exports is None:
+            self._exports = MappingProxyType(
+                {name: self.export(store, name) for name in self.module.exports}
+            )
+
+        return self._exports
+
+    @classmethod
+    async def new_async(cls, store, module, imports=(), runner=None):
+        """
+        Instantiates in a thread of *runner*, or of wamr.aio.default_runner()
+        """
+        # pylint: disable=import-outside-toplevel
+        from .aio import default_runner
+
+        return await (runner or default_runner()).instantiate(store, module, imports)
+
+    def snapshot(self, store):
+        """
+        A wamr.snapshot.Snapshot of exported memories and mutable globals
+        """
+        self._check_store(store)
+        return Snapshot(self)
+
+    def restore(self, store, snapshot):
+        """
+        Rolls exported memories and mutable globals back to *snapshot*, of
+        this instance or another instance of the module
+        """
+        self._check_store(store)
+        snapshot.restore(self)
+
+    def delete(self):
+        """
+        Deletes the instance with its exports, they can't be used after. An
+        export imported by another instance defers it until that one is
+        deleted
+        """
+        # exports borrow the vector, which borrows the instance
+        for wrapped in self._objects.values():
+            wrapped._handle.delete()
+        self._objects = {}
+        self._exports = None
+        if self._externs is not None:
+            self._externs.delete()
+        super().delete()
+
+
+def _as_extern(extern):
+    if isinstance(extern, Func):
+        return ffi.wasm_func_as_extern(extern.pointer)
+    if isinstance(extern, Global):
+        return ffi.wasm_global_as_extern(extern.pointer)
+    if isinstance(extern, Table):
+        return ffi.wasm_table_as_extern(extern.pointer)
+    if isinstance(extern, Memory):
+        return ffi.wasm_memory_as_extern(extern.memory)
+
+    raise RuntimeError(f"can't import {extern!r}")
+
+
+__all__ = [
+    "Engine",
+    "Store",
+    "Module",
+    "FuncType",
+    "Func",
+    "Global",
+    "Table",
+    "Memory",
+    "Instance",
+    "Trap",
+]
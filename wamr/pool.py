@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Instances of a module which are reused instead of instantiated per request.
+
+An instance is checked out, used and given back. Then its exported memories
+and mutable globals are reset to what they were right after
+wasm_instance_new() by a wamr.snapshot.Snapshot, which is a copy of bytes
+instead of a new instance and a new imports vector.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+import threading
+import time
+
+from .oop import Instance
+
+
+class InstancePool:
+    """
+    Instances of *module* in *store*, at least *min_size* and at most
+    *max_size*. *imports* are the imports of every instance, or a callable
+    which returns new ones for an instance.
+
+    checkout() is a context manager of an instance. It waits, up to
+    *timeout* seconds, if all *max_size* instances are in use. An instance is
+    reset when it is given back, even after a trap. Instances idle for
+    *idle_timeout* seconds are dropped by trim(), down to *min_size*.
+
+    Exported memories and mutable globals are reset. State which isn't
+    exported, like a global only the module sees, can't be reached through
+    the C API and is kept, and a grown memory keeps its size.
+
+    It is thread-safe, but using instances of one store in many threads is
+    up to the runtime.
+    """
+
+    def __init__(
+        self, store, module, imports=(), min_size=1, max_size=8, idle_timeout=60.0
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise RuntimeError(f"invalid sizes {min_size}, {max_size}")
+
+        self.store = store
+        self.module = module
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._imports = imports if callable(imports) else lambda: imports
+
+        self._condition = threading.Condition()
+        # (instance, the time it was given back), the most recently used last
+        self._idle = deque()
+        # instance -> its state after instantiation
+        self._pristine = {}
+        # instances handed out by acquire()
+        self._busy = set()
+        self._size = 0
+
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.resets = 0
+        self.reset_time = 0.0
+        self.created = 0
+        self.trimmed = 0
+
+        for _ in range(min_size):
+            self._idle.append((self._new(), time.monotonic()))
+            self._size += 1
+
+    def _new(self):
+        instance = Instance(self.store, self.module, self._imports())
+        pristine = instance.snapshot(self.store)
+        with self._condition:
+            self._pristine[instance] = pristine
+            self.created += 1
+        return instance
+
+    def acquire(self, timeout=None):
+        """
+        An instance, the most recently used idle one, a new one or one given
+        back by another thread. Raises TimeoutError after *timeout* seconds.
+        Give it back by release()
+        """
+        with self._condition:
+            if not self._idle and self._size >= self.max_size:
+                self.waits += 1
+                begin = time.perf_counter()
+                ready = self._condition.wait_for(
+                    lambda: self._idle or self._size < self.max_size, timeout
+                )
+                self.wait_time += time.perf_counter() - begin
+                if not ready:
+                    raise TimeoutError(f"no instance in {timeout} seconds")
+
+            self.checkouts += 1
+            if self._idle:
+                instance = self._idle.pop()[0]
+                self._busy.add(instance)
+                return instance
+
+            # instantiated out of the lock below
+            self._size += 1
+
+        try:
+            instance = self._new()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._busy.add(instance)
+        return instance
+
+    def release(self, instance):
+        """
+        Resets *instance*, from acquire(), and puts it back. If it can't be
+        reset, it is dropped and the error is raised. Raises ValueError if it
+        isn't checked out of this pool
+        """
+        with self._condition:
+            if instance not in self._busy:
+                raise ValueError(f"{instance!r} isn't checked out of the pool")
+            self._busy.remove(instance)
+            pristine = self._pristine[instance]
+
+        begin = time.perf_counter()
+        try:
+            instance.restore(self.store, pristine)
+        except BaseException:
+            with self._condition:
+                del self._pristine[instance]
+                self._size -= 1
+                self._condition.notify()
+            raise
+        elapsed = time.perf_counter() - begin
+
+        with self._condition:
+            self.resets += 1
+            self.reset_time += elapsed
+            self._idle.append((instance, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """
+        with pool.checkout() as instance:
+            instance.export(store, "run")(store, 1.0)
+        """
+        instance = self.acquire(timeout)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def trim(self):
+        """
+        Drops instances idle for longer than idle_timeout, the least recently
+        used first, while there are more than min_size. Returns how many are
+        dropped
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        trimmed = 0
+        with self._condition:
+            while (
+                self._idle
+                and self._size > self.min_size
+                and self._idle[0][1] <= deadline
+            ):
+                # deleted with their exports when the last reference goes
+                del self._pristine[self._idle.popleft()[0]]
+                self._size -= 1
+                trimmed += 1
+            self.trimmed += trimmed
+
+        return trimmed
+
+    @property
+    def size(self):
+        """
+        The number of instances, idle or in use
+        """
+        return self._size
+
+    @property
+    def idle(self):
+        return len(self._idle)
+
+    def close(self):
+        """
+        Drops idle instances, an instance in use can still be released
+        """
+        with self._condition:
+            for instance, _ in self._idle:
+                del self._pristine[instance]
+            self._size -= len(self._idle)
+            self._idle.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
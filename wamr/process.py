@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Calls of exports in worker processes, for guest code which keeps cores busy
+and host functions which would fight for the GIL in threads.
+
+The binary is put into a multiprocessing.shared_memory block once. Every
+worker compiles it straight from the block, it is neither copied nor
+pickled per worker. With a directory of a wamr.cache.ModuleCache, workers
+after the first one deserialize instead of compiling. A worker is pinned to
+a core with os.sched_setaffinity() where it is available.
+
+call_many() splits columns of arguments into chunks of rows. A chunk goes to
+a worker as the raw bytes of its columns and comes back the same way, the
+worker runs wamr.values.call_many() over it.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+
+import numpy
+
+from .cache import ModuleCache
+from .call import Trap
+from .oop import Engine, Instance, Module, Store
+from .values import call_many
+
+# (store, instance) of a worker process
+_worker = None
+
+
+def _cores():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return []
+
+
+def _init_worker(block_name, size, cache, imports, cores, counter):
+    # pylint: disable=global-statement
+    global _worker
+
+    if cores:
+        with counter.get_lock():
+            index = counter.value
+            counter.value += 1
+        os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+    engine = Engine()
+    block = shared_memory.SharedMemory(block_name)
+    source = block.buf[:size]
+    try:
+        module = Module(engine, source, None if cache is None else ModuleCache(cache))
+    finally:
+        source.release()
+        block.close()
+
+    store = Store(engine)
+    imports = () if imports is None else imports(store)
+    _worker = (store, Instance(store, module, imports))
+
+
+def _pack(columns):
+    # raw bytes of columns, cheap to pickle
+    return [(column.dtype.str, column.tobytes()) for column in columns]
+
+
+def _unpack(packed):
+    return [numpy.frombuffer(data, dtype) for dtype, data in packed]
+
+
+def _call(name, args):
+    store, instance = _worker
+    return instance.export(store, name)(store, *args)
+
+
+def _call_chunk(name, packed):
+    store, instance = _worker
+    results = call_many(instance.export(store, name).pointer, _unpack(packed))
+    if results is None:
+        return None
+    return _pack(results if isinstance(results, tuple) else (results,))
+
+
+class ProcessPool:
+    """
+    *processes* worker processes, one per core by default, each with an
+    instance of *binary*, a path, bytes or a buffer. *imports* is None, or a
+    picklable callable, like a function of a module, which takes the store
+    of a worker and returns the imports. *cache* is a directory of a
+    ModuleCache. *affinity* pins workers to cores of the process, one each.
+
+    submit(name, *args) calls an export in a worker and returns a
+    concurrent.futures.Future. call_many(name, args) works like
+    wamr.values.call_many() with rows spread over workers. A trap raises
+    wamr.call.Trap.
+
+    Workers are started by *context*, "spawn" by default, so they don't
+    inherit a runtime state of this process.
+    """
+
+    def __init__(
+        self,
+        binary,
+        imports=None,
+        processes=None,
+        affinity=True,
+        cache=None,
+        context="spawn",
+    ):
+        if isinstance(binary, (str, os.PathLike)):
+            with open(binary, "rb") as module_file:
+                binary = module_file.read()
+
+        binary = memoryview(binary).cast("B")
+        cores = _cores() if affinity else []
+        if processes is None:
+            processes = len(cores) or os.cpu_count() or 1
+
+        self.processes = processes
+        self._block = shared_memory.SharedMemory(create=True, size=max(len(binary), 1))
+        self._block.buf[: len(binary)] = binary
+
+        context = multiprocessing.get_context(context)
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                self._block.name,
+                len(binary),
+                None if cache is None else os.fspath(cache),
+                imports,
+                cores,
+                context.Value("i", 0),
+            ),
+        )
+
+    def submit(self, name, *args):
+        return self._executor.submit(_call, name, args)
+
+    def call_many(self, name, args, chunk_size=None):
+        """
+        Calls export *name* once per row of *args*, columns or a 2-D array.
+        Rows are sent in chunks of *chunk_size*, by default as many chunks
+        as workers
+        """
+        if isinstance(args, numpy.ndarray) and 2 == args.ndim:
+            args = args.T
+        columns = [numpy.ascontiguousarray(column) for column in args]
+        count = len(columns[0]) if columns else 0
+        if chunk_size is None:
+            chunk_size = max(-(-count // self.processes), 1)
+
+        # one chunk at least, for results of the right types
+        starts = range(0, max(count, 1), chunk_size)
+        futures = [
+            self._executor.submit(
+                _call_chunk,
+                name,
+                _pack([column[start : start + chunk_size] for column in columns]),
+            )
+            for start in starts
+        ]
+
+        chunks = []
+        for start, future in zip(starts, futures):
+            try:
+                chunks.append(future.result())
+            except Trap as trap:
+                raise Trap(f"{trap}, of the chunk from row {start}") from None
+
+        if not chunks or chunks[0] is None:
+            return None
+
+        results = [numpy.concatenate(parts) for parts in zip(*map(_unpack, chunks))]
+        return results[0] if 1 == len(results) else tuple(results)
+
+    def close(self):
+        """
+        Stops workers and frees the shared memory of the binary
+        """
+        self._executor.shutdown()
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
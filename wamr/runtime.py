@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+#It is a generated file. DO NOT EDIT.
+#
+from ctypes import *
+
+from .ffi import load_library, wasm_module_t, wasm_ref_t, wasm_val_t, wasm_valkind_t, WASMModuleCommon
+
+
+def _prototype(name, restype, argtypes):
+    # resolve and type a foreign function once, callers use it directly.
+    # Short accessors in _HOLD_GIL come from a PyDLL handle
+    func = load_library(name in _HOLD_GIL)[name]
+    func.restype = restype
+    func.argtypes = argtypes
+    return func
+
+
+def __getattr__(name):
+    # materialize a foreign function when it is touched for the first time
+    if name not in _PROTOTYPES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = _prototype(name, *_PROTOTYPES[name])
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PROTOTYPES))
+
+
+class NativeSymbol(Structure):
+    _fields_ = [
+        ("symbol", c_char_p),
+        ("func_ptr", c_void_p),
+        ("signature", c_char_p),
+        ("attachment", c_void_p),
+    ]
+
+class WASMModuleInstanceCommon(Structure):
+    pass
+
+wasm_module_inst_t = POINTER(WASMModuleInstanceCommon)
+
+WASMFunctionInstanceCommon = None
+
+wasm_function_inst_t = c_void_p
+
+class wasm_section_t(Structure):
+    pass
+
+wasm_section_t._fields_ = [
+    ("next", POINTER(wasm_section_t)),
+    ("section_type", c_int),
+    ("section_body", POINTER(c_uint8)),
+    ("section_body_size", c_uint32),
+]
+
+aot_section_t = wasm_section_t
+
+wasm_section_list_t = POINTER(wasm_section_t)
+
+aot_section_list_t = POINTER(wasm_section_t)
+
+class WASMExecEnv(Structure):
+    pass
+
+wasm_exec_env_t = POINTER(WASMExecEnv)
+
+Wasm_Module_Bytecode = 0
+Wasm_Module_AoT = 1
+Package_Type_Unknown = 65535
+
+package_type_t = c_int
+
+Alloc_With_Pool = 0
+Alloc_With_Allocator = 1
+Alloc_With_System_Allocator = 2
+
+mem_alloc_type_t = c_int
+
+class MemAllocOption_pool(Structure):
+    _fields_ = [
+        ("heap_buf", c_void_p),
+        ("heap_size", c_uint32),
+    ]
+
+class MemAllocOption_allocator(Structure):
+    _fields_ = [
+        ("malloc_func", c_void_p),
+        ("realloc_func", c_void_p),
+        ("free_func", c_void_p),
+        ("user_data", c_void_p),
+    ]
+
+class MemAllocOption(Union):
+    _fields_ = [
+        ("pool", MemAllocOption_pool),
+        ("allocator", MemAllocOption_allocator),
+    ]
+
+class mem_alloc_info_t(Structure):
+    _fields_ = [
+        ("total_size", c_uint32),
+        ("total_free_size", c_uint32),
+        ("highmark_size", c_uint32),
+    ]
+
+Mode_Interp = 1
+Mode_Fast_JIT = 2
+Mode_LLVM_JIT = 3
+Mode_Multi_Tier_JIT = 4
+
+RunningMode = c_int
+
+class RuntimeInitArgs(Structure):
+    _fields_ = [
+        ("mem_alloc_type", mem_alloc_type_t),
+        ("mem_alloc_option", MemAllocOption),
+        ("native_module_name", c_char_p),
+        ("native_symbols", POINTER(NativeSymbol)),
+        ("n_native_symbols", c_uint32),
+        ("max_thread_num", c_uint32),
+        ("ip_addr", c_char * 128),
+        ("unused", c_int),
+        ("instance_port", c_int),
+        ("fast_jit_code_cache_size", c_uint32),
+        ("running_mode", RunningMode),
+        ("llvm_jit_opt_level", c_uint32),
+        ("llvm_jit_size_level", c_uint32),
+        ("segue_flags", c_uint32),
+        ("enable_linux_perf", c_bool),
+    ]
+
+WASM_LOG_LEVEL_FATAL = 0
+WASM_LOG_LEVEL_ERROR = 1
+WASM_LOG_LEVEL_WARNING = 2
+WASM_LOG_LEVEL_DEBUG = 3
+WASM_LOG_LEVEL_VERBOSE = 4
+
+log_level_t = c_int
+
+module_reader = CFUNCTYPE(c_bool,c_char_p,POINTER(POINTER(c_uint8)),POINTER(c_uint32))
+
+module_destroyer = CFUNCTYPE(None,POINTER(c_uint8),c_uint32)
+
+wasm_thread_callback_t = CFUNCTYPE(c_void_p,wasm_exec_env_t,c_void_p)
+
+wasm_thread_t = c_size_t
+
+
+_PROTOTYPES = {
+    "wasm_runtime_init": (c_bool, None),
+    "wasm_runtime_full_init": (c_bool, [POINTER(RuntimeInitArgs)]),
+    "wasm_runtime_set_log_level": (None, [log_level_t]),
+    "wasm_runtime_is_running_mode_supported": (c_bool, [RunningMode]),
+    "wasm_runtime_set_default_running_mode": (c_bool, [RunningMode]),
+    "wasm_runtime_destroy": (None, None),
+    "wasm_runtime_malloc": (c_void_p, [c_uint]),
+    "wasm_runtime_realloc": (c_void_p, [c_void_p,c_uint]),
+    "wasm_runtime_free": (None, [c_void_p]),
+    "wasm_runtime_get_mem_alloc_info": (c_bool, [POINTER(mem_alloc_info_t)]),
+    "wasm_runtime_is_xip_file": (c_bool, [POINTER(c_uint8),c_uint32]),
+    "wasm_runtime_set_module_reader": (None, [module_reader,module_destroyer]),
+    "wasm_runtime_get_module_reader": (module_reader, None),
+    "wasm_runtime_get_module_destroyer": (module_destroyer, None),
+    "wasm_runtime_register_module": (c_bool, [c_char_p,wasm_module_t,c_char_p,c_uint32]),
+    "wasm_runtime_find_module_registered": (wasm_module_t, [c_char_p]),
+    "wasm_runtime_load": (wasm_module_t, [POINTER(c_uint8),c_uint32,c_char_p,c_uint32]),
+    "wasm_runtime_load_from_sections": (wasm_module_t, [wasm_section_list_t,c_bool,c_char_p,c_uint32]),
+    "wasm_runtime_unload": (None, [wasm_module_t]),
+    "wasm_runtime_set_wasi_args_ex": (None, [wasm_module_t,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_int,c_int,c_int,c_int]),
+    "wasm_runtime_set_wasi_args": (None, [wasm_module_t,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_uint32,POINTER(c_char_p),c_int]),
+    "wasm_runtime_instantiate": (wasm_module_inst_t, [wasm_module_t,c_uint32,c_uint32,c_char_p,c_uint32]),
+    "wasm_runtime_set_running_mode": (c_bool, [wasm_module_inst_t,RunningMode]),
+    "wasm_runtime_get_running_mode": (RunningMode, [wasm_module_inst_t]),
+    "wasm_runtime_deinstantiate": (None, [wasm_module_inst_t]),
+    "wasm_runtime_get_module": (wasm_module_t, [wasm_module_inst_t]),
+    "wasm_runtime_is_wasi_mode": (c_bool, [wasm_module_inst_t]),
+    "wasm_runtime_lookup_wasi_start_function": (wasm_function_inst_t, [wasm_module_inst_t]),
+    "wasm_runtime_get_wasi_exit_code": (c_uint32, [wasm_module_inst_t]),
+    "wasm_runtime_lookup_function": (wasm_function_inst_t, [wasm_module_inst_t,c_char_p,c_char_p]),
+    "wasm_func_get_param_count": (c_uint32, [wasm_function_inst_t,wasm_module_inst_t]),
+    "wasm_func_get_result_count": (c_uint32, [wasm_function_inst_t,wasm_module_inst_t]),
+    "wasm_func_get_param_types": (None, [wasm_function_inst_t,wasm_module_inst_t,POINTER(wasm_valkind_t)]),
+    "wasm_func_get_result_types": (None, [wasm_function_inst_t,wasm_module_inst_t,POINTER(wasm_valkind_t)]),
+    "wasm_runtime_create_exec_env": (wasm_exec_env_t, [wasm_module_inst_t,c_uint32]),
+    "wasm_runtime_destroy_exec_env": (None, [wasm_exec_env_t]),
+    "wasm_runtime_get_exec_env_singleton": (wasm_exec_env_t, [wasm_module_inst_t]),
+    "wasm_runtime_start_debug_instance": (c_uint32, [wasm_exec_env_t]),
+    "wasm_runtime_init_thread_env": (c_bool, None),
+    "wasm_runtime_destroy_thread_env": (None, None),
+    "wasm_runtime_thread_env_inited": (c_bool, None),
+    "wasm_runtime_get_module_inst": (wasm_module_inst_t, [wasm_exec_env_t]),
+    "wasm_runtime_set_module_inst": (None, [wasm_exec_env_t,wasm_module_inst_t]),
+    "wasm_runtime_call_wasm": (c_bool, [wasm_exec_env_t,wasm_function_inst_t,c_uint32,POINTER(c_uint32)]),
+    "wasm_runtime_call_wasm_a": (c_bool, [wasm_exec_env_t,wasm_function_inst_t,c_uint32,POINTER(wasm_val_t),c_uint32,POINTER(wasm_val_t)]),
+    "wasm_runtime_call_indirect": (c_bool, [wasm_exec_env_t,c_uint32,c_uint32,POINTER(c_uint32)]),
+    "wasm_application_execute_main": (c_bool, [wasm_module_inst_t,c_int32,POINTER(c_char_p)]),
+    "wasm_application_execute_func": (c_bool, [wasm_module_inst_t,c_char_p,c_int32,POINTER(c_char_p)]),
+    "wasm_runtime_get_exception": (c_char_p, [wasm_module_inst_t]),
+    "wasm_runtime_set_exception": (None, [wasm_module_inst_t,c_char_p]),
+    "wasm_runtime_clear_exception": (None, [wasm_module_inst_t]),
+    "wasm_runtime_terminate": (None, [wasm_module_inst_t]),
+    "wasm_runtime_set_custom_data": (None, [wasm_module_inst_t,c_void_p]),
+    "wasm_runtime_get_custom_data": (c_void_p, [wasm_module_inst_t]),
+    "wasm_runtime_module_malloc": (c_uint32, [wasm_module_inst_t,c_uint32,POINTER(c_void_p)]),
+    "wasm_runtime_module_free": (None, [wasm_module_inst_t,c_uint32]),
+    "wasm_runtime_module_dup_data": (c_uint32, [wasm_module_inst_t,c_char_p,c_uint32]),
+    "wasm_runtime_validate_app_addr": (c_bool, [wasm_module_inst_t,c_uint32,c_uint32]),
+    "wasm_runtime_validate_app_str_addr": (c_bool, [wasm_module_inst_t,c_uint32]),
+    "wasm_runtime_validate_native_addr": (c_bool, [wasm_module_inst_t,c_void_p,c_uint32]),
+    "wasm_runtime_addr_app_to_native": (c_void_p, [wasm_module_inst_t,c_uint32]),
+    "wasm_runtime_addr_native_to_app": (c_uint32, [wasm_module_inst_t,c_void_p]),
+    "wasm_runtime_get_app_addr_range": (c_bool, [wasm_module_inst_t,c_uint32,POINTER(c_uint32),POINTER(c_uint32)]),
+    "wasm_runtime_get_native_addr_range": (c_bool, [wasm_module_inst_t,POINTER(c_uint8),POINTER(POINTER(c_uint8)),POINTER(POINTER(c_uint8))]),
+    "wasm_runtime_register_natives": (c_bool, [c_char_p,POINTER(NativeSymbol),c_uint32]),
+    "wasm_runtime_register_natives_raw": (c_bool, [c_char_p,POINTER(NativeSymbol),c_uint32]),
+    "wasm_runtime_unregister_natives": (c_bool, [c_char_p,POINTER(NativeSymbol)]),
+    "wasm_runtime_get_function_attachment": (c_void_p, [wasm_exec_env_t]),
+    "wasm_runtime_set_user_data": (None, [wasm_exec_env_t,c_void_p]),
+    "wasm_runtime_get_user_data": (c_void_p, [wasm_exec_env_t]),
+    "wasm_runtime_dump_mem_consumption": (None, [wasm_exec_env_t]),
+    "wasm_runtime_dump_perf_profiling": (None, [wasm_module_inst_t]),
+    "wasm_runtime_set_max_thread_num": (None, [c_uint32]),
+    "wasm_runtime_spawn_exec_env": (wasm_exec_env_t, [wasm_exec_env_t]),
+    "wasm_runtime_destroy_spawned_exec_env": (None, [wasm_exec_env_t]),
+    "wasm_runtime_spawn_thread": (c_int32, [wasm_exec_env_t,POINTER(wasm_thread_t),wasm_thread_callback_t,c_void_p]),
+    "wasm_runtime_join_thread": (c_int32, [wasm_thread_t,POINTER(c_void_p)]),
+    "wasm_externref_obj2ref": (c_bool, [wasm_module_inst_t,c_void_p,POINTER(c_uint32)]),
+    "wasm_externref_ref2obj": (c_bool, [c_uint32,POINTER(c_void_p)]),
+    "wasm_externref_retain": (c_bool, [c_uint32]),
+    "wasm_runtime_dump_call_stack": (None, [wasm_exec_env_t]),
+    "wasm_runtime_get_call_stack_buf_size": (c_uint32, [wasm_exec_env_t]),
+    "wasm_runtime_dump_call_stack_to_buf": (c_uint32, [wasm_exec_env_t,c_char_p,c_uint32]),
+    "wasm_runtime_get_custom_section": (POINTER(c_uint8), [wasm_module_t,c_char_p,POINTER(c_uint32)]),
+    "wasm_runtime_get_version": (None, [POINTER(c_uint32),POINTER(c_uint32),POINTER(c_uint32)]),
+    "wasm_runtime_is_import_func_linked": (c_bool, [c_char_p,c_char_p]),
+    "wasm_runtime_is_import_global_linked": (c_bool, [c_char_p,c_char_p]),
+}
+
+_HOLD_GIL = frozenset(
+    [
+        "wasm_runtime_get_running_mode",
+        "wasm_func_get_param_count",
+        "wasm_func_get_result_count",
+        "wasm_runtime_get_module_inst",
+        "wasm_runtime_get_exception",
+        "wasm_runtime_clear_exception",
+        "wasm_runtime_get_custom_data",
+        "wasm_runtime_validate_app_addr",
+        "wasm_runtime_validate_app_str_addr",
+        "wasm_runtime_validate_native_addr",
+        "wasm_runtime_addr_app_to_native",
+        "wasm_runtime_addr_native_to_app",
+        "wasm_runtime_get_app_addr_range",
+        "wasm_runtime_get_native_addr_range",
+        "wasm_runtime_get_function_attachment",
+        "wasm_runtime_get_user_data",
+    ]
+)
+
+# foreign functions are not in globals() until they are touched
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += list(_PROTOTYPES)
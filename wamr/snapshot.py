@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+State of an instance, to roll it back between requests or after a trap.
+
+A Snapshot copies exported memories into one buffer and mutable globals
+into an array of wasm_val_t. Only the used prefix of a memory is kept, up to
+its last byte which isn't zero. Restoring is a memmove and a memset per
+memory and a wasm_global_set() per global.
+
+wasm_c_api.h only reaches exports. A memory or a global which isn't exported
+is neither saved nor restored.
+"""
+
+import ctypes as c
+
+from . import ffi
+
+WASM_PAGE_SIZE = 65536
+
+_ZERO_PAGE = bytes(WASM_PAGE_SIZE)
+
+
+def _mapping(memory):
+    base = c.cast(ffi.wasm_memory_data(memory), c.c_void_p).value
+    return base, ffi.wasm_memory_data_size(memory)
+
+
+def _used(view):
+    # up to the last byte which isn't zero. Pages are scanned from the end, a
+    # page at a time, instead of copying the whole memory
+    end = len(view)
+    while end:
+        start = max(end - WASM_PAGE_SIZE, 0)
+        page = bytes(view[start:end])
+        if page != _ZERO_PAGE[: end - start]:
+            return start + len(page.rstrip(b"\0"))
+        end = start
+    return 0
+
+
+class Snapshot:
+    """
+    Exported memories and mutable globals of an oop.Instance as they are now.
+    restore() writes them back into the instance, or into another instance
+    of the same module. A memory with fewer pages than the saved one is
+    grown first, a RuntimeError is raised if it can't grow
+    """
+
+    def __init__(self, instance):
+        store = instance.store
+        exports = instance.module.exports
+
+        # (name, offset in the buffer, length, pages) of memories
+        self._memories = []
+        offset = 0
+        for name in exports.names(ffi.WASM_EXTERN_MEMORY):
+            memory = instance.export(store, name)
+            length = _used(memory.view())
+            self._memories.append((name, offset, length, memory.pages))
+            offset += length
+
+        # one copy of each prefix
+        self.buffer = (c.c_ubyte * offset)()
+        buffer = c.addressof(self.buffer)
+        for name, begin, length, _ in self._memories:
+            if length:
+                base = _mapping(instance.export(store, name).memory)[0]
+                c.memmove(buffer + begin, base, length)
+
+        self._globals = [
+            name
+            for name in exports.names(ffi.WASM_EXTERN_GLOBAL)
+            # (kind, mutable)
+            if exports[name].type[1]
+        ]
+        self.values = (ffi.wasm_val_t * len(self._globals))()
+        for name, value in zip(self._globals, self.values):
+            ffi.wasm_global_get(instance.export(store, name).pointer, value)
+
+    @property
+    def nbytes(self):
+        return c.sizeof(self.buffer) + c.sizeof(self.values)
+
+    def restore(self, instance):
+        store = instance.store
+        buffer = c.addressof(self.buffer)
+        for name, offset, length, pages in self._memories:
+            memory = instance.export(store, name)
+            if memory.pages < pages:
+                # another instance, whose memory hasn't grown like this one
+                memory.grow(pages - memory.pages)
+                if memory.pages < pages:
+                    raise RuntimeError(
+                        f"memory {name!r} can't grow to {pages} pages of the snapshot"
+                    )
+            base, size = _mapping(memory.memory)
+            if base is None:
+                continue
+
+            c.memmove(base, buffer + offset, length)
+            # zeros of the snapshot, and pages grown since
+            c.memset(base + length, 0, size - length)
+
+        for name, value in zip(self._globals, self.values):
+            ffi.wasm_global_set(instance.export(store, name).pointer, value)
+
+    def __repr__(self):
+        memories = {name: length for name, _, length, _ in self._memories}
+        return f"Snapshot(memories={memories}, globals={self._globals})"
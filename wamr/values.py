@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python3
+#
+# Copyright (C) 2019 Intel Corporation.  All rights reserved.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+
+"""
+Packs and unpacks arrays of wasm_val_t with NumPy, one vectorized step
+instead of a wasm_xxx_val() per value. call_many() calls a function over
+columns of arguments that way.
+
+WASM_VAL_DTYPE has the exact layout of ffi.wasm_val_t, `kind` and an 8-byte
+union `of` which is `i32`, `i64`, `f32`, `f64` or `ref` at the same offset.
+"""
+
+import ctypes as c
+
+import numpy
+
+from . import call
+from . import ffi
+from .call import FIELDS
+
+WASM_VAL_DTYPE = numpy.dtype(
+    {
+        "names": ["kind", "i32", "i64", "f32", "f64", "ref"],
+        "formats": ["u1", "i4", "i8", "f4", "f8", "uintp"],
+        "offsets": [ffi.wasm_val_t.kind.offset] + [ffi.wasm_val_t.of.offset] * 5,
+        "itemsize": c.sizeof(ffi.wasm_val_t),
+    }
+)
+
+# dtype of values -> kind, when kinds are not given
+KINDS = {
+    numpy.dtype("int32"): ffi.WASM_I32,
+    numpy.dtype("int64"): ffi.WASM_I64,
+    numpy.dtype("float32"): ffi.WASM_F32,
+    numpy.dtype("float64"): ffi.WASM_F64,
+}
+
+
+def as_ndarray(vals):
+    """
+    A structured array of WASM_VAL_DTYPE which aliases *vals*, a C array of
+    wasm_val_t, a wasm_val_vec_t or a POINTER(wasm_val_vec_t). Nothing is
+    copied
+    """
+    # pylint: disable=protected-access
+    if isinstance(vals, c._Pointer):
+        vals = ffi.dereference(vals)
+
+    if isinstance(vals, ffi.wasm_val_vec_t):
+        if not vals.num_elems:
+            return numpy.zeros(0, dtype=WASM_VAL_DTYPE)
+
+        vals = (ffi.wasm_val_t * vals.num_elems).from_address(
+            c.addressof(vals.data.contents)
+        )
+
+    return numpy.frombuffer(vals, dtype=WASM_VAL_DTYPE)
+
+
+def pack(values, kinds=None, out=None):
+    """
+    Packs *values*, a NumPy array or a sequence, into a C array of wasm_val_t.
+
+    *kinds* is a kind for all values, or a kind per value. Without *kinds*,
+    *values* has to be an array of int32, int64, float32 or float64. *out* is
+    a C array of wasm_val_t to reuse, it is allocated if None
+    """
+    if kinds is None:
+        values = numpy.asarray(values)
+        if values.dtype not in KINDS:
+            raise RuntimeError(f"can't infer kinds from {values.dtype}, need kinds")
+
+        kinds = KINDS[values.dtype]
+
+    count = len(values)
+    if out is None:
+        out = (ffi.wasm_val_t * count)()
+    elif len(out) < count:
+        raise RuntimeError(f"{len(out)} wasm_val_t are not enough for {count} values")
+
+    vals = as_ndarray(out)[:count]
+    kinds = numpy.asarray(kinds, dtype="u1")
+    vals["kind"] = kinds
+
+    if not kinds.ndim:
+        # all in one kind
+        field = FIELDS[int(kinds)]
+        vals[field] = numpy.asarray(values, dtype=WASM_VAL_DTYPE[field])
+        return out
+
+    if len(kinds) != count:
+        raise RuntimeError(f"{len(kinds)} kinds for {count} values")
+
+    # the object array keeps python ints and floats as they are, so an i64
+    # doesn't lose precision by going through float64
+    values = numpy.asarray(values, dtype=object)
+    for kind in numpy.unique(kinds):
+        field = FIELDS[int(kind)]
+        mask = kinds == kind
+        vals[field][mask] = values[mask].astype(WASM_VAL_DTYPE[field])
+
+    return out
+
+
+def unpack(vals):
+    """
+    Values of *vals*, see as_ndarray(). If all of them are in one kind, it is
+    an array of that type, like int32. Otherwise, an object array of python
+    ints and floats. References are their addresses
+    """
+    vals = as_ndarray(vals)
+    kinds = numpy.unique(vals["kind"])
+
+    if 1 == len(kinds):
+        return vals[FIELDS[int(kinds[0])]].copy()
+
+    values = numpy.empty(len(vals), dtype=object)
+    for kind in kinds:
+        field = FIELDS[int(kind)]
+        mask = vals["kind"] == kind
+        values[mask] = vals[field][mask].tolist()
+
+    return values
+
+
+# moved to ffi, wamr.call needs it without NumPy
+borrow_val_vec = ffi.borrow_val_vec
+
+
+def _borrowing_vec(count):
+    # a vector which is pointed at rows of a table later, `data` as a c_void_p
+    vec = ffi.wasm_val_vec_t()
+    vec.size = count
+    vec.num_elems = count
+    vec.size_of_elem = c.sizeof(ffi.wasm_val_t)
+    data = c.c_void_p.from_buffer(vec, ffi.wasm_val_vec_t.data.offset)
+    return vec, data
+
+
+def call_many(func, args):
+    """
+    Calls *func*, a POINTER(wasm_func_t), once per row of *args*. *args* is a
+    sequence of columns, a 1-D array per param, or a 2-D array with a column
+    per param. Columns are cast to the types of params.
+
+    All arguments are packed into one table of wasm_val_t before the first
+    call and results are unpacked from another table after the last one. A
+    call only moves the `data` of two vectors to the next rows.
+
+    Returns an array with one result, a tuple of arrays with more and None
+    without results. A trap raises wamr.call.Trap
+    """
+    # pylint: disable=protected-access
+    param_kinds, result_kinds = call.signature(func)
+
+    if isinstance(args, numpy.ndarray) and 2 == args.ndim:
+        args = args.T
+    if len(args) != len(param_kinds):
+        raise RuntimeError(f"{len(args)} columns for {len(param_kinds)} params")
+
+    columns = [numpy.asarray(column) for column in args]
+    count = len(columns[0]) if columns else 0
+    if any(len(column) != count for column in columns):
+        raise RuntimeError("columns are in different lengths")
+
+    # a row of a table is what a call takes, at least one value to have an
+    # address when there is none
+    params = numpy.zeros((count, max(len(param_kinds), 1)), dtype=WASM_VAL_DTYPE)
+    results = numpy.zeros((count, max(len(result_kinds), 1)), dtype=WASM_VAL_DTYPE)
+    for table, kinds in ((params, param_kinds), (results, result_kinds)):
+        for i, kind in enumerate(kinds):
+            table["kind"][:, i] = kind
+
+    for i, (kind, column) in enumerate(zip(param_kinds, columns)):
+        field = FIELDS[kind]
+        params[field][:, i] = column.astype(WASM_VAL_DTYPE[field], copy=False)
+
+    params_vec, params_data = _borrowing_vec(len(param_kinds))
+    results_vec, results_data = _borrowing_vec(len(result_kinds))
+    params_ptr = c.pointer(params_vec)
+    results_ptr = c.pointer(results_vec)
+    wasm_func_call = call._func_call()
+
+    params_base = params.ctypes.data
+    params_stride = params.strides[0]
+    results_base = results.ctypes.data
+    results_stride = results.strides[0]
+    for i in range(count):
+        params_data.value = params_base + i * params_stride
+        results_data.value = results_base + i * results_stride
+        trap = wasm_func_call(func, params_ptr, results_ptr)
+        if trap is not None:
+            raise call.Trap(f"{call._trap_message(trap)}, at row {i}")
+
+    columns = [
+        results[FIELDS[kind]][:, i].copy() for i, kind in enumerate(result_kinds)
+    ]
+    if not columns:
+        return None
+
+    return columns[0] if 1 == len(columns) else tuple(columns)